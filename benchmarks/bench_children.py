@@ -0,0 +1,111 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark the children operations of an object with many children.
+
+An object is filled with children inserted one at a time before a marker,
+as a pattern expanding its items does, then children are moved and
+removed. The legacy insertion, which rebuilds the children by scanning
+them, is measured for comparison.
+
+Usage: python benchmarks/bench_children.py [n_children]
+
+"""
+import sys
+import timeit
+
+from enaml.core.object import Object
+
+
+def legacy_insert_children(self, before, insert):
+    """ The insertion implementation scanning all the children.
+
+    """
+    insert_list = list(insert)
+    insert_set = set(insert_list)
+    if isinstance(before, int):
+        try:
+            before = self._children[before]
+        except IndexError:
+            before = None
+
+    new = []
+    added = False
+    for child in self._children:
+        if child in insert_set:
+            insert_set.remove(child)
+            continue
+        if child is before:
+            new.extend(insert_list)
+            added = True
+        new.append(child)
+    if not added:
+        new.extend(insert_list)
+
+    for child in insert_list:
+        old_parent = child._parent
+        if old_parent is not self:
+            child._parent = self
+            child.parent_changed(old_parent, self)
+            if old_parent is not None:
+                old_parent.child_removed(child)
+
+    self._children = new
+    for child in insert_list:
+        if child in insert_set:
+            self.child_added(child)
+        else:
+            self.child_moved(child)
+
+
+class LegacyObject(Object):
+
+    insert_children = legacy_insert_children
+
+
+def run(cls, count):
+    """ Time the children operations and return the elapsed times.
+
+    """
+    parent = cls()
+    marker = Object(parent=parent)
+    children = [Object() for i in range(count)]
+
+    def insert():
+        for child in children:
+            parent.insert_children(marker, [child])
+
+    def move():
+        for child in children[:count // 10]:
+            parent.insert_children(marker, [child])
+
+    def remove():
+        for child in children[::2]:
+            child.set_parent(None)
+
+    def append():
+        parent.insert_children(None, children[::2])
+
+    return [timeit.timeit(f, number=1) for f in (insert, move, remove,
+                                                 append)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    legacy = run(LegacyObject, count)
+    current = run(Object, count)
+
+    print('%d children' % count)
+    names = ('insert one at a time', 'move 10%', 'remove 50%',
+             'append 50% at once')
+    for name, old, new in zip(names, legacy, current):
+        print('%-21s legacy: %.3fs  current: %.3fs' % (name, old, new))
+
+
+if __name__ == '__main__':
+    main()
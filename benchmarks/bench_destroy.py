@@ -0,0 +1,114 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark destroying a large window.
+
+A window showing many rows of widgets is destroyed, and the time spent
+in the destroy call and in processing the deferred deletions is measured.
+The legacy destructor, which deparents and deletes every widget of the
+window one at a time, is measured for comparison.
+
+Usage: python benchmarks/bench_destroy.py [n_rows] [n_repeats]
+
+"""
+import sys
+import timeit
+
+from enaml.compat import exec_
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+from enaml.qt.qt_application import QtApplication
+from enaml.qt.qt_toolkit_object import QtToolkitObject
+from enaml.qt.QtCore import QCoreApplication, QEvent
+from enaml.widgets.toolkit_object import ProxyToolkitObject
+
+
+SOURCE =\
+"""from enaml.core.api import Looper
+from enaml.widgets.api import CheckBox, Container, Field, GroupBox, Label, Window
+
+enamldef Main(Window):
+    attr count
+    Container:
+        Looper:
+            iterable = range(count)
+            GroupBox:
+                title = 'Row %d' % loop_item
+                Label:
+                    text = 'Name'
+                Field:
+                    text = str(loop_item)
+                CheckBox:
+                    text = 'Enabled'
+
+"""
+
+
+def legacy_destroy(self):
+    """ The destructor deparenting every widget.
+
+    """
+    widget = self.widget
+    if widget is not None:
+        widget.setParent(None)
+        widget.deleteLater()
+        del self.widget
+    ProxyToolkitObject.destroy(self)
+
+
+def build(count):
+    """ Build and show the window.
+
+    """
+    ast = parse(SOURCE, 'bench_destroy')
+    code = EnamlCompiler.compile(ast, 'bench_destroy')
+    namespace = {}
+    exec_(code, namespace)
+    window = namespace['Main'](count=count)
+    window.show()
+    QCoreApplication.processEvents()
+    return window
+
+
+def run(count, repeats):
+    """ Time the destruction and return the best elapsed time.
+
+    """
+    best = None
+    for i in range(repeats):
+        window = build(count)
+
+        def destroy():
+            window.destroy()
+            QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+        elapsed = timeit.timeit(destroy, number=1)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    app = QtApplication()
+    destroy = QtToolkitObject.destroy
+    try:
+        QtToolkitObject.destroy = legacy_destroy
+        legacy = run(count, repeats)
+    finally:
+        QtToolkitObject.destroy = destroy
+    current = run(count, repeats)
+
+    print('%d rows, %d widgets' % (count, 4 * count + 2))
+    print('legacy:  %.1fms' % (1000 * legacy))
+    print('bulk:    %.1fms' % (1000 * current))
+    app.stop()
+
+
+if __name__ == '__main__':
+    main()
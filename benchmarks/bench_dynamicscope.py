@@ -0,0 +1,93 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark the dynamic name resolution of the DynamicScope.
+
+A name defined on the root of a chain of objects is repeatedly looked up
+from a scope owned by the leaf of the chain. Objects declaring the
+`_d_scope_cache` slot use the name resolution cache while plain objects
+walk the parent chain on each lookup.
+
+Usage: python benchmarks/bench_dynamicscope.py [n_lookups]
+
+"""
+import sys
+import timeit
+
+from atom.datastructures.api import sortedmap
+
+from enaml.core.dynamicscope import DynamicScope
+
+
+class Node(object):
+
+    __slots__ = ('_parent',)
+
+    def __init__(self, parent=None):
+        self._parent = parent
+
+
+class CachedNode(object):
+
+    __slots__ = ('_parent', '_d_scope_cache')
+
+    def __init__(self, parent=None):
+        self._parent = parent
+        self._d_scope_cache = None
+
+
+class Root(Node):
+
+    __slots__ = ()
+
+    value = 1
+
+
+class CachedRoot(CachedNode):
+
+    __slots__ = ()
+
+    value = 1
+
+
+def build(root_cls, node_cls, depth):
+    """ Build a chain of objects and return the leaf.
+
+    """
+    node = root_cls()
+    for _ in range(depth):
+        node = node_cls(node)
+    return node
+
+
+def run(owner, count):
+    """ Time the lookups of the root name from the owner scope.
+
+    """
+    f_locals = sortedmap()
+    f_globals = {}
+    f_builtins = {}
+
+    def lookup():
+        scope = DynamicScope(owner, f_locals, f_globals, f_builtins)
+        return scope['value']
+
+    return timeit.timeit(lookup, number=count)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print('%d lookups' % count)
+    print('depth   walk (s)   cached (s)')
+    for depth in (1, 5, 10, 20, 50):
+        walk = run(build(Root, Node, depth), count)
+        cached = run(build(CachedRoot, CachedNode, depth), count)
+        print('%5d   %8.3f   %10.3f' % (depth, walk, cached))
+
+
+if __name__ == '__main__':
+    main()
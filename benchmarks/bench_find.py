@@ -0,0 +1,106 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark looking up objects by name in a large tree.
+
+A tree of objects is built with one named object out of ten, and named
+objects are looked up by exact name and by regex, with and without the
+name index of the tree. The last object of every group of the tree has
+a common name, which is looked up with find from the root and from
+several groups. The time to build a wide tree of objects with a common
+name under an indexed root is also measured.
+
+Usage: python benchmarks/bench_find.py [n_objects] [n_lookups]
+
+"""
+import sys
+import timeit
+
+from enaml.core.object import Object
+
+
+def build(count):
+    """ Build a tree of count objects, grouped by a hundred.
+
+    """
+    root = Object()
+    group = None
+    for i in range(count - 1):
+        if i % 100 == 0:
+            if group is not None:
+                Object(parent=group, name=u'label')
+            group = Object(parent=root)
+            continue
+        name = u'item-%d' % i if i % 10 == 0 else u''
+        Object(parent=group, name=name)
+    Object(parent=group, name=u'label')
+    return root
+
+
+def run(root, count, lookups):
+    """ Time the lookups and return the elapsed times.
+
+    """
+    names = [u'item-%d' % (i * 10) for i in range(1, count // 10)]
+    names = names[::max(1, len(names) // lookups)][:lookups]
+
+    def find():
+        for name in names:
+            root.find(name)
+
+    def find_all():
+        root.find_all(u'item-1.*', regex=True)
+
+    groups = root.children[::max(1, len(root.children) // lookups)]
+
+    def find_common():
+        root.find(u'label')
+
+    def find_common_in_groups():
+        for group in groups:
+            group.find(u'label')
+
+    return (timeit.timeit(find, number=1) / len(names),
+            timeit.timeit(find_all, number=1),
+            timeit.timeit(find_common, number=1),
+            timeit.timeit(find_common_in_groups, number=1) / len(groups))
+
+
+def build_indexed(count):
+    """ Time adding count objects with the same name to an indexed root.
+
+    """
+    root = Object()
+    root.enable_name_index()
+
+    def add():
+        for i in range(count):
+            Object(parent=root, name=u'label')
+
+    return timeit.timeit(add, number=1)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    root = build(count)
+    traversal = run(root, count, lookups)
+    root.enable_name_index()
+    indexed = run(root, count, lookups)
+
+    print('%d objects, %d lookups' % (count, lookups))
+    for title, times in (('traversal:', traversal), ('indexed:', indexed)):
+        print('%-10s find %.3fms, regex find_all %.3fms, common find '
+              'from root %.3fms, from a group %.3fms'
+              % ((title,) + tuple(1000 * t for t in times)))
+    print('indexed build of %d same named children: %.3fms'
+          % (count // 5, 1000 * build_indexed(count // 5)))
+
+
+if __name__ == '__main__':
+    main()
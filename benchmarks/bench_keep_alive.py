@@ -0,0 +1,97 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark toggling a panel shown by a Conditional.
+
+A window shows a panel of fields under a Conditional, and the condition
+is toggled repeatedly. The legacy behavior, which destroys the panel and
+creates it again, is compared to keeping the panel alive. The number of
+objects kept alive while the panel is hidden is reported as well.
+
+Usage: python benchmarks/bench_keep_alive.py [n_fields] [n_toggles]
+
+"""
+import sys
+import timeit
+
+from enaml.compat import exec_
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+from enaml.qt.qt_application import QtApplication
+
+
+SOURCE =\
+"""from enaml.core.api import Conditional, Looper
+from enaml.widgets.api import Container, Field, Label, Window
+
+enamldef Main(Window):
+    attr count
+    attr keep
+    attr shown = True
+    Container:
+        Conditional:
+            keep_alive = keep
+            condition << shown
+            Container:
+                Looper:
+                    iterable = range(count)
+                    Label:
+                        text = 'Field %d' % loop_item
+                    Field:
+                        text = str(loop_item)
+
+"""
+
+
+def build(count, keep):
+    """ Build and show the window.
+
+    """
+    ast = parse(SOURCE, 'bench_keep_alive')
+    code = EnamlCompiler.compile(ast, 'bench_keep_alive')
+    namespace = {}
+    exec_(code, namespace)
+    window = namespace['Main'](count=count, keep=keep)
+    window.show()
+    return window
+
+
+def run(count, toggles, keep):
+    """ Time the toggles and return the elapsed time and kept objects.
+
+    """
+    window = build(count, keep)
+    conditional = window.children[0].children[-1]
+
+    def toggle():
+        for i in range(toggles):
+            window.shown = not window.shown
+
+    elapsed = timeit.timeit(toggle, number=1)
+    window.shown = False
+    kept = conditional.kept_count()
+    window.close()
+    return elapsed, kept
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    toggles = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    app = QtApplication()
+    legacy, _ = run(count, toggles, False)
+    current, kept = run(count, toggles, True)
+
+    print('%d fields, %d toggles' % (count, toggles))
+    print('destroy:    %.3fs (%.1f toggles/s)' % (legacy, toggles / legacy))
+    print('keep alive: %.3fs (%.1f toggles/s), %d objects kept while hidden'
+          % (current, toggles / current, kept))
+    app.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark the relayout of a large grid form.
+
+A window shows a container laying out rows of labels and fields with a
+grid helper. The container is relaid out after a change which leaves
+the grid unchanged, the hug width of a button outside of the grid, and
+after a row is added to the grid, which creates a new grid helper. The
+time of the relayouts is measured. The legacy implementation, which
+generates the constraints of the helpers and their variables again on
+each relayout, is measured for comparison.
+
+Usage: python benchmarks/bench_layout_helpers.py [n_rows] [n_changes]
+
+"""
+import sys
+import timeit
+
+from enaml.compat import exec_
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+from enaml.layout.grid_helper import GridHelper
+from enaml.layout.layout_helpers import ConstraintCache, expand_constraints
+from enaml.qt.qt_application import QtApplication
+from enaml.qt.qt_container import RelayoutScheduler
+from enaml.qt.QtCore import QCoreApplication
+
+
+SOURCE =\
+"""from enaml.core.api import Looper
+from enaml.layout.api import grid, hbox, vbox
+from enaml.widgets.api import Container, Field, Label, PushButton, Window
+
+enamldef Main(Window):
+    attr count
+    alias container
+    alias button
+    Container: container:
+        constraints << [
+            vbox(button, grid(*zip(labels, fields))),
+        ] if (labels, fields) else []
+        attr labels = []
+        attr fields = []
+        PushButton: button:
+            text = 'Button'
+        Looper:
+            iterable << range(count)
+            Label:
+                initialized :: container.labels = container.labels + [self]
+                text = 'Row %d' % loop_item
+            Field:
+                initialized :: container.fields = container.fields + [self]
+                text = str(loop_item)
+
+"""
+
+
+def legacy_expand(self, component, constraints):
+    """ The expansion generating the constraints of every helper.
+
+    """
+    return expand_constraints(component, constraints)
+
+
+def legacy_grid_constraints(constraints):
+    """ Wrap the grid constraints so that they use new variables.
+
+    """
+    def wrapper(self, component):
+        del self._row_vars
+        del self._col_vars
+        return constraints(self, component)
+    return wrapper
+
+
+def run(count, changes):
+    """ Time the relayouts and return the elapsed times.
+
+    """
+    ast = parse(SOURCE, 'bench_layout_helpers')
+    code = EnamlCompiler.compile(ast, 'bench_layout_helpers')
+    namespace = {}
+    exec_(code, namespace)
+    window = namespace['Main'](count=count)
+    window.show()
+    QCoreApplication.processEvents()
+    button = window.button
+    scheduler = RelayoutScheduler.for_widget(window.container.proxy.widget)
+
+    def hug():
+        for i in range(changes):
+            button.hug_width = 'weak' if i % 2 else 'medium'
+            scheduler.run()
+
+    def add():
+        for i in range(changes):
+            window.count += 1
+            scheduler.run()
+
+    elapsed = [timeit.timeit(f, number=1) for f in (hug, add)]
+    window.close()
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    changes = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    app = QtApplication()
+    # The first window shown is slower, so a warm up run is discarded.
+    run(count, changes)
+    expand = ConstraintCache.expand
+    constraints = GridHelper.constraints
+    try:
+        ConstraintCache.expand = legacy_expand
+        GridHelper.constraints = legacy_grid_constraints(constraints)
+        legacy = run(count, changes)
+    finally:
+        ConstraintCache.expand = expand
+        GridHelper.constraints = constraints
+    current = run(count, changes)
+
+    print('%d rows, %d changes' % (count, changes))
+    for name, old, new in zip(('unchanged grid', 'add a row'),
+                              legacy, current):
+        print('%-15s legacy: %.1fms  current: %.1fms'
+              % (name, 1000 * old / changes, 1000 * new / changes))
+    app.stop()
+
+
+if __name__ == '__main__':
+    main()
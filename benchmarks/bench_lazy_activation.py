@@ -0,0 +1,113 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark the time to show the first window of a tabbed application.
+
+A window shows a notebook of pages holding forms of fields, and a stack
+of items holding the same forms. The time to create, show and process
+the pending events of the window is measured with and without the lazy
+activation, and with the lazy content of the pages and items, which
+builds the forms only when they are selected.
+
+Usage: python benchmarks/bench_lazy_activation.py [n_pages] [n_fields]
+
+"""
+import sys
+import timeit
+
+from enaml.compat import exec_
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+from enaml.qt.qt_application import QtApplication
+from enaml.qt.QtCore import QCoreApplication
+
+
+SOURCE =\
+"""from enaml.core.api import Looper
+from enaml.widgets.api import (Container, Field, Form, Label, Notebook, Page,
+                               Stack, StackItem, Window)
+
+enamldef Fields(Form):
+    attr count
+    Looper:
+        iterable = range(count)
+        Label:
+            text = 'Field %d' % loop_item
+        Field:
+            text = str(loop_item)
+
+enamldef Main(Window):
+    attr n_pages
+    attr n_fields
+    attr lazy_content = False
+    Container:
+        Notebook:
+            tab_style = 'preferences'
+            Looper:
+                iterable = range(n_pages)
+                Page:
+                    title = 'Page %d' % loop_item
+                    lazy = lazy_content
+                    Container:
+                        Fields:
+                            count = n_fields
+        Stack:
+            Looper:
+                iterable = range(n_pages)
+                StackItem:
+                    lazy = lazy_content
+                    Container:
+                        Fields:
+                            count = n_fields
+
+"""
+
+
+def run(pages, fields, lazy, lazy_content=False):
+    """ Time the creation and display of the window.
+
+    """
+    ast = parse(SOURCE, 'bench_lazy_activation')
+    code = EnamlCompiler.compile(ast, 'bench_lazy_activation')
+    namespace = {}
+    exec_(code, namespace)
+    windows = []
+
+    def show():
+        window = namespace['Main'](n_pages=pages, n_fields=fields,
+                                   lazy_activation=lazy,
+                                   lazy_content=lazy_content)
+        window.show()
+        QCoreApplication.processEvents()
+        windows.append(window)
+
+    elapsed = timeit.timeit(show, number=1)
+    objects = list(windows[0].traverse())
+    widgets = sum(1 for obj in objects
+                  if getattr(obj, 'proxy_is_active', False))
+    windows[0].close()
+    return elapsed, widgets, len(objects)
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    fields = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    app = QtApplication()
+    results = [('eager', run(pages, fields, False)),
+               ('lazy', run(pages, fields, True)),
+               ('lazy content', run(pages, fields, True, True))]
+
+    print('%d pages of %d fields' % (pages, fields))
+    for name, (elapsed, widgets, objects) in results:
+        print('%-13s %.3fs, %d active widgets, %d objects'
+              % (name + ':', elapsed, widgets, objects))
+    app.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark appending rows to a large Looper.
+
+A Looper is bound to a list of rows and rows are appended one at a time,
+either by reassigning the list or by appending to it in place. The legacy
+refresh, which walks the whole iterable and reinserts every child in the
+parent, is measured for comparison.
+
+Usage: python benchmarks/bench_looper.py [n_rows] [n_appends]
+
+"""
+import sys
+import timeit
+
+from atom.api import Atom, ContainerList
+from atom.datastructures.api import sortedmap
+
+from enaml.compat import exec_
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.looper import Looper, recursive_expand
+from enaml.core.parser import parse
+
+
+SOURCE =\
+"""from enaml.core.api import Declarative, Looper
+
+enamldef Item(Declarative):
+    attr value
+
+enamldef Main(Declarative):
+    attr model
+    Looper:
+        iterable << model.rows
+        Item:
+            value = loop_item
+
+"""
+
+
+class Model(Atom):
+
+    rows = ContainerList()
+
+
+#: The iteration data of the legacy refresh, stored by looper.
+_legacy_data = {}
+
+
+def legacy_refresh_items(self):
+    """ The refresh implementation walking the whole iterable.
+
+    """
+    old_items = self.items[:]
+    old_iter_data = _legacy_data.get(self, sortedmap())
+    new_iter_data = sortedmap()
+    new_items = []
+    for loop_index, loop_item in enumerate(self.iterable):
+        iteration = old_iter_data.get(loop_item)
+        if iteration is not None:
+            new_iter_data[loop_item] = iteration
+            new_items.append(iteration)
+            old_items.remove(iteration)
+            continue
+        iteration = self._create_iteration(loop_index, loop_item)
+        new_iter_data[loop_item] = iteration
+        new_items.append(iteration)
+    for iteration in old_items:
+        self._release_iteration(iteration, [])
+    if len(new_items) > 0:
+        expanded = []
+        recursive_expand(sum(new_items, []), expanded)
+        self.parent.insert_children(self, expanded)
+    self.items = new_items
+    _legacy_data[self] = new_iter_data
+
+
+def build(count):
+    """ Build a looper over count rows.
+
+    """
+    ast = parse(SOURCE, 'bench_looper')
+    code = EnamlCompiler.compile(ast, 'bench_looper')
+    namespace = {}
+    exec_(code, namespace)
+    model = Model(rows=list(range(count)))
+    main = namespace['Main'](model=model)
+    main.initialize()
+    return model
+
+
+def run(count, appends, in_place):
+    """ Time the appends and return the elapsed time.
+
+    """
+    model = build(count)
+
+    def append():
+        for i in range(count, count + appends):
+            if in_place:
+                model.rows.append(i)
+            else:
+                model.rows = model.rows + [i]
+
+    return timeit.timeit(append, number=1)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    appends = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    refresh_items = Looper.refresh_items
+    try:
+        Looper.refresh_items = legacy_refresh_items
+        legacy = run(count, appends, False)
+    finally:
+        Looper.refresh_items = refresh_items
+    reassign = run(count, appends, False)
+    in_place = run(count, appends, True)
+
+    print('%d rows, %d appends' % (count, appends))
+    print('legacy:      %.3fs (%.2fms per append)'
+          % (legacy, 1000 * legacy / appends))
+    print('reassigned:  %.3fs (%.2fms per append)'
+          % (reassign, 1000 * reassign / appends))
+    print('in place:    %.3fs (%.2fms per append)'
+          % (in_place, 1000 * in_place / appends))
+
+
+if __name__ == '__main__':
+    main()
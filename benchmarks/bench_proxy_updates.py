@@ -0,0 +1,121 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark the updates of many widgets bound to a model.
+
+A window shows rows of labels whose text, foreground, tool tip and
+enabled state are bound to a model. The model is updated several times
+before the event loop runs, and the time to apply the changes and
+process the pending events is measured with and without the coalesced
+proxy updates, along with the number of proxy setter calls. The width
+of the text changes with the model, so every text change applied to a
+label also updates the layout of the window.
+
+Usage: python benchmarks/bench_proxy_updates.py [n_rows] [n_changes]
+
+"""
+import sys
+import timeit
+
+from atom.api import Atom, Bool, Int
+
+from enaml.compat import exec_
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+from enaml.qt.qt_application import QtApplication
+from enaml.qt.QtCore import QCoreApplication
+
+
+SOURCE =\
+"""from enaml.core.api import Looper
+from enaml.widgets.api import Container, Label, Window
+
+enamldef Main(Window):
+    attr model
+    attr count
+    Container:
+        Looper:
+            iterable = range(count)
+            Label:
+                text << 'Row %d: %s' % (loop_item, 'on' if model.flag else 'off')
+                foreground << 'red' if model.flag else 'blue'
+                tool_tip << 'Updated %d times' % model.counter
+                enabled << not model.flag
+
+"""
+
+
+class Model(Atom):
+
+    counter = Int()
+
+    flag = Bool()
+
+
+def run(count, changes, coalesce):
+    """ Time the updates and return the elapsed time and setter calls.
+
+    """
+    ast = parse(SOURCE, 'bench_proxy_updates')
+    code = EnamlCompiler.compile(ast, 'bench_proxy_updates')
+    namespace = {}
+    exec_(code, namespace)
+    model = Model()
+    window = namespace['Main'](model=model, count=count,
+                               coalesce_updates=coalesce)
+    window.show()
+    QCoreApplication.processEvents()
+
+    calls = [0]
+
+    def counting(setter):
+        def wrapper(self, value):
+            calls[0] += 1
+            setter(self, value)
+        return wrapper
+
+    def update():
+        for i in range(changes):
+            model.counter += 1
+            model.flag = not model.flag
+        QCoreApplication.processEvents()
+
+    # Count the calls of the setters of the bound attributes.
+    setters = []
+    proxy_type = type(window.children[0].widgets()[0].proxy)
+    for name in ('set_text', 'set_foreground', 'set_tool_tip', 'set_enabled'):
+        klass = next(k for k in proxy_type.__mro__ if name in k.__dict__)
+        setters.append((klass, name, klass.__dict__[name]))
+    try:
+        for klass, name, setter in setters:
+            setattr(klass, name, counting(setter))
+        elapsed = timeit.timeit(update, number=1)
+    finally:
+        for klass, name, setter in setters:
+            setattr(klass, name, setter)
+    window.close()
+    return elapsed, calls[0]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    changes = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    app = QtApplication()
+    immediate = run(count, changes, False)
+    coalesced = run(count, changes, True)
+
+    print('%d labels, %d model changes per tick' % (count, changes))
+    for name, (elapsed, calls) in (('immediate', immediate),
+                                   ('coalesced', coalesced)):
+        print('%-10s %.3fs, %d setter calls, %.0f updates/s'
+              % (name + ':', elapsed, calls, count * changes / elapsed))
+    app.stop()
+
+
+if __name__ == '__main__':
+    main()
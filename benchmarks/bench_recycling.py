@@ -0,0 +1,102 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark the recycling of the widgets of a filtered list.
+
+A window shows a Looper over the rows of a model matching a filter, and
+a Conditional footer. The filter is toggled repeatedly between all the
+rows and the even rows, which removes and adds back half of the rows.
+The legacy behavior, which destroys the removed widgets and creates new
+ones, is measured for comparison.
+
+Usage: python benchmarks/bench_recycling.py [n_rows] [n_toggles]
+
+"""
+import sys
+import timeit
+
+from enaml.compat import exec_
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+from enaml.qt.qt_application import QtApplication
+
+
+SOURCE =\
+"""from enaml.core.api import Conditional, Looper
+from enaml.widgets.api import CheckBox, Container, Label, Window
+
+enamldef Row(Container):
+    attr row
+    Label:
+        text << 'Row %d' % row
+    CheckBox:
+        checked << row % 3 == 0
+
+enamldef Main(Window):
+    attr count
+    attr pool
+    attr even_only = False
+    Container:
+        Looper:
+            recycle << parent.parent.pool
+            iterable << [i for i in range(count)
+                         if not even_only or i % 2 == 0]
+            Row:
+                row << loop_item
+        Conditional:
+            recycle << min(parent.parent.pool, 1)
+            condition << not even_only
+            Label:
+                text = 'Showing all the rows'
+
+"""
+
+
+def build(count, pool):
+    """ Build and show the window.
+
+    """
+    ast = parse(SOURCE, 'bench_recycling')
+    code = EnamlCompiler.compile(ast, 'bench_recycling')
+    namespace = {}
+    exec_(code, namespace)
+    window = namespace['Main'](count=count, pool=pool)
+    window.show()
+    return window
+
+
+def run(count, toggles, pool):
+    """ Time the filter toggles and return the elapsed time.
+
+    """
+    window = build(count, pool)
+
+    def toggle():
+        for i in range(toggles):
+            window.even_only = not window.even_only
+
+    elapsed = timeit.timeit(toggle, number=1)
+    window.close()
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    toggles = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    app = QtApplication()
+    legacy = run(count, toggles, 0)
+    current = run(count, toggles, count)
+
+    print('%d rows, %d toggles' % (count, toggles))
+    print('destroy:   %.3fs (%.1f toggles/s)' % (legacy, toggles / legacy))
+    print('recycling: %.3fs (%.1f toggles/s)' % (current, toggles / current))
+    app.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark the relayout of a container with many children.
+
+A window shows a container holding rows of labels and fields. Widgets
+are added to the container one at a time, and the text of labels is
+changed so that their size hint changes, and the time spent in the
+relayouts and geometry updates is measured. The legacy implementation,
+which resets the solver and adds every constraint again on a relayout
+and replaces all the geometry constraints of a widget on a geometry
+update, is measured for comparison.
+
+Usage: python benchmarks/bench_relayout.py [n_rows] [n_changes]
+
+"""
+import sys
+import timeit
+
+import kiwisolver as kiwi
+
+from enaml.compat import exec_
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+from enaml.layout.layout_manager import LayoutManager
+from enaml.qt.qt_application import QtApplication
+from enaml.qt.qt_container import RelayoutScheduler
+from enaml.qt.QtCore import QCoreApplication
+
+
+SOURCE =\
+"""from enaml.core.api import Looper
+from enaml.widgets.api import Container, Field, Label, Window
+
+enamldef Main(Window):
+    attr count
+    alias container
+    Container: container:
+        Looper:
+            iterable = range(count)
+            Label:
+                text = 'Row %d' % loop_item
+            Field:
+                text = str(loop_item)
+
+"""
+
+
+def legacy_update_constraints(self, cns):
+    """ The solver update adding every constraint to a reset solver.
+
+    """
+    del self._edit_stack
+    self._size_cache = {}
+    solver = self._solver
+    solver.reset()
+    d = self._root_item.constrainable()
+    strength = kiwi.strength.medium
+    self._push_edit_vars(((d.width, strength), (d.height, strength)))
+    for cn in cns:
+        solver.addConstraint(cn)
+    return cns
+
+
+def legacy_replace(self, old, new):
+    """ The constraint replacement removing every old constraint.
+
+    """
+    self._size_cache = {}
+    solver = self._solver
+    for cn in old:
+        solver.removeConstraint(cn)
+    for cn in new:
+        solver.addConstraint(cn)
+    return new
+
+
+def run(count, changes):
+    """ Time the relayouts and return the elapsed times.
+
+    """
+    ast = parse(SOURCE, 'bench_relayout')
+    code = EnamlCompiler.compile(ast, 'bench_relayout')
+    namespace = {}
+    exec_(code, namespace)
+    Label = namespace['Label']
+    window = namespace['Main'](count=count)
+    window.show()
+    QCoreApplication.processEvents()
+    container = window.container
+    scheduler = RelayoutScheduler.for_widget(container.proxy.widget)
+    labels = container.widgets()[::2]
+
+    def add():
+        for i in range(changes):
+            Label(container, text='Added %d' % i)
+            # Run the pending relayout instead of waiting for its timer.
+            scheduler.run()
+
+    def update():
+        for label in labels[:changes]:
+            label.text = 'A longer row label'
+
+    elapsed = [timeit.timeit(f, number=1) for f in (add, update)]
+    window.close()
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    changes = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    app = QtApplication()
+    update_constraints = LayoutManager._update_constraints
+    replace = LayoutManager._replace
+    try:
+        LayoutManager._update_constraints = legacy_update_constraints
+        LayoutManager._replace = legacy_replace
+        legacy = run(count, changes)
+    finally:
+        LayoutManager._update_constraints = update_constraints
+        LayoutManager._replace = replace
+    current = run(count, changes)
+
+    print('%d rows, %d changes' % (count, changes))
+    for name, old, new in zip(('add a widget', 'change a size hint'),
+                              legacy, current):
+        print('%-19s legacy: %.1fms  current: %.1fms'
+              % (name, 1000 * old / changes, 1000 * new / changes))
+    app.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark a change invalidating the layout of nested containers.
+
+A window shows nested containers, each one holding rows of labels and
+fields next to the next level of nesting. The padding of every
+container is changed at once, as a theme switch would do, and the time
+to process the pending events is measured along with the number of
+passes, relayouts and solves run. The legacy implementation, in which
+each container runs its relayout from its own timer, in the order of
+the requests, is measured for comparison.
+
+Usage: python benchmarks/bench_relayout_scheduler.py [n_levels] [n_rows]
+
+"""
+import sys
+import timeit
+
+from enaml.compat import exec_
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+from enaml.qt.qt_application import QtApplication
+from enaml.qt.qt_container import RelayoutScheduler
+from enaml.qt.QtCore import QCoreApplication
+
+
+SOURCE =\
+"""from enaml.core.api import Looper
+from enaml.widgets.api import Container, Field, Label, Window
+
+enamldef Level(Container):
+    attr rows
+    Looper:
+        iterable = range(rows)
+        Label:
+            text = 'Row %d' % loop_item
+        Field:
+            text = str(loop_item)
+
+enamldef Main(Window):
+    alias top
+    Level: top:
+        pass
+"""
+
+
+def run(levels, rows, legacy):
+    """ Time the relayouts and return the elapsed time and counters.
+
+    """
+    ast = parse(SOURCE, 'bench_relayout_scheduler')
+    code = EnamlCompiler.compile(ast, 'bench_relayout_scheduler')
+    namespace = {}
+    exec_(code, namespace)
+    window = namespace['Main']()
+    parent = window.top
+    parent.rows = rows
+    containers = [parent]
+    for i in range(levels - 1):
+        parent = namespace['Level'](parent, rows=rows)
+        containers.append(parent)
+    window.show()
+    QCoreApplication.processEvents()
+
+    # The legacy containers each use their own scheduler, which runs
+    # the relayout of a single container from its own timer.
+    schedulers = []
+    for_widget = RelayoutScheduler.for_widget
+
+    def legacy_for_widget(widget):
+        schedulers.append(RelayoutScheduler())
+        return schedulers[-1]
+
+    def update():
+        for container in containers:
+            container.padding = 20
+        QCoreApplication.processEvents()
+
+    try:
+        if legacy:
+            RelayoutScheduler.for_widget = staticmethod(legacy_for_widget)
+        else:
+            schedulers.append(for_widget(window.proxy.widget))
+        elapsed = timeit.timeit(update, number=1)
+    finally:
+        RelayoutScheduler.for_widget = staticmethod(for_widget)
+    counts = [sum(getattr(s, name) for s in schedulers)
+              for name in ('passes', 'relayouts', 'solves')]
+    window.close()
+    return [elapsed] + counts
+
+
+def main():
+    levels = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    app = QtApplication()
+    # The first window shown is slower, so a warm up run is discarded.
+    run(levels, rows, False)
+    legacy = run(levels, rows, True)
+    current = run(levels, rows, False)
+
+    print('%d levels, %d rows per level' % (levels, rows))
+    for name, (elapsed, passes, relayouts, solves) in (('legacy', legacy),
+                                                       ('current', current)):
+        print('%-8s %.1fms, %d passes, %d relayouts, %d solves'
+              % (name + ':', 1000 * elapsed, passes, relayouts, solves))
+    app.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark the frame time of a large form under an interactive resize.
+
+A window shows a form of labels and fields. The window is resized by
+small steps, as when its border is dragged, and the events are
+processed after each step. The mean time of a frame, and of the layout
+manager resizes within it, are measured when the height only changes,
+which leaves the form in place, and when the width changes, which
+stretches the fields but not the labels. The legacy implementation,
+which applies the geometry of every widget on each resize, is measured
+for comparison.
+
+Usage: python benchmarks/bench_resize.py [n_rows] [n_frames]
+
+"""
+import sys
+import timeit
+
+from enaml.compat import exec_
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+from enaml.layout.layout_manager import LayoutManager
+from enaml.qt.qt_application import QtApplication
+from enaml.qt.qt_container import QtLayoutItem
+from enaml.qt.QtCore import QCoreApplication
+
+
+SOURCE =\
+"""from enaml.core.api import Looper
+from enaml.layout.api import spacer, vbox
+from enaml.widgets.api import Container, Field, Form, Label, Window
+
+enamldef Main(Window):
+    attr count
+    Container:
+        constraints = [vbox(form, spacer)]
+        Form: form:
+            Looper:
+                iterable = range(count)
+                Label:
+                    text = 'Row %d' % loop_item
+                Field:
+                    text = str(loop_item)
+
+"""
+
+
+def legacy_call(self):
+    """ The geometry update applying the geometry of every item.
+
+    """
+    d = self.constrainable()
+    x = d.left.value()
+    y = d.top.value()
+    w = d.width.value()
+    h = d.height.value()
+    self.set_geometry(x, y, w, h)
+
+
+def run(count, frames):
+    """ Time the resizes and return the mean frame and resize times.
+
+    """
+    spent = []
+    resize = LayoutManager.resize
+
+    def timed_resize(self, width, height):
+        start = timeit.default_timer()
+        resize(self, width, height)
+        spent.append(timeit.default_timer() - start)
+
+    LayoutManager.resize = timed_resize
+    try:
+        return _run(count, frames, spent)
+    finally:
+        LayoutManager.resize = resize
+
+
+def _run(count, frames, spent):
+    ast = parse(SOURCE, 'bench_resize')
+    code = EnamlCompiler.compile(ast, 'bench_resize')
+    namespace = {}
+    exec_(code, namespace)
+    window = namespace['Main'](count=count)
+    window.show()
+    QCoreApplication.processEvents()
+    widget = window.proxy.widget
+    size = widget.size()
+    width = size.width()
+    height = size.height()
+
+    def drag(dw, dh):
+        def frames_():
+            for i in range(1, frames + 1):
+                widget.resize(width + dw * i, height + dh * i)
+                QCoreApplication.processEvents()
+        return frames_
+
+    managers = [c.proxy._layout_manager for c in window.traverse()
+                if isinstance(c, namespace['Container'])]
+    managers = [m for m in managers if m is not None]
+    results = []
+    for dw, dh in ((0, 2), (2, 0)):
+        for manager in managers:
+            manager.geometry_updates = manager.geometry_updates_avoided = 0
+        del spent[:]
+        elapsed = timeit.timeit(drag(dw, dh), number=1)
+        updates = sum(m.geometry_updates for m in managers)
+        avoided = sum(m.geometry_updates_avoided for m in managers)
+        results.append((elapsed / frames, sum(spent) / frames,
+                        updates, avoided))
+    window.close()
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    app = QtApplication()
+    # The first window shown is slower, so a warm up run is discarded.
+    run(count, frames)
+    current = run(count, frames)
+    call = QtLayoutItem.__call__
+    try:
+        QtLayoutItem.__call__ = legacy_call
+        legacy = run(count, frames)
+    finally:
+        QtLayoutItem.__call__ = call
+
+    print('%d rows, %d frames' % (count, frames))
+    for name, old, new in zip(('height only', 'width'), legacy, current):
+        print('%s:' % name)
+        print('    legacy:  %.2fms per frame, %.2fms in resize'
+              % (1000 * old[0], 1000 * old[1]))
+        print('    current: %.2fms per frame, %.2fms in resize, '
+              '%d geometries applied, %d unchanged'
+              % (1000 * new[0], 1000 * new[1], new[2], new[3]))
+    app.stop()
+
+
+if __name__ == '__main__':
+    main()
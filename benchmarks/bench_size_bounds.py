@@ -0,0 +1,127 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark the size bounds updates of nested containers.
+
+A window shows nested containers, each one holding rows of labels and
+fields next to the next level of nesting. Every widget notifies its
+container of a geometry update which leaves its size hint unchanged,
+as a restyle or a font change does, and the time spent and the number
+of solves run to compute the best, min and max sizes of the containers
+are measured. The legacy implementation, which solves the sizes again
+on every update, is measured for comparison.
+
+Usage: python benchmarks/bench_size_bounds.py [n_levels] [n_rows] [n_passes]
+
+"""
+import sys
+import timeit
+
+from enaml.compat import exec_
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+from enaml.layout.layout_manager import LayoutManager
+from enaml.qt.qt_application import QtApplication
+from enaml.qt.QtCore import QCoreApplication
+
+
+SOURCE =\
+"""from enaml.core.api import Looper
+from enaml.widgets.api import Container, Field, Label, Window
+
+enamldef Level(Container):
+    attr rows
+    Looper:
+        iterable = range(rows)
+        Label:
+            text = 'Row %d' % loop_item
+        Field:
+            text = str(loop_item)
+
+enamldef Main(Window):
+    alias top
+    Level: top:
+        pass
+"""
+
+
+def legacy_size(size):
+    """ Wrap a size method so that it always runs a solve.
+
+    """
+    def wrapper(self):
+        self._size_cache = {}
+        return size(self)
+    return wrapper
+
+
+def run(levels, rows, passes):
+    """ Time the updates and return the elapsed time and solve counts.
+
+    """
+    ast = parse(SOURCE, 'bench_size_bounds')
+    code = EnamlCompiler.compile(ast, 'bench_size_bounds')
+    namespace = {}
+    exec_(code, namespace)
+    window = namespace['Main']()
+    parent = window.top
+    parent.rows = rows
+    for i in range(levels - 1):
+        parent = namespace['Level'](parent, rows=rows)
+    window.show()
+    QCoreApplication.processEvents()
+    containers = []
+    widgets = []
+    for child in window.traverse():
+        if child is window:
+            continue
+        if isinstance(child, namespace['Container']):
+            containers.append(child.proxy)
+        elif getattr(child, 'proxy_is_active', False):
+            widgets.append(child.proxy)
+    managers = [c._layout_manager for c in containers if c._layout_manager]
+    for manager in managers:
+        manager.size_solves = manager.size_solves_avoided = 0
+
+    def update():
+        for widget in widgets:
+            widget.geometry_updated()
+
+    elapsed = timeit.timeit(update, number=passes)
+    solves = sum(m.size_solves for m in managers)
+    avoided = sum(m.size_solves_avoided for m in managers)
+    window.close()
+    return elapsed, solves, avoided
+
+
+def main():
+    levels = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    passes = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+    app = QtApplication()
+    sizes = [(name, getattr(LayoutManager, name))
+             for name in ('best_size', 'min_size', 'max_size')]
+    try:
+        for name, size in sizes:
+            setattr(LayoutManager, name, legacy_size(size))
+        legacy = run(levels, rows, passes)
+    finally:
+        for name, size in sizes:
+            setattr(LayoutManager, name, size)
+    current = run(levels, rows, passes)
+
+    print('%d levels, %d rows per level, %d passes' % (levels, rows, passes))
+    for name, (elapsed, solves, avoided) in (('legacy', legacy),
+                                             ('current', current)):
+        print('%-8s %.1fms per pass, %d solves, %d solves avoided'
+              % (name + ':', 1000 * elapsed / passes, solves, avoided))
+    app.stop()
+
+
+if __name__ == '__main__':
+    main()
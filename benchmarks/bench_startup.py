@@ -0,0 +1,85 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark the startup time of a process importing cached enaml modules.
+
+An enaml module is compiled to its cache and then imported in fresh
+processes. Since the parser is built lazily, the import does not need
+to load the lexer and parser tables. The legacy behavior, which builds
+the parser when enaml.core.parser is imported, is measured for
+comparison by building it explicitly.
+
+Usage: python benchmarks/bench_startup.py [n_runs]
+
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+
+SOURCE =\
+"""from enaml.core.api import Declarative
+
+enamldef Main(Declarative):
+    attr value = 1
+
+"""
+
+
+IMPORT =\
+"""import sys
+sys.path.insert(0, %r)
+import enaml
+%s
+with enaml.imports():
+    import bench_startup_module
+assert bench_startup_module.Main
+"""
+
+
+def run(folder, runs, build_parser):
+    """ Time the imports in new processes and return the average time.
+
+    """
+    build = ''
+    if build_parser:
+        build = 'from enaml.core.parser import get_parser; get_parser()'
+    code = IMPORT % (folder, build)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([root, env.get('PYTHONPATH', '')])
+
+    def start():
+        subprocess.check_call([sys.executable, '-c', code], env=env)
+
+    start()  # Compile the cache
+    return timeit.timeit(start, number=runs) / runs
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    folder = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(folder, 'bench_startup_module.enaml'),
+                  'w') as f:
+            f.write(SOURCE)
+        legacy = run(folder, runs, True)
+        current = run(folder, runs, False)
+    finally:
+        shutil.rmtree(folder)
+
+    print('%d runs' % runs)
+    print('eager parser: %.3fs per process' % legacy)
+    print('lazy parser:  %.3fs per process' % current)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark the re-evaluation throughput of subscription bindings.
+
+A tree of declarative objects with `<<` bindings depending on the same
+model attributes is created and the model is updated repeatedly. The
+dependency set of the bindings never changes, which is the case the
+differential subscription of the StandardTracer is optimizing. The
+legacy behavior, which re-subscribes every dependency on every
+evaluation, is measured for comparison.
+
+Usage: python benchmarks/bench_tracer.py [n_objects] [n_ticks]
+
+"""
+import sys
+import timeit
+
+from atom.api import Atom, Int
+
+from enaml.compat import exec_
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.parser import parse
+from enaml.core.standard_tracer import StandardTracer, SubscriptionObserver
+
+
+SOURCE =\
+"""from enaml.core.api import Declarative, Looper
+
+enamldef Item(Declarative):
+    attr model
+    attr value << model.a + model.b * model.c
+
+enamldef Main(Declarative):
+    attr model
+    attr count
+    Looper:
+        iterable = range(count)
+        Item:
+            model = parent.model
+
+"""
+
+
+class Model(Atom):
+
+    a = Int()
+
+    b = Int()
+
+    c = Int()
+
+
+def legacy_finalize(self):
+    """ The finalize implementation re-subscribing every dependency.
+
+    """
+    owner = self.owner
+    name = self.name
+    key = '_[%s|trace]' % name
+    storage = owner._d_storage
+    old_observer = storage.get(key)
+    if old_observer is not None:
+        old_observer.ref = None
+    if self.items:
+        observer = SubscriptionObserver(owner, name)
+        storage[key] = observer
+        for obj, d_name in self.items:
+            obj.observe(d_name, observer)
+
+
+def build(count):
+    """ Build the object tree and read every binding once.
+
+    """
+    ast = parse(SOURCE, 'bench_tracer')
+    code = EnamlCompiler.compile(ast, 'bench_tracer')
+    namespace = {}
+    exec_(code, namespace)
+    model = Model()
+    main = namespace['Main'](model=model, count=count)
+    main.initialize()
+    for child in main.traverse():
+        if hasattr(child, 'value'):
+            child.value
+    return model
+
+
+def run(count, ticks):
+    """ Time the model updates and return the elapsed time.
+
+    """
+    model = build(count)
+
+    def tick():
+        for i in range(ticks):
+            model.a = i
+
+    return timeit.timeit(tick, number=1)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    ticks = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    evaluations = count * ticks
+
+    finalize = StandardTracer.finalize
+    try:
+        StandardTracer.finalize = legacy_finalize
+        legacy = run(count, ticks)
+    finally:
+        StandardTracer.finalize = finalize
+    current = run(count, ticks)
+
+    print('%d bindings, %d ticks' % (count, ticks))
+    print('legacy:       %.3fs (%.0f evaluations/s)'
+          % (legacy, evaluations / legacy))
+    print('differential: %.3fs (%.0f evaluations/s)'
+          % (current, evaluations / current))
+
+
+if __name__ == '__main__':
+    main()
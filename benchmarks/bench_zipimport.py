@@ -0,0 +1,100 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Benchmark the lookup of enaml modules inside a large zip archive.
+
+An archive holding many enaml modules is created and every module is
+located through the EnamlZipImporter. The legacy behavior, which opens
+the archive and scans its list of members on every lookup, is measured
+for comparison.
+
+Usage: python benchmarks/bench_zipimport.py [n_modules] [n_lookups]
+
+"""
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+import zipfile
+
+from enaml.core.import_hooks import EnamlZipImporter, make_file_info
+
+
+def legacy_locate_module(cls, fullname, path=None):
+    """ The direct import lookup opening the archive on every call.
+
+    """
+    leaf = fullname + os.path.extsep + 'enaml'
+    for stem in sys.path:
+        if not cls._is_supported(stem) or not os.path.exists(stem):
+            continue
+        file_info = make_file_info(os.path.join(stem, leaf))
+        cache_path = os.path.relpath(file_info.cache_path,
+                                     stem).replace("\\", "/")
+        try:
+            with zipfile.ZipFile(stem, 'r') as archive:
+                names = archive.namelist()
+                if leaf in names or cache_path in names:
+                    return cls(file_info, stem)
+        except IOError:
+            return
+
+
+def make_archive(path, count):
+    """ Create an archive holding count enaml modules.
+
+    """
+    with zipfile.ZipFile(path, 'w') as zf:
+        for i in range(count):
+            zf.writestr('bench_mod_%d.enaml' % i, 'a = %d\n' % i)
+
+
+def run(count, lookups):
+    """ Time the lookup of the modules and return the elapsed time.
+
+    """
+    EnamlZipImporter.invalidate_caches()
+
+    def lookup():
+        for i in range(lookups):
+            name = 'bench_mod_%d' % (i % count)
+            assert EnamlZipImporter.locate_module(name) is not None
+
+    try:
+        return timeit.timeit(lookup, number=1)
+    finally:
+        EnamlZipImporter.invalidate_caches()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    folder = tempfile.mkdtemp()
+    archive = os.path.join(folder, 'bench_library.zip')
+    make_archive(archive, count)
+    sys.path.insert(0, archive)
+    locate_module = EnamlZipImporter.__dict__['locate_module']
+    try:
+        EnamlZipImporter.locate_module = classmethod(legacy_locate_module)
+        try:
+            legacy = run(count, lookups)
+        finally:
+            EnamlZipImporter.locate_module = locate_module
+        current = run(count, lookups)
+    finally:
+        sys.path.remove(archive)
+        shutil.rmtree(folder)
+
+    print('%d members, %d lookups' % (count, lookups))
+    print('legacy:  %.3fs (%.0f lookups/s)' % (legacy, lookups / legacy))
+    print('indexed: %.3fs (%.0f lookups/s)' % (current, lookups / current))
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,7 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
+import os
 import sys
 import re
 import codecs
@@ -266,3 +267,14 @@ else:
         elif locs is None:
             locs = globs
         exec("""exec code in globs, locs""")
+
+
+# Atomic replacement of a file
+try:
+    from os import replace as os_replace
+except ImportError:
+    def os_replace(src, dst):
+        """Rename src to dst, overwriting dst if it exists."""
+        if sys.platform == 'win32' and os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
@@ -7,10 +7,19 @@
 #------------------------------------------------------------------------------
 """ Command-line tool to compile .py and .enaml files.
 
+The tool accepts the options of the standard compileall module and a
+-j/--workers option giving the number of processes used to compile the
+files. 0 uses as many processes as there are CPUs. On Python 3.5 and
+later the option is passed to the standard compileall module, which
+compiles the .py and .enaml files of the directories in parallel. On
+older versions only the .enaml files are compiled in parallel.
+
 """
 import os
 import sys
+import time
 import compileall
+import multiprocessing
 
 from enaml.compat import IS_PY3
 from enaml.core.import_hooks import EnamlImporter, make_file_info
@@ -19,6 +28,56 @@ from enaml.core.import_hooks import EnamlImporter, make_file_info
 # We redefine this so create a local reference
 compile_py_file = compileall.compile_file
 
+#: Whether the standard compileall module supports the workers option.
+COMPILEALL_WORKERS = sys.version_info >= (3, 5)
+
+
+def get_invalidation_mode(legacy=False, optimize=-1, invalidation_mode=None,
+                          *args, **kwargs):
+    """Get the Enaml cache invalidation mode matching the arguments
+    passed by compileall to compile_file.
+
+    """
+    if invalidation_mode is None:
+        return None
+    # Python passes a py_compile.PycInvalidationMode member
+    return invalidation_mode.name.lower().replace('_', '-')
+
+
+def _compile_enaml(task):
+    """Compile one enaml file and report the outcome.
+
+    Parameters
+    ----------
+    task : tuple
+        A tuple (fullname, force, quiet, invalidation_mode).
+
+    Returns
+    -------
+    result : tuple
+        A tuple (fullname, error, elapsed) where error is None or the
+        message of the exception which occurred during the compilation.
+
+    """
+    fullname, force, _, invalidation_mode = task
+    importer = EnamlImporter(make_file_info(fullname))
+    importer.invalidation_mode = invalidation_mode
+    error = None
+    start = time.time()
+    try:
+        if force:
+            importer.compile_code()
+        else:
+            importer.get_code()
+    except Exception as e:
+        error = str(e)
+    return (fullname, error, time.time() - start)
+
+
+#: The list of the enaml compilation tasks collected while running in
+#: parallel mode. None when files are compiled as they are found.
+_pending_tasks = None
+
 
 def compile_enaml_file(fullname, ddir=None, force=0, rx=None, quiet=0,
                        *args, **kwargs):
@@ -26,23 +85,114 @@ def compile_enaml_file(fullname, ddir=None, force=0, rx=None, quiet=0,
     
     """
     fullname = os.path.abspath(fullname)
-    importer = EnamlImporter(make_file_info(fullname))
+    invalidation_mode = get_invalidation_mode(*args, **kwargs)
+    if _pending_tasks is not None:
+        _pending_tasks.append((fullname, force, quiet, invalidation_mode))
+        return True if IS_PY3 else 1
     if not quiet:
         print('Compiling {}...'.format(fullname))
-    try:
-        if force:
-            importer.compile_code()
-        else:
-            importer.get_code()
+    _, error, _ = _compile_enaml((fullname, force, quiet,
+                                  invalidation_mode))
+    if error is None:
         return True if IS_PY3 else 1
-    except Exception as e:
-        if quiet:
-            print('Compiling {}...'.format(fullname))
-        print(str(e))
+    if quiet:
+        print('Compiling {}...'.format(fullname))
+    print(error)
     # Failed
     return False if IS_PY3 else 0
 
 
+def compile_enaml_files(tasks, workers=0):
+    """Byte-compile enaml files using a pool of processes.
+
+    The files are reported in the order of the tasks, whatever the order
+    in which they are compiled, followed by a timing summary.
+
+    Parameters
+    ----------
+    tasks : list
+        The list of the (fullname, force, quiet, invalidation_mode)
+        tuples describing the files to compile. quiet gives full output
+        with 0, errors only with 1, no output with 2.
+    workers : int
+        The number of processes to use. 0 uses one process per CPU.
+
+    Returns
+    -------
+    success : bool
+        Whether all the files were compiled successfully.
+
+    """
+    workers = min(workers or multiprocessing.cpu_count(), len(tasks))
+    start = time.time()
+    if workers > 1:
+        pool = multiprocessing.Pool(workers)
+        try:
+            results = pool.map(_compile_enaml, tasks, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [_compile_enaml(task) for task in tasks]
+    total = time.time() - start
+
+    success = True
+    for task, (fullname, error, elapsed) in zip(tasks, results):
+        quiet = task[2]
+        if error is None:
+            if not quiet:
+                print('Compiled {} in {:.3f}s'.format(fullname, elapsed))
+        else:
+            success = False
+            if quiet < 2:
+                print('Compiling {}...'.format(fullname))
+                print(error)
+    if not all(task[2] for task in tasks):
+        print('Compiled {} enaml files in {:.3f}s using {} '
+              'processes'.format(len(results), total, max(workers, 1)))
+    return success
+
+
+def pop_workers_option(argv):
+    """Remove the -j/--workers option from a list of arguments.
+
+    Parameters
+    ----------
+    argv : list
+        The command line arguments. The option is removed in place.
+
+    Returns
+    -------
+    workers : int or None
+        The number of workers or None if the option was not given.
+
+    """
+    workers = None
+    args = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ('-j', '--workers'):
+            if i + 1 == len(argv):
+                raise ValueError('%s expects a number of workers' % arg)
+            workers = argv[i + 1]
+            i += 1
+        elif arg.startswith('--workers='):
+            workers = arg.split('=', 1)[1]
+        elif arg.startswith('-j') and arg[2:].isdigit():
+            workers = arg[2:]
+        else:
+            args.append(arg)
+        i += 1
+    argv[:] = args
+    if workers is None:
+        return None
+    workers = int(workers)
+    if workers < 0:
+        raise ValueError('the number of workers must be non-negative')
+    return workers
+
+
 def compile_file(fullname, ddir=None, force=0, rx=None, quiet=0,
                  *args, **kwargs):
     """Byte-compile one file. Invokes the standard compiler for
@@ -80,8 +230,31 @@ if compileall.compile_file != compile_file:
 
 
 def main():
-    exit_status = int(not compileall.main())
-    sys.exit(exit_status)
+    global _pending_tasks
+    try:
+        workers = pop_workers_option(sys.argv)
+    except ValueError as e:
+        print(str(e))
+        sys.exit(2)
+    if workers is not None and COMPILEALL_WORKERS:
+        # compileall calls the patched compile_file in its own pool of
+        # processes, so the enaml files are compiled there as well.
+        sys.argv[1:1] = ['-j', str(workers)]
+        workers = None
+    if workers is None:
+        exit_status = int(not compileall.main())
+        sys.exit(exit_status)
+
+    # Collect the enaml files while compileall walks the arguments and
+    # compile them once the walk is done.
+    _pending_tasks = []
+    try:
+        success = compileall.main()
+        tasks = _pending_tasks
+    finally:
+        _pending_tasks = None
+    success = compile_enaml_files(tasks, workers) and success
+    sys.exit(int(not success))
 
 
 if __name__ == '__main__':
@@ -15,6 +15,7 @@ from atom.api import Str, Typed
 from ..compat import IS_PY3, USE_WORDCODE
 from . import byteplay as bp
 from .code_generator import CodeGenerator
+from .operators import CODE_TRANSFORMS, OPERATOR_TRANSFORMS
 from .enaml_ast import (
     AliasExpr, ASTVisitor, Binding, ChildDef, EnamlDef, StorageExpr, Template,
     TemplateInst, PythonExpression, PythonModule, FuncDef
@@ -696,6 +697,12 @@ def gen_operator_binding(cg, node, index, name):
         rewrite_globals_access(b_code, global_vars)
     code = b_code.to_code()
 
+    # Apply the code transformations of the standard operator ahead of
+    # time, so that they are stored in the cache instead of being run
+    # on each import. Each code object is stored as a direct constant
+    # so that its filename is updated when loading the cache.
+    kinds = OPERATOR_TRANSFORMS.get(node.operator, ())
+
     with cg.try_squash_raise():
         cg.set_lineno(node.lineno)
         load_helper(cg, 'run_operator')
@@ -705,7 +712,12 @@ def gen_operator_binding(cg, node, index, name):
         cg.load_const(node.operator)
         cg.load_const(code)
         cg.load_fast(F_GLOBALS)
-        cg.call_function(6)
+        for kind in kinds:
+            cg.load_const(kind)
+            cg.load_const(CODE_TRANSFORMS[kind](code))
+            cg.build_tuple(2)
+        cg.build_tuple(len(kinds))
+        cg.call_function(7)
         cg.pop_top()
 
 
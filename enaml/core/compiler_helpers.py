@@ -19,7 +19,7 @@ from .declarative_function import DeclarativeFunction
 from .declarative_meta import patch_d_member
 from .enamldef_meta import EnamlDefMeta
 from .expression_engine import ExpressionEngine
-from .operators import __get_operators
+from .operators import __get_operators, compiled_code
 from .template import Template
 from .funchelper import call_func
 
@@ -548,7 +548,7 @@ def bind_member(node, name, pair):
     node.engine.add_pair(name, pair)
 
 
-def run_operator(scope_node, node, name, op, code, f_globals):
+def run_operator(scope_node, node, name, op, code, f_globals, compiled=()):
     """ Run the operator for a given node.
 
     Parameters
@@ -572,12 +572,20 @@ def run_operator(scope_node, node, name, op, code, f_globals):
     f_globals : dict
         The globals dictionary to pass to the operator.
 
+    compiled : tuple, optional
+        The (kind, code) pairs of the code transformed ahead of time
+        for the standard operators. See `compiled_code`.
+
     """
     operators = __get_operators()
     if op not in operators:
         raise TypeError("failed to load operator '%s'" % op)
     scope_key = scope_node.scope_key
-    pair = operators[op](code, scope_key, f_globals)
+    if compiled:
+        with compiled_code(code, compiled):
+            pair = operators[op](code, scope_key, f_globals)
+    else:
+        pair = operators[op](code, scope_key, f_globals)
     if isinstance(name, tuple):
         # The template inst binding with a single name will take this
         # path by using a length-1 name tuple. See bug #78.
@@ -54,6 +54,40 @@ def new_scope(key, seed=None):
     del __map[key]
 
 
+@contextmanager
+def reenter_scope(key, scope):
+    """ Push an existing scope mapping back onto the stack.
+
+    Unlike 'new_scope', the scope is not copied, so the identifiers
+    bound while it is active are visible to the other users of the
+    scope. A scope already active for the key is restored on exit.
+
+    Parameters
+    ----------
+    key : object
+        The scope key associated with the scope.
+
+    scope : sortedmap
+        The scope mapping to make active.
+
+    Returns
+    -------
+    result : contextmanager
+        A contextmanager which will pop the scope after the context
+        exits. It yields the scope as the context variable.
+
+    """
+    previous = __map.get(key)
+    __map[key] = scope
+    __stack.append(scope)
+    yield scope
+    __stack.pop()
+    if previous is not None:
+        __map[key] = previous
+    else:
+        del __map[key]
+
+
 def peek_scope():
     """ Get the local scope object from the top of the scope stack.
 
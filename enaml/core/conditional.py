@@ -5,11 +5,12 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Bool, List
+from atom.api import Bool, Int, List, Typed
 
 from .compiler_nodes import new_scope
 from .declarative import d_
 from .pattern import Pattern
+from .subtree_pool import SubtreePool, rebind_subtree, show_subtree
 
 
 class Conditional(Pattern):
@@ -19,6 +20,11 @@ class Conditional(Pattern):
     its child items and insert them into its parent; when False, the old
     items will be destroyed.
 
+    When `recycle` or `keep_alive` is set, the old items are detached
+    instead of being destroyed, and inserted again the next time the
+    condition is True. Their state is kept: only the subscriptions
+    which fired while they were detached are evaluated again.
+
     """
     #: The condition variable. If this is True, a copy of the children
     #: will be inserted into the parent. Otherwise, the old copies will
@@ -29,6 +35,19 @@ class Conditional(Pattern):
     #: not be manipulated directly by user code.
     items = List()
 
+    #: The maximum number of parked subtrees kept for reuse when the
+    #: condition becomes False. 0 disables recycling.
+    recycle = d_(Int(0))
+
+    #: Whether the items are detached and hidden instead of destroyed
+    #: when the condition becomes False. The items stay alive while the
+    #: condition is False: use `kept_count` to get the number of objects
+    #: kept for the conditional.
+    keep_alive = d_(Bool(False))
+
+    #: The pool of the detached items kept for reuse.
+    _pool = Typed(SubtreePool)
+
     #--------------------------------------------------------------------------
     # Lifetime API
     #--------------------------------------------------------------------------
@@ -39,8 +58,24 @@ class Conditional(Pattern):
 
         """
         super(Conditional, self).destroy()
+        if self._pool is not None:
+            self._pool.clear()
+            del self._pool
         del self.items
 
+    def kept_count(self):
+        """ Get the number of objects kept alive for reuse.
+
+        Returns
+        -------
+        result : int
+            The number of declarative objects in the detached subtrees
+            held by the conditional.
+
+        """
+        pool = self._pool
+        return pool.object_count() if pool is not None else 0
+
     #--------------------------------------------------------------------------
     # Observers
     #--------------------------------------------------------------------------
@@ -67,25 +102,47 @@ class Conditional(Pattern):
         """ Refresh the items of the pattern.
 
         This method destroys the old items and creates and initializes
-        the new items.
+        the new items. When recycling or keeping the items alive, the old
+        items are parked and the parked items are reused instead of being
+        created.
 
         """
+        old_items = self.items
+        pool = self._pool
+        limit = self.recycle
+        if self.keep_alive:
+            limit = max(limit, 1)
+        if old_items:
+            if pool is None and limit > 0:
+                pool = self._pool = SubtreePool()
+            if pool is not None:
+                pool.limit = limit
+            if pool is None or not pool.park(None, old_items):
+                for old in old_items:
+                    if not old.is_destroyed:
+                        old.destroy()
+
         items = []
+        recycled = False
         if self.condition:
-            for nodes, key, f_locals in self.pattern_nodes:
-                with new_scope(key, f_locals):
-                    for node in nodes:
-                        child = node(None)
-                        if isinstance(child, list):
-                            items.extend(child)
-                        else:
-                            items.append(child)
-
-        for old in self.items:
-            if not old.is_destroyed:
-                old.destroy()
+            parked = pool.take(None) if pool is not None else None
+            if parked is not None:
+                items = parked[0]
+                recycled = True
+            else:
+                for nodes, key, f_locals in self.pattern_nodes:
+                    with new_scope(key, f_locals):
+                        for node in nodes:
+                            child = node(None)
+                            if isinstance(child, list):
+                                items.extend(child)
+                            else:
+                                items.append(child)
 
         if len(items) > 0:
             self.parent.insert_children(self, items)
+            if recycled:
+                rebind_subtree(items)
+                show_subtree(items)
 
         self.items = items
@@ -5,7 +5,7 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Event, Typed, Unicode
+from atom.api import Event, Typed, Unicode, Value
 from atom.datastructures.api import sortedmap
 
 from .declarative_meta import DeclarativeMeta
@@ -69,6 +69,9 @@ def d_func(func):
 #: The flag indicating that the Declarative object has been initialized.
 INITIALIZED_FLAG = next(flag_generator)
 
+#: The flag indicating that the Declarative object is parked for reuse.
+PARKED_FLAG = next(flag_generator)
+
 
 class Declarative(with_metaclass(DeclarativeMeta, Object)):
     """ The most base class of the Enaml declarative objects.
@@ -92,6 +95,11 @@ class Declarative(with_metaclass(DeclarativeMeta, Object)):
     #: not be manipulated directly by user code.
     is_initialized = flag_property(INITIALIZED_FLAG)
 
+    #: A property which gets and sets the parked flag. The subscriptions
+    #: of a parked object are not updated. This should not be manipulated
+    #: directly by user code.
+    is_parked = flag_property(PARKED_FLAG)
+
     #: Storage space for the declarative runtime. This value should not
     #: be manipulated by user code.
     _d_storage = Typed(sortedmap, ())
@@ -100,6 +108,16 @@ class Declarative(with_metaclass(DeclarativeMeta, Object)):
     #: be manipulated by user code.
     _d_engine = Typed(ExpressionEngine)
 
+    #: Cache of the ancestors resolving the dynamically scoped names of
+    #: the expressions of the object. It is managed by the DynamicScope
+    #: and should not be manipulated by user code.
+    _d_scope_cache = Value()
+
+    #: The names of the bound attributes whose subscriptions fired while
+    #: the object was parked. They are updated when the object is reused
+    #: and should not be manipulated by user code.
+    _d_stale = Value()
+
     def initialize(self):
         """ Initialize this object all of its children recursively.
 
@@ -126,6 +144,8 @@ class Declarative(with_metaclass(DeclarativeMeta, Object)):
         self.is_initialized = False
         del self._d_storage
         del self._d_engine
+        del self._d_scope_cache
+        del self._d_stale
         super(Declarative, self).destroy()
 
     def child_added(self, child):
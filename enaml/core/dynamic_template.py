@@ -5,12 +5,13 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Dict, List, Str, Tuple, Typed, observe
+from atom.api import Dict, Int, List, Str, Tuple, Typed, Value, observe
 
 from enaml.application import ScheduledTask, schedule
 from enaml.objectdict import ObjectDict
 
 from .declarative import Declarative, d_
+from .subtree_pool import SubtreePool, rebind_subtree, show_subtree
 from .template import Template
 
 
@@ -68,6 +69,10 @@ class DynamicTemplate(Declarative):
 
     Creating a DynamicTemplate without a parent is a programming error.
 
+    When `recycle` is set, the items of a template instantiation which is
+    replaced are detached and reused the next time the same template and
+    arguments are instantiated, with the current data applied.
+
     """
     #: The template object to instantiate.
     base = d_(Typed(Template))
@@ -89,12 +94,22 @@ class DynamicTemplate(Declarative):
     #: is updated automatically when the template is instantiated.
     tagged = Typed(ObjectDict, ())
 
+    #: The maximum number of replaced instantiations kept for reuse for
+    #: a given template node. 0 disables recycling.
+    recycle = d_(Int(0))
+
     #: The internal task used to collapse template updates.
     _update_task = Typed(ScheduledTask)
 
     #: The internal list of items generated by the template.
     _items = List(Declarative)
 
+    #: The template node which generated the current items.
+    _node = Value()
+
+    #: The pool of the replaced items kept for reuse.
+    _pool = Typed(SubtreePool)
+
     def initialize(self):
         """ A reimplemented initializer.
 
@@ -121,6 +136,10 @@ class DynamicTemplate(Declarative):
             for item in self._items:
                 if not item.is_destroyed:
                     item.destroy()
+        if self._pool is not None:
+            self._pool.clear()
+            del self._pool
+        del self._node
         del self.data
         del self.tagged
         if self._update_task is not None:
@@ -144,22 +163,49 @@ class DynamicTemplate(Declarative):
         """ Refresh the template instantiation.
 
         This method will destroy the old items, build the new items,
-        and then update the parent object and tagged object.
+        and then update the parent object and tagged object. When
+        recycling, the old items are parked under their template node
+        and parked items are reused instead of being built.
 
         """
         self._update_task = None
 
+        old_items = self._items
+        pool = self._pool
+        if old_items:
+            if pool is None and self.recycle > 0:
+                pool = self._pool = SubtreePool()
+            if pool is not None:
+                pool.limit = self.recycle
+            if pool is None or not pool.park(self._node, old_items):
+                for old in old_items:
+                    if not old.is_destroyed:
+                        old.destroy()
+
+        node = None
+        items = []
+        recycled = False
         if self.base is not None:
-            items = self.base(*self.args)(**self.data)
-        else:
-            items = []
-
-        for old in self._items:
-            if not old.is_destroyed:
-                old.destroy()
+            inst = self.base(*self.args)
+            node = inst.node
+            parked = pool.take(node) if pool is not None else None
+            if parked is not None:
+                items = parked[0]
+                recycled = True
+            else:
+                items = inst(**self.data)
 
         if len(items) > 0:
             self.parent.insert_children(self, items)
-
+            if recycled:
+                # The data is applied last so that it is not overwritten
+                # by the stale subscriptions of the items.
+                rebind_subtree(items)
+                for item in items:
+                    for key, value in self.data.items():
+                        setattr(item, key, value)
+                show_subtree(items)
+
+        self._node = node
         self._items = items
         self.tagged = make_tagged(items, self.tags, self.startag)
@@ -136,7 +136,12 @@ from .template_compiler import TemplateCompiler
 #      them with their scope of definition. This allows to handle properly
 #      comprehensions and lambdas. Also ensure that we compile the body of the
 #      :: operator as a function to properly handle closure.
-COMPILER_VERSION = 26
+# 27 : Apply the code transformations of the standard operators at compile
+#      time and pass the transformed code objects to run_operator, so that
+#      they are stored in the .enamlc cache.
+# 28 : Use a 16 bytes header for the .enamlc files, following PEP 552, which
+#      supports validating the cache using a hash of the source.
+COMPILER_VERSION = 28
 
 
 # Code that will be executed at the top of every enaml module
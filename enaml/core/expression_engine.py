@@ -5,6 +5,10 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
+from collections import OrderedDict
+from contextlib import contextmanager
+from types import CodeType
+
 from atom.api import Atom, List, Typed
 from atom.datastructures.api import sortedmap
 
@@ -161,6 +165,23 @@ class ExpressionEngine(Atom):
         if pair.writer is not None:
             handler.write_pairs.append(pair)
 
+    def has_reader(self, name):
+        """ Get whether a readable expression is bound to a name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute of interest.
+
+        Returns
+        -------
+        result : bool
+            True if the engine can compute a value for the attribute.
+
+        """
+        handler = self._handlers.get(name)
+        return handler is not None and handler.read_pair is not None
+
     def read(self, owner, name):
         """ Compute and return the value of an expression.
 
@@ -249,6 +270,39 @@ class ExpressionEngine(Atom):
                     finally:
                         guards.remove(key)
 
+    def update_dependents(self, owner, names):
+        """ Update the attributes of the owner bound to a readable
+        expression which refers to one of the given names.
+
+        This is used when names of the scope of the expressions changed,
+        for example when a looper iteration is reused for another item.
+        The expressions of custom read handlers, whose code is unknown,
+        are always updated.
+
+        Parameters
+        ----------
+        owner : Declarative
+            The declarative object which owns the engine.
+
+        names : set
+            The names of the scope which changed.
+
+        Returns
+        -------
+        result : list
+            The names of the updated attributes.
+
+        """
+        updated = []
+        for name, handler in list(self._handlers.items()):
+            pair = handler.read_pair
+            if pair is not None:
+                func = getattr(pair.reader, 'func', None)
+                if func is None or code_refers_to(func.__code__, names):
+                    self.update(owner, name)
+                    updated.append(name)
+        return updated
+
     def copy(self):
         """ Create a copy of the expression engine.
 
@@ -264,3 +318,90 @@ class ExpressionEngine(Atom):
             handlers[key] = value.copy()
         new._handlers = handlers
         return new
+
+
+def code_refers_to(code, names):
+    """ Get whether a code object refers to one of the given names.
+
+    The names used by the nested code objects, such as the ones of the
+    comprehensions, are taken into account.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code object of an expression.
+
+    names : set
+        The names to look for.
+
+    Returns
+    -------
+    result : bool
+        True if the code loads or stores one of the names.
+
+    """
+    if not names.isdisjoint(code.co_names):
+        return True
+    for const in code.co_consts:
+        if isinstance(const, CodeType) and code_refers_to(const, names):
+            return True
+    return False
+
+
+#: The (owner, name) pairs queued by the active update batch, or None
+#: if no batch is active. See `batch_updates`.
+_pending_updates = None
+
+
+def defer_update(owner, name):
+    """ Queue the update of a bound expression in the active batch.
+
+    Parameters
+    ----------
+    owner : Declarative
+        The declarative object which owns the expression engine.
+
+    name : str
+        The name of the relevant bound expression.
+
+    Returns
+    -------
+    result : bool
+        True if the update was queued, False if there is no active
+        batch and the update should be performed immediately.
+
+    """
+    pending = _pending_updates
+    if pending is None:
+        return False
+    pending[(owner, name)] = None
+    return True
+
+
+@contextmanager
+def batch_updates():
+    """ A context manager which batches the updates of bound expressions.
+
+    While the context is active, the subscriptions created by the
+    standard '<<' and ':=' operators queue the update of their bound
+    expression instead of re-evaluating it synchronously. Duplicate
+    updates are discarded and every expression is re-evaluated once,
+    in the order it was first queued, when the outermost context exits.
+    Updates triggered while flushing the queue are performed
+    synchronously, exactly as they would be without a batch.
+
+    """
+    global _pending_updates
+    if _pending_updates is not None:
+        yield
+        return
+    _pending_updates = OrderedDict()
+    try:
+        yield
+    finally:
+        pending = _pending_updates
+        _pending_updates = None
+        for owner, name in pending:
+            engine = owner._d_engine
+            if engine is not None:
+                engine.update(owner, name)
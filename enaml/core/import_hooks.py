@@ -5,7 +5,9 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
+import hashlib
 import marshal
+import mmap
 import os
 import io
 import struct
@@ -24,7 +26,7 @@ else:
 from .enaml_compiler import EnamlCompiler, COMPILER_VERSION
 from .parser import parse
 from ..compat import (read_source, detect_encoding, update_code_co_filename,
-                      with_metaclass, exec_)
+                      with_metaclass, exec_, os_replace)
 
 
 # The magic number as symbols for the current Python interpreter. These
@@ -42,6 +44,134 @@ MAGIC_TAG = 'enaml-py%s%s-cv%s' % (
 CACHEDIR = '__enamlcache__'
 
 
+#------------------------------------------------------------------------------
+# Cache Header
+#------------------------------------------------------------------------------
+# The header of an .enamlc file follows the layout of a .pyc file header as
+# described in PEP 552. It is made of the magic number, a 32 bits flags
+# field and 8 bytes of validation data. If the flags are 0, the validation
+# data are the modification time and the size of the source file. If the
+# first bit is set, the validation data are a hash of the source file and
+# the second bit indicates whether the hash should be checked on import.
+
+#: The cache is validated using the source modification time and size.
+TIMESTAMP = 'timestamp'
+
+#: The cache is validated using a hash of the source, checked on import.
+CHECKED_HASH = 'checked-hash'
+
+#: The cache is validated using a hash of the source, which is not checked
+#: on import. The cache must be regenerated explicitly, with compileall.
+UNCHECKED_HASH = 'unchecked-hash'
+
+#: The size of the header of an .enamlc file.
+HEADER_SIZE = 16
+
+_HASH_BASED_FLAG = 0b01
+
+_CHECK_SOURCE_FLAG = 0b10
+
+_MODE_FLAGS = {
+    TIMESTAMP: 0,
+    CHECKED_HASH: _HASH_BASED_FLAG | _CHECK_SOURCE_FLAG,
+    UNCHECKED_HASH: _HASH_BASED_FLAG,
+}
+
+
+def default_invalidation_mode():
+    """ Get the default cache invalidation mode.
+
+    As for Python, the hash based validation is used if the environment
+    variable SOURCE_DATE_EPOCH is set, for reproducible builds.
+
+    """
+    if os.environ.get('SOURCE_DATE_EPOCH'):
+        return CHECKED_HASH
+    return TIMESTAMP
+
+
+def source_hash(source_bytes):
+    """ Compute the hash of the source of an Enaml module.
+
+    Parameters
+    ----------
+    source_bytes : bytes
+        The raw content of the source file.
+
+    Returns
+    -------
+    result : bytes
+        The 8 bytes hash to store in the cache header.
+
+    """
+    return hashlib.sha1(source_bytes).digest()[:8]
+
+
+def make_cache_header(mode, mtime=0, size=0, source_bytes=b''):
+    """ Create the header of an .enamlc file.
+
+    Parameters
+    ----------
+    mode : str
+        The invalidation mode, one of TIMESTAMP, CHECKED_HASH or
+        UNCHECKED_HASH.
+
+    mtime : int, optional
+        The modification time of the source, for timestamp validation.
+
+    size : int, optional
+        The size of the source, for timestamp validation.
+
+    source_bytes : bytes, optional
+        The raw content of the source, for hash validation.
+
+    Returns
+    -------
+    result : bytes
+        The HEADER_SIZE bytes of the header.
+
+    """
+    if mode not in _MODE_FLAGS:
+        raise ValueError('Unknown cache invalidation mode %r' % mode)
+    flags = _MODE_FLAGS[mode]
+    if mode == TIMESTAMP:
+        data = struct.pack('<II', mtime & 0xFFFFFFFF, size & 0xFFFFFFFF)
+    else:
+        data = source_hash(source_bytes)
+    return MAGIC + struct.pack('<I', flags) + data
+
+
+def write_atomic(path, data):
+    """ Write data to a file, replacing it atomically.
+
+    The data are written to a temporary file in the same directory which
+    is then renamed, so that concurrent readers never see a partially
+    written file.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file to write.
+
+    data : bytes
+        The content of the file.
+
+    """
+    tmp_path = '{}.{}.{}.tmp'.format(path, os.getpid(), id(data))
+    flags = os.O_EXCL | os.O_CREAT | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+    fd = os.open(tmp_path, flags, 0o666)
+    try:
+        with io.FileIO(fd, 'wb') as tmp_file:
+            tmp_file.write(data)
+        os_replace(tmp_path, path)
+    except (OSError, IOError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 #------------------------------------------------------------------------------
 # Import Helpers
 #------------------------------------------------------------------------------
@@ -102,6 +232,9 @@ class AbstractEnamlImporter(with_metaclass(ABCMeta, object)):
         """
         cls._install_count[cls] += 1
         if cls not in sys.meta_path:
+            # The caches are not invalidated by Python while the
+            # importer is not in sys.meta_path.
+            cls.invalidate_caches()
             sys.meta_path.append(cls)
 
     @classmethod
@@ -116,6 +249,16 @@ class AbstractEnamlImporter(with_metaclass(ABCMeta, object)):
     #--------------------------------------------------------------------------
     # Python Import API
     #--------------------------------------------------------------------------
+    @classmethod
+    def invalidate_caches(cls):
+        """ Invalidate the caches used to locate modules, if any.
+
+        This is called by `importlib.invalidate_caches()` and when the
+        importer is installed.
+
+        """
+        pass
+
     @classmethod
     def find_module(cls, fullname, path=None):
         """ Finds the given Enaml module and returns an importer, or
@@ -298,12 +441,7 @@ class EnamlImporter(AbstractEnamlImporter):
         if path is not None:
             modname = fullname.rsplit('.', 1)[-1]
             leaf = ''.join((modname, os.path.extsep, 'enaml'))
-            for stem in path:
-                enaml_path = os.path.join(stem, leaf)
-                file_info = make_file_info(enaml_path)
-                if (os.path.exists(file_info.src_path) or
-                        os.path.exists(file_info.cache_path)):
-                    return cls(file_info)
+            stems = path
 
         # We're trying a load a package
         elif '.' in fullname:
@@ -312,12 +450,79 @@ class EnamlImporter(AbstractEnamlImporter):
         # We're doing a direct import
         else:
             leaf = fullname + os.path.extsep + 'enaml'
-            for stem in sys.path:
-                enaml_path = os.path.join(stem, leaf)
-                file_info = make_file_info(enaml_path)
-                if (os.path.exists(file_info.src_path) or
-                        os.path.exists(file_info.cache_path)):
-                    return cls(file_info)
+            stems = sys.path
+
+        for stem in stems:
+            if cls._has_module(stem, leaf):
+                return cls(make_file_info(os.path.join(stem, leaf)))
+
+    #: A cache of the content of the directories searched for modules.
+    #: It maps a directory path to a tuple (mtime, entries), where entries
+    #: is a frozenset of the names found in the directory. It is shared by
+    #: all the instances and cleared by `importlib.invalidate_caches()`.
+    _path_cache = {}
+
+    @classmethod
+    def invalidate_caches(cls):
+        """ Clear the cache of the directories content.
+
+        """
+        cls._path_cache.clear()
+
+    @classmethod
+    def _list_directory(cls, path):
+        """ Get the entries of a directory, using the cache if possible.
+
+        Parameters
+        ----------
+        path : string
+            The path of the directory.
+
+        Returns
+        -------
+        result : frozenset
+            The names of the entries of the directory. This is empty if
+            the path does not exist or is not a directory.
+
+        """
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return frozenset()
+        cached = cls._path_cache.get(path)
+        if cached is None or cached[0] != mtime:
+            try:
+                entries = frozenset(os.listdir(path))
+            except OSError:
+                entries = frozenset()
+            cached = cls._path_cache[path] = (mtime, entries)
+        return cached[1]
+
+    @classmethod
+    def _has_module(cls, stem, leaf):
+        """ Check whether a directory provides the source or the cache
+        file of an Enaml module.
+
+        Parameters
+        ----------
+        stem : string
+            The path of the directory.
+
+        leaf : string
+            The name of the source file of the module.
+
+        """
+        directory = stem if os.path.isabs(stem) else os.path.abspath(stem)
+        entries = cls._list_directory(directory)
+        if leaf in entries:
+            return True
+        if CACHEDIR not in entries:
+            return False
+        cache_dir = os.path.join(directory, CACHEDIR)
+        cache_name = os.path.basename(
+            make_file_info(os.path.join(directory, leaf)).cache_path
+        )
+        return cache_name in cls._list_directory(cache_dir)
 
     def __init__(self, file_info):
         """ Initialize an importer object.
@@ -330,6 +535,10 @@ class EnamlImporter(AbstractEnamlImporter):
         """
         self.file_info = file_info
 
+    #: The invalidation mode used when writing the cache. If None, the
+    #: mode given by `default_invalidation_mode` is used.
+    invalidation_mode = None
+
     def _load_cache(self, file_info, set_src=False):
         """ Loads and returns the code object for the given file info.
 
@@ -347,24 +556,24 @@ class EnamlImporter(AbstractEnamlImporter):
 
         """
         with open(file_info.cache_path, 'rb') as cache_file:
-            cache_file.read(8)
+            cache_file.read(HEADER_SIZE)
             code = marshal.load(cache_file)
         if set_src:
             code = update_code_co_filename(code, file_info.src_path)
         return code
 
-    def _write_cache(self, code, ts, file_info):
+    def _write_cache(self, code, header, file_info):
         """ Write the cached file for then given info, creating the
-        cache directory if needed. This call will suppress any
-        IOError or OSError exceptions.
+        cache directory if needed. The file is replaced atomically.
+        This call will suppress any IOError or OSError exceptions.
 
         Parameters
         ----------
         code : types.CodeType
             The code object to write to the cache.
 
-        ts : int
-            The integer timestamp for the file.
+        header : bytes
+            The header of the cache file. See `make_cache_header`.
 
         file_info : EnamlFileInfo
             The file info object for the file.
@@ -373,31 +582,39 @@ class EnamlImporter(AbstractEnamlImporter):
         try:
             if not os.path.exists(file_info.cache_dir):
                 os.mkdir(file_info.cache_dir)
-            with open(file_info.cache_path, 'w+b') as cache_file:
-                cache_file.write(MAGIC)
-                cache_file.write(struct.pack('i', ts))
-                marshal.dump(code, cache_file)
+            write_atomic(file_info.cache_path, header + marshal.dumps(code))
         except (OSError, IOError):
             pass
 
-    def _get_magic_info(self, file_info):
-        """ Loads and returns the magic info for the given path.
+    def _is_cache_valid(self, header):
+        """ Check whether a cache header is valid for the current source.
 
         Parameters
         ----------
-        file_info : EnamlFileInfo
-            The file info object for the file.
+        header : bytes
+            The HEADER_SIZE first bytes of the cache file.
 
         Returns
         -------
-        result : (magic, timestamp)
-            The magic string and integer timestamp for the file.
+        result : bool
+            Whether the cached code can be used. If an invalidation mode
+            is set on the importer, a cache written with another mode is
+            considered invalid.
 
         """
-        with open(file_info.cache_path, 'rb') as cache_file:
-            magic = cache_file.read(4)
-            timestamp = struct.unpack('i', cache_file.read(4))[0]
-        return (magic, timestamp)
+        if len(header) != HEADER_SIZE or header[:4] != MAGIC:
+            return False
+        flags = struct.unpack('<I', header[4:8])[0]
+        mode = self.invalidation_mode
+        if mode is not None and flags != _MODE_FLAGS[mode]:
+            return False
+        if flags & _HASH_BASED_FLAG:
+            if not flags & _CHECK_SOURCE_FLAG:
+                return True
+            return header[8:] == source_hash(self.read_source_bytes())
+        mtime, size = struct.unpack('<II', header[8:])
+        return (mtime == self.get_source_modified_time() & 0xFFFFFFFF and
+                size == self.get_source_size() & 0xFFFFFFFF)
 
     def read_source(self):
         """ Read the source code for the Enaml module.
@@ -410,12 +627,40 @@ class EnamlImporter(AbstractEnamlImporter):
         """
         return read_source(self.file_info.src_path)
 
+    def read_source_bytes(self):
+        """ Read the raw content of the source file of the Enaml module.
+
+        Returns
+        -------
+        result : bytes
+            The undecoded content of the source file.
+
+        """
+        with open(self.file_info.src_path, 'rb') as src_file:
+            return src_file.read()
+
     def get_source_modified_time(self):
         """ Get the last modified time of the source for the Enaml module.
 
         """
         return int(os.path.getmtime(self.file_info.src_path))
 
+    def get_source_size(self):
+        """ Get the size of the source for the Enaml module.
+
+        """
+        return os.path.getsize(self.file_info.src_path)
+
+    def make_cache_header(self):
+        """ Create the header of the cache file for the current source.
+
+        """
+        mode = self.invalidation_mode or default_invalidation_mode()
+        if mode == TIMESTAMP:
+            return make_cache_header(mode, self.get_source_modified_time(),
+                                     self.get_source_size())
+        return make_cache_header(mode, source_bytes=self.read_source_bytes())
+
     def compile_code(self):
         """ Compile the code object for the Enaml module and
         the full path to the module for use as the __file__ attribute
@@ -429,10 +674,10 @@ class EnamlImporter(AbstractEnamlImporter):
 
         """
         file_info = self.file_info
-        src_mod_time = self.get_source_modified_time()
+        header = self.make_cache_header()
         ast = parse(self.read_source(), file_info.src_path)
         code = EnamlCompiler.compile(ast, file_info.src_path)
-        self._write_cache(code, src_mod_time, file_info)
+        self._write_cache(code, header, file_info)
         return (code, file_info.src_path)
 
     def get_code(self):
@@ -457,12 +702,20 @@ class EnamlImporter(AbstractEnamlImporter):
             code = self._load_cache(file_info)
             return (code, file_info.src_path)
 
-        # Use the cached file if it exists and is current
-        src_mod_time = self.get_source_modified_time()
-        if os.path.exists(file_info.cache_path):
-            magic, ts = self._get_magic_info(file_info)
-            if magic == MAGIC and src_mod_time <= ts:
-                code = self._load_cache(file_info, set_src=True)
+        # Use the cached file if it exists and is current. The header and
+        # the code are read at once, so that the file is opened only once.
+        try:
+            with open(file_info.cache_path, 'rb') as cache_file:
+                data = cache_file.read()
+        except (OSError, IOError):
+            data = b''
+        if data and self._is_cache_valid(data[:HEADER_SIZE]):
+            try:
+                code = marshal.loads(data[HEADER_SIZE:])
+            except (EOFError, ValueError, TypeError):
+                pass  # Corrupted cache, compile from source
+            else:
+                code = update_code_co_filename(code, file_info.src_path)
                 return (code, file_info.src_path)
 
         # Otherwise, compile from source and attempt to cache
@@ -519,23 +772,23 @@ class EnamlZipImporter(EnamlImporter):
                 for p in pkgpath:
                     archive_path = os.path.dirname(archive_path)
 
+                if not cls._is_supported(archive_path):
+                    continue
+
                 # To check if cache file is in zip file
                 cache_path = os.path.relpath(file_info.cache_path,
                                              archive_path).replace("\\", "/")
 
-                if (cls._is_supported(archive_path) and
-                        os.path.exists(archive_path)):
-
-                    # Path where code should be within the archive
-                    code_path = '/'.join(pkgpath+[leaf])
-                    try:
-                        with ZipFile(archive_path, 'r') as archive:
-                            name_list = archive.namelist()
-                            if ((code_path in name_list) or
-                                    (cache_path in name_list)):
-                                return cls(file_info, archive_path)
-                    except IOError:
-                        return
+                # Path where code should be within the archive
+                code_path = '/'.join(pkgpath+[leaf])
+                try:
+                    index = cls._get_archive(archive_path)
+                except IOError:
+                    return
+                if index is not None:
+                    name_set = index[1]
+                    if code_path in name_set or cache_path in name_set:
+                        return cls(file_info, archive_path)
 
         # We're trying a load a package
         elif '.' in fullname:
@@ -545,20 +798,77 @@ class EnamlZipImporter(EnamlImporter):
         else:
             leaf = fullname + os.path.extsep + 'enaml'
             for stem in sys.path:
+                if not cls._is_supported(stem):
+                    continue
                 enaml_path = os.path.join(stem, leaf)
                 file_info = make_file_info(enaml_path)
                 # To check if cache file is in zip file
                 cache_path = os.path.relpath(file_info.cache_path,
                                              stem).replace("\\", "/")
-                if cls._is_supported(stem) and os.path.exists(stem):
-                    try:
-                        with ZipFile(stem, 'r') as archive:
-                            name_list = archive.namelist()
-                            if ((leaf in name_list) or
-                                    (cache_path in name_list)):
-                                return cls(file_info, stem)
-                    except IOError:
-                        return
+                try:
+                    index = cls._get_archive(stem)
+                except IOError:
+                    return
+                if index is not None:
+                    name_set = index[1]
+                    if leaf in name_set or cache_path in name_set:
+                        return cls(file_info, stem)
+
+    #: A cache of the opened archives. It maps the path of an archive
+    #: to a tuple (stat key, archive, names) where archive is the open
+    #: archive object and names the frozenset of its member names. An
+    #: entry is discarded when the modified time or size of the archive
+    #: changes.
+    _archives = {}
+
+    @classmethod
+    def invalidate_caches(cls):
+        """ Close the cached archives and clear the caches.
+
+        """
+        super(EnamlZipImporter, cls).invalidate_caches()
+        for _, archive, _ in cls._archives.values():
+            archive.close()
+        cls._archives.clear()
+
+    @classmethod
+    def _get_archive(cls, archive_path):
+        """ Get the open archive and its index for the given path.
+
+        Parameters
+        ----------
+        archive_path : str
+            The full path to the archive.
+
+        Returns
+        -------
+        result : tuple or None
+            A tuple (archive, names) of the open archive and the frozenset
+            of its member names, or None if the archive does not exist.
+
+        Raises
+        ------
+        IOError
+            If the archive cannot be opened.
+
+        """
+        try:
+            stat = os.stat(archive_path)
+        except OSError:
+            return None
+        key = (stat.st_mtime, stat.st_size)
+        cached = cls._archives.get(archive_path)
+        if cached is not None:
+            if cached[0] == key:
+                return cached[1:]
+            cached[1].close()
+            del cls._archives[archive_path]
+        opener = cls.supported_archives[
+            os.path.splitext(archive_path)[-1].lower()]
+        archive = opener(archive_path, 'r')
+        cached = (key, archive, frozenset(archive.namelist()))
+        cls._archives[archive_path] = cached
+        return cached[1:]
 
     @classmethod
     def _is_supported(cls, archive_path):
@@ -604,6 +914,20 @@ class EnamlZipImporter(EnamlImporter):
         """
         return int(os.path.getmtime(self.archive_path))
 
+    def get_source_size(self):
+        """ Overridden to read the size of the archive instead of the
+        source file.
+
+        """
+        return os.path.getsize(self.archive_path)
+
+    def read_source_bytes(self):
+        """ Overridden to read the source from the currently opened
+        archive instead of the source file.
+
+        """
+        return self.archive.read(self.code_path)
+
     def read_source(self):
         """ Overridden to read the source from the currently opened archive
         instead of the source file. The `self.archive` must be a reference
@@ -622,13 +946,19 @@ class EnamlZipImporter(EnamlImporter):
 
         return src
 
-    def _write_cache(self, code, ts, file_info):
+    def _write_cache(self, code, header, file_info):
         """ Overridden to because cache files cannot be written into
         the archive.
 
         """
         pass
 
+    def make_cache_header(self):
+        """ Overridden since no cache file is written.
+
+        """
+        return b''
+
     def get_code(self):
         """ Loads and returns the code object for the Enaml module and
         the full path to the module for use as the __file__ attribute
@@ -641,26 +971,215 @@ class EnamlZipImporter(EnamlImporter):
             path to the module as a string.
 
         """
-        # Load it from the archive as no cache can exist outside
+        # Load it from the archive as no cache can exist outside. The
+        # archive is kept open and shared by the importers.
         file_info = self.file_info
-        with ZipFile(self.archive_path, 'r') as archive:
-            # Path within the archive that should contain the cached module
-            code_cache_path = os.path.relpath(
-                file_info.cache_path, self.archive_path).replace("\\", "/")
-
-            # Try to use the cached file embedded in the archive
-            if code_cache_path in archive.namelist():
-                # Compile the cached code
-                cache = archive.read(code_cache_path)
-                code = marshal.loads(cache[8:])
-                return (code, code_cache_path)
-
-            #: Save reference
-            self.archive = archive
-
-            # Otherwise, compile from source and attempt
-            # to cache it on the system
-            return self.compile_code()
+        archive, name_set = self._get_archive(self.archive_path)
+
+        # Path within the archive that should contain the cached module
+        code_cache_path = os.path.relpath(
+            file_info.cache_path, self.archive_path).replace("\\", "/")
+
+        # Try to use the cached file embedded in the archive
+        if code_cache_path in name_set:
+            # Compile the cached code
+            cache = archive.read(code_cache_path)
+            code = marshal.loads(cache[HEADER_SIZE:])
+            return (code, code_cache_path)
+
+        #: Save reference
+        self.archive = archive
+
+        # Otherwise, compile from source and attempt
+        # to cache it on the system
+        return self.compile_code()
+
+
+#------------------------------------------------------------------------------
+# Enaml Bundle
+#------------------------------------------------------------------------------
+# An enaml bundle packs the compiled code of many enaml modules in a single
+# file. It starts with the BUNDLE_MAGIC bytes and the size of the index as a
+# 32 bits little endian integer, followed by the marshalled index and the
+# marshalled code objects. The index is a tuple (tag, modules) where tag is
+# the MAGIC_TAG of the interpreter which wrote the bundle and modules maps
+# the fully qualified name of each module to a tuple (filename, offset,
+# size) locating its code relative to the end of the index. The filename is
+# the path of the source of the module relative to its sys.path entry.
+
+#: The magic bytes starting an enaml bundle file.
+BUNDLE_MAGIC = b'ENAMLBDL'
+
+
+def write_bundle(path, modules):
+    """ Write an enaml bundle file.
+
+    Parameters
+    ----------
+    path : string
+        The path of the bundle file. It is replaced atomically.
+
+    modules : iterable
+        An iterable of (fullname, filename, code) tuples giving the fully
+        qualified name of each module, the path of its source relative to
+        its sys.path entry and its compiled code object.
+
+    """
+    index = {}
+    chunks = []
+    offset = 0
+    for fullname, filename, code in modules:
+        data = marshal.dumps(code)
+        index[fullname] = (filename, offset, len(data))
+        chunks.append(data)
+        offset += len(data)
+    head = marshal.dumps((MAGIC_TAG, index))
+    chunks[:0] = [BUNDLE_MAGIC, struct.pack('<I', len(head)), head]
+    write_atomic(path, b''.join(chunks))
+
+
+class EnamlBundle(object):
+    """ A read-only view on an enaml bundle file.
+
+    The file is opened once and memory mapped. Only the code of the modules
+    which are loaded is read from it.
+
+    """
+    def __init__(self, path):
+        """ Open the bundle file.
+
+        Parameters
+        ----------
+        path : string
+            The path of the bundle file.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a bundle or was written by another version
+            of Python or of the enaml compiler.
+
+        """
+        self.path = os.path.abspath(path)
+        with open(self.path, 'rb') as bundle_file:
+            self._data = mmap.mmap(bundle_file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+        try:
+            data = self._data
+            start = len(BUNDLE_MAGIC) + 4
+            if data[:len(BUNDLE_MAGIC)] != BUNDLE_MAGIC:
+                raise ValueError('%s is not an enaml bundle' % path)
+            size = struct.unpack('<I', data[len(BUNDLE_MAGIC):start])[0]
+            tag, self.modules = marshal.loads(data[start:start + size])
+            if tag != MAGIC_TAG:
+                msg = '%s was compiled for %s, expected %s'
+                raise ValueError(msg % (path, tag, MAGIC_TAG))
+            self._offset = start + size
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        """ Close the memory map of the bundle file.
+
+        """
+        self._data.close()
+
+    def get_source_path(self, fullname):
+        """ Get the source path reported for a module of the bundle.
+
+        The path is made relative to the bundle file, in the same way
+        the EnamlZipImporter does for the archives.
+
+        """
+        filename = self.modules[fullname][0]
+        return os.path.join(self.path, *filename.split('/'))
+
+    def load_code(self, fullname):
+        """ Load the code object of a module of the bundle.
+
+        """
+        _, offset, size = self.modules[fullname]
+        start = self._offset + offset
+        return marshal.loads(self._data[start:start + size])
+
+
+class EnamlBundleImporter(AbstractEnamlImporter):
+    """ An importer loading the enaml modules from bundle files.
+
+    The bundles are opened once, using `add_bundle`, and the importer needs
+    to be registered with `imports.add_importer`. Locating a module is then
+    a dictionary lookup, and no file is read except the bundles. The code
+    of the bundles is used as is and is never checked against the sources.
+
+    """
+    #: The bundles opened with `add_bundle`, in order of precedence.
+    _bundles = []
+
+    @classmethod
+    def add_bundle(cls, path):
+        """ Open a bundle file and use it to look up modules. Bundles
+        added first take precedence. If the bundle has already been added
+        this is a no-op.
+
+        """
+        path = os.path.abspath(path)
+        if any(bundle.path == path for bundle in cls._bundles):
+            return
+        cls._bundles.append(EnamlBundle(path))
+
+    @classmethod
+    def remove_bundle(cls, path):
+        """ Close a bundle file and stop using it to look up modules.
+        If the bundle has not been added this is a no-op.
+
+        """
+        path = os.path.abspath(path)
+        for bundle in cls._bundles:
+            if bundle.path == path:
+                cls._bundles.remove(bundle)
+                bundle.close()
+                break
+
+    @classmethod
+    def locate_module(cls, fullname, path=None):
+        """ Searches for the given Enaml module in the bundles and returns
+        an instance of this class on success.
+
+        """
+        for bundle in cls._bundles:
+            if fullname in bundle.modules:
+                file_info = make_file_info(bundle.get_source_path(fullname))
+                return cls(file_info, bundle, fullname)
+
+    def __init__(self, file_info, bundle, fullname):
+        """ Initialize an importer object.
+
+        Parameters
+        ----------
+        file_info : EnamlFileInfo
+            An instance of EnamlFileInfo.
+
+        bundle : EnamlBundle
+            The bundle containing the module.
+
+        fullname : string
+            The fully qualified name of the module.
+
+        """
+        self.file_info = file_info
+        self.bundle = bundle
+        self.fullname = fullname
+
+    def get_code(self):
+        """ Loads and returns the code object for the Enaml module and
+        the full path to the module for use as the __file__ attribute
+        of the module.
+
+        """
+        src_path = self.file_info.src_path
+        code = self.bundle.load_code(self.fullname)
+        return (update_code_co_filename(code, src_path), src_path)
 
 
 #------------------------------------------------------------------------------
@@ -5,14 +5,14 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
-from collections import Iterable
+from collections import Iterable, Sequence, deque
 
-from atom.api import Instance, List, Typed
-from atom.datastructures.api import sortedmap
+from atom.api import Callable, Instance, Int, List, Typed
 
 from .compiler_nodes import new_scope
 from .declarative import d_
 from .pattern import Pattern
+from .subtree_pool import SubtreePool, rebind_subtree, show_subtree
 
 
 class Looper(Pattern):
@@ -29,16 +29,28 @@ class Looper(Pattern):
     parent of the `Looper`. The `Looper` keeps ownership of all items
     it creates. When the iterable for the looper is changed, the looper
     will only create and destroy children for the items in the iterable
-    which have changed.
+    which have changed. The iterations are matched using the value
+    returned by `key` for each item, or the item itself.
 
-    The Looper works under the assumptions that the values stored in the
-    iterable are unique.
+    When the iterable is an atom container bound with the `<<` operator,
+    the looper applies the changes made in place to the container.
+
+    When `recycle` is set, the iterations which are removed are detached
+    and reused for the items added later on, instead of being destroyed
+    and created again.
 
     """
-    #: The iterable to use when creating the items for the looper.
-    #: The items in the iterable must be unique. This allows the
-    #: Looper to optimize the creation and destruction of widgets.
-    iterable = d_(Instance(Iterable))
+    #: The iterable to use when creating the items for the looper. The
+    #: changes made in place to a bound container are forwarded to the
+    #: looper, which applies them incrementally.
+    iterable = d_(Instance(Iterable)).tag(d_container_changes=True)
+
+    #: An optional callable returning the key identifying an item of the
+    #: iterable. The keys must be hashable. When the iterable changes,
+    #: the iterations are reused for the items whose key did not change.
+    #: By default, the items are used as keys if they are hashable and
+    #: their identity is used otherwise.
+    key = d_(Callable())
 
     #: The list of items created by the conditional. Each item in the
     #: list represents one iteration of the loop and is a list of the
@@ -46,10 +58,27 @@ class Looper(Pattern):
     #: manipulated directly by user code.
     items = List()
 
-    #: Private data storage which maps the user iterable data to the
-    #: list of items created for that iteration. This allows the looper
-    #: to only create and destroy the items which have changed.
-    _iter_data = Typed(sortedmap, ())
+    #: The maximum number of removed iterations kept for reuse. A reused
+    #: iteration gets the `loop_index` and `loop_item` of its new item and
+    #: the expressions using them are evaluated again. 0 disables
+    #: recycling.
+    recycle = d_(Int(0))
+
+    #: Private storage of the keys of the iterations. The list is kept
+    #: in the same order as the items. This allows the looper to only
+    #: create and destroy the items which have changed.
+    _iter_keys = Typed(list, ())
+
+    #: Private storage of the local scopes of each iteration, kept in
+    #: the same order as the items.
+    _scopes = Typed(list, ())
+
+    #: The pool of the removed iterations kept for reuse.
+    _pool = Typed(SubtreePool)
+
+    #: The recycled iterations waiting to be rebound once inserted. It
+    #: holds (iteration, scopes, loop_index, loop_item) tuples.
+    _recycled = Typed(list, ())
 
     #--------------------------------------------------------------------------
     # Lifetime API
@@ -61,9 +90,13 @@ class Looper(Pattern):
 
         """
         super(Looper, self).destroy()
+        if self._pool is not None:
+            self._pool.clear()
+            del self._pool
         del self.iterable
         del self.items
-        del self._iter_data
+        del self._iter_keys
+        del self._scopes
 
     #--------------------------------------------------------------------------
     # Observers
@@ -75,8 +108,11 @@ class Looper(Pattern):
         items will be refreshed.
 
         """
-        if change['type'] == 'update' and self.is_initialized:
-            self.refresh_items()
+        if self.is_initialized:
+            if change['type'] == 'update':
+                self.refresh_items()
+            elif change['type'] == 'container':
+                self._apply_container_change(change)
 
     #--------------------------------------------------------------------------
     # Pattern API
@@ -85,56 +121,413 @@ class Looper(Pattern):
         """ Get a list of items created by the pattern.
 
         """
-        return sum(self.items, [])
+        return [item for iteration in self.items for item in iteration]
 
     def refresh_items(self):
         """ Refresh the items of the pattern.
 
         This method destroys the old items and creates and initializes
-        the new items.
+        the new items. The iterations at the start and at the end of the
+        loop whose key did not change are left in place. The iterations
+        which are kept or reused get their new index and item.
+
+        """
+        old_items = self.items
+        old_keys = self._iter_keys
+        old_scopes = self._scopes
+        iterable = self.iterable
+        if iterable is not None and len(self.pattern_nodes) > 0:
+            values = list(iterable)
+        else:
+            values = []
+        loop_key = self._loop_key
+        new_keys = [loop_key(value) for value in values]
+
+        # Skip the iterations which did not change at both ends.
+        n_old = len(old_keys)
+        n_new = len(new_keys)
+        start = 0
+        end = min(n_old, n_new)
+        while start < end and old_keys[start] == new_keys[start]:
+            start += 1
+        end = 0
+        while (end < n_old - start and end < n_new - start and
+               old_keys[n_old - end - 1] == new_keys[n_new - end - 1]):
+            end += 1
+        if start == n_old == n_new:
+            self._rebind_iterations(values)
+            return
+
+        # Reuse the old iterations of the middle section by key. The
+        # unused ones are released first so that they can be recycled.
+        available = {}
+        for index in range(start, n_old - end):
+            key = old_keys[index]
+            pair = (old_items[index], old_scopes[index])
+            if key in available:
+                available[key].append(pair)
+            else:
+                available[key] = deque([pair])
+        middle = []
+        for index in range(start, n_new - end):
+            pairs = available.get(new_keys[index])
+            middle.append(pairs.popleft() if pairs else None)
+
+        for pairs in available.values():
+            for iteration, scopes in pairs:
+                self._release_iteration(iteration, scopes)
+
+        for offset, pair in enumerate(middle):
+            if pair is None:
+                index = start + offset
+                middle[offset] = self._new_iteration(index, values[index])
+
+        tail = n_old - end
+        self.items = (old_items[:start] + [pair[0] for pair in middle] +
+                      old_items[tail:])
+        self._scopes = (old_scopes[:start] + [pair[1] for pair in middle] +
+                        old_scopes[tail:])
+        self._iter_keys = new_keys
+        self._insert_iterations(start, len(middle))
+        self._rebind_iterations(values)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _apply_container_change(self, change):
+        """ Apply a change made in place to the iterable.
+
+        The appended, inserted and popped items are handled without
+        going through the whole iterable. Other changes refresh all the
+        items.
+
+        Parameters
+        ----------
+        change : dict
+            The container change emitted by Atom for the iterable.
+
+        """
+        if not self.pattern_nodes:
+            return
+        op = change['operation']
+        value = change['value']
+        items = self.items
+        keys = self._iter_keys
+        scopes = self._scopes
+        n_old = len(items)
+
+        if op in ('append', 'extend', '__iadd__', 'insert'):
+            if op == 'insert':
+                index = change['index']
+                if index < 0:
+                    index = max(index + n_old, 0)
+                index = min(index, n_old)
+                added = [change['item']]
+            else:
+                index = n_old
+                added = ([change['item']] if op == 'append' else
+                         list(change['items']))
+            if len(value) == n_old + len(added):
+                loop_key = self._loop_key
+                pairs = [self._new_iteration(index + i, item)
+                         for i, item in enumerate(added)]
+                items[index:index] = [pair[0] for pair in pairs]
+                scopes[index:index] = [pair[1] for pair in pairs]
+                keys[index:index] = [loop_key(item) for item in added]
+                self._insert_iterations(index, len(pairs))
+                self._rebind_iterations(value, index + len(pairs))
+                return
+
+        elif op in ('pop', '__delitem__'):
+            index = change['index']
+            if isinstance(index, int) and len(value) == n_old - 1:
+                if index < 0:
+                    index += n_old
+                self._release_iteration(items.pop(index), scopes.pop(index))
+                del keys[index]
+                self._rebind_iterations(value, index)
+                return
+
+        self.refresh_items()
+
+    def _rebind_iteration(self, iteration, scopes, loop_index, loop_item):
+        """ Bind an existing iteration to another item of the iterable.
+
+        Only the changed scope names are updated, and nothing is done if
+        the iteration is already bound to the item at the index.
+
+        """
+        if not scopes:
+            return
+        scope = scopes[0]
+        values = {}
+        if scope['loop_index'] != loop_index:
+            values['loop_index'] = loop_index
+        if scope['loop_item'] is not loop_item:
+            values['loop_item'] = loop_item
+        if values:
+            rebind_subtree(iteration, scopes, **values)
+
+    def _rebind_iterations(self, values, start=0):
+        """ Rebind the iterations whose index or item changed.
+
+        The iterations which were kept or reused by key may be bound to
+        another index, or to another item with the same key.
+
+        Parameters
+        ----------
+        values : sequence
+            The items of the iterable.
+
+        start : int, optional
+            The index of the first iteration to check.
+
+        """
+        items = self.items
+        scopes = self._scopes
+        rebind = self._rebind_iteration
+        for index in range(start, len(items)):
+            rebind(items[index], scopes[index], index, values[index])
+
+    def _loop_key(self, item):
+        """ Get the key identifying an item of the iterable.
+
+        """
+        key = self.key
+        if key is not None:
+            return key(item)
+        try:
+            hash(item)
+        except TypeError:
+            return id(item)
+        return item
+
+    def _create_iteration(self, loop_index, loop_item, scopes=None):
+        """ Create the items of one iteration of the loop.
+
+        If a list of scopes is given, the local scopes of the iteration
+        are appended to it.
+
+        """
+        iteration = []
+        for nodes, key, f_locals in self.pattern_nodes:
+            with new_scope(key, f_locals) as f_locals:
+                f_locals['loop_index'] = loop_index
+                f_locals['loop_item'] = loop_item
+                if scopes is not None:
+                    scopes.append(f_locals)
+                for node in nodes:
+                    child = node(None)
+                    if isinstance(child, list):
+                        iteration.extend(child)
+                    else:
+                        iteration.append(child)
+        return iteration
+
+    def _new_iteration(self, loop_index, loop_item):
+        """ Get the items of a new iteration of the loop.
+
+        A recycled iteration is used if available, otherwise the items
+        are created. The bindings of a recycled iteration are evaluated
+        again when it is inserted in the parent.
+
+        Returns
+        -------
+        result : tuple
+            The list of items of the iteration and the list of its local
+            scopes.
+
+        """
+        pool = self._pool
+        if pool is not None:
+            parked = pool.take(None)
+            if parked is not None:
+                iteration, scopes = parked
+                self._recycled.append(
+                    (iteration, scopes, loop_index, loop_item))
+                return (iteration, scopes)
+        scopes = []
+        return (self._create_iteration(loop_index, loop_item, scopes), scopes)
+
+    def _release_iteration(self, iteration, scopes):
+        """ Recycle or destroy the items of an iteration of the loop.
+
+        """
+        if self.recycle > 0:
+            pool = self._pool
+            if pool is None:
+                pool = self._pool = SubtreePool()
+            pool.limit = self.recycle
+            if pool.park(None, iteration, scopes):
+                return
+        for old in iteration:
+            if not old.is_destroyed:
+                old.destroy()
+
+    def _insert_iterations(self, index, count):
+        """ Insert iterations in the parent of the looper.
+
+        The items of the iterations are inserted before the items of the
+        following iteration, or before the looper for the last ones.
+
+        """
+        items = self.items
+        expanded = []
+        for iteration in items[index:index + count]:
+            recursive_expand(iteration, expanded)
+        if not expanded:
+            return
+        before = self
+        for iteration in items[index + count:]:
+            following = []
+            recursive_expand(iteration, following)
+            if following:
+                before = following[0]
+                break
+        self.parent.insert_children(before, expanded)
+        recycled = self._recycled
+        if recycled:
+            self._recycled = []
+            for iteration, scopes, loop_index, loop_item in recycled:
+                rebind_subtree(iteration, scopes, loop_index=loop_index,
+                               loop_item=loop_item)
+                show_subtree(iteration)
+
+
+class VirtualLooper(Looper):
+    """ A looper which only creates the items of a window of its iterable.
+
+    The looper creates at most `window` iterations, starting at the index
+    given by `offset`. When the window moves, the iterations which are
+    no longer in the window are reused for the rows entering it: the
+    `loop_index` and `loop_item` of their scope are updated and the
+    expressions using them are evaluated again. The `key` of the looper
+    is not used.
+
+    This allows to display a long list in a ScrollArea while only
+    creating the widgets of the visible rows. The offset and the window
+    are typically bound to the scroll position and the viewport size of
+    the area, and the rows which are not created are accounted for with
+    the padding of the scroll widget::
+
+        ScrollArea: area:
+            Container:
+                layout_constraints => ():
+                    return [vbox(*self.visible_widgets(), spacing=0)]
+                padding << (looper.first_index * 24, 0,
+                            (looper.row_count - looper.first_index -
+                             len(looper.items)) * 24, 0)
+                VirtualLooper: looper:
+                    iterable << rows
+                    offset << area.scroll_position.y // 24
+                    window << area.viewport_size.height // 24 + 2
+                    Label:
+                        text << loop_item
+                        constraints = [height == 24]
+
+    """
+    #: The index of the first item of the iterable to create.
+    offset = d_(Int())
+
+    #: The maximum number of iterations created by the looper.
+    window = d_(Int(50))
+
+    #: The index of the first created iteration. This is the offset
+    #: clamped to the valid range of the iterable. It is updated by the
+    #: looper and should not be changed by user code.
+    first_index = Int()
+
+    #: The number of items in the iterable. It is updated by the looper
+    #: and should not be changed by user code.
+    row_count = Int()
+
+    #--------------------------------------------------------------------------
+    # Observers
+    #--------------------------------------------------------------------------
+    def _observe_offset(self, change):
+        """ A private observer for the `offset` attribute.
+
+        """
+        if change['type'] == 'update' and self.is_initialized:
+            self.refresh_items()
+
+    def _observe_window(self, change):
+        """ A private observer for the `window` attribute.
+
+        """
+        if change['type'] == 'update' and self.is_initialized:
+            self.refresh_items()
+
+    #--------------------------------------------------------------------------
+    # Pattern API
+    #--------------------------------------------------------------------------
+    def refresh_items(self):
+        """ Refresh the items of the pattern.
+
+        The iterations of the rows which stay in the window are kept, the
+        others are reused for the rows entering the window. Iterations are
+        only created or destroyed when the size of the window changes.
 
         """
-        old_items = self.items[:]
-        old_iter_data = self._iter_data
         iterable = self.iterable
-        pattern_nodes = self.pattern_nodes
-        new_iter_data = sortedmap()
+        if iterable is None or not self.pattern_nodes:
+            values = ()
+        elif isinstance(iterable, Sequence):
+            values = iterable
+        else:
+            values = list(iterable)
+        count = len(values)
+        window = max(self.window, 0)
+        start = min(max(self.offset, 0), max(count - window, 0))
+        stop = min(start + window, count)
+
+        old_items = self.items
+        old_scopes = self._scopes
+        old_start = self.first_index
+        kept = {}
+        free = []
+        for position in range(len(old_items)):
+            index = old_start + position
+            if start <= index < stop:
+                kept[index] = position
+            else:
+                free.append(position)
+        free.reverse()
+
         new_items = []
+        new_scopes = []
+        for index in range(start, stop):
+            loop_item = values[index]
+            position = kept.get(index)
+            if position is None and free:
+                position = free.pop()
+            if position is None:
+                iteration, scopes = self._new_iteration(index, loop_item)
+            else:
+                iteration = old_items[position]
+                scopes = old_scopes[position]
+                self._rebind_iteration(iteration, scopes, index, loop_item)
+            new_items.append(iteration)
+            new_scopes.append(scopes)
 
-        if iterable is not None and len(pattern_nodes) > 0:
-            for loop_index, loop_item in enumerate(iterable):
-                iteration = old_iter_data.get(loop_item)
-                if iteration is not None:
-                    new_iter_data[loop_item] = iteration
-                    new_items.append(iteration)
-                    old_items.remove(iteration)
-                    continue
-                iteration = []
-                new_iter_data[loop_item] = iteration
-                new_items.append(iteration)
-                for nodes, key, f_locals in pattern_nodes:
-                    with new_scope(key, f_locals) as f_locals:
-                        f_locals['loop_index'] = loop_index
-                        f_locals['loop_item'] = loop_item
-                        for node in nodes:
-                            child = node(None)
-                            if isinstance(child, list):
-                                iteration.extend(child)
-                            else:
-                                iteration.append(child)
-
-        for iteration in old_items:
-            for old in iteration:
-                if not old.is_destroyed:
-                    old.destroy()
-
-        if len(new_items) > 0:
-            expanded = []
-            recursive_expand(sum(new_items, []), expanded)
-            self.parent.insert_children(self, expanded)
+        for position in free:
+            self._release_iteration(old_items[position], old_scopes[position])
 
         self.items = new_items
-        self._iter_data = new_iter_data
+        self._scopes = new_scopes
+        self.first_index = start
+        self.row_count = count
+        if new_items != old_items[:len(new_items)]:
+            self._insert_iterations(0, len(new_items))
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _apply_container_change(self, change):
+        """ Reimplemented to refresh the window for any change.
+
+        """
+        self.refresh_items()
 
 
 def recursive_expand(items, expanded):
@@ -8,7 +8,9 @@
 from collections import deque
 import re
 
-from atom.api import Atom, Unicode, Value, List, Event
+from atom.api import Atom, Unicode, Value, List, Event, Typed
+
+from .dynamicscope import invalidate_scope_caches
 
 
 def flag_generator():
@@ -29,6 +31,11 @@ flag_generator = flag_generator()
 DESTROYED_FLAG = next(flag_generator)
 
 
+#: The number of moved children above which `insert_children` filters
+#: the children instead of removing the moved ones one at a time.
+_MAX_REMOVALS = 16
+
+
 def flag_property(flag):
     """ A factory function which creates a flag accessor property.
 
@@ -43,6 +50,265 @@ def flag_property(flag):
     return property(getter, setter)
 
 
+#: The number of enabled name indexes. The trees are only checked for a
+#: name index to update when at least one index is enabled.
+_name_index_count = 0
+
+
+class NameIndex(Atom):
+    """ An index of the named objects of a tree.
+
+    A name index is enabled on the root of a tree with the method
+    'enable_name_index()' of Object. It is kept up to date when objects
+    are added to or removed from the tree and when they are renamed.
+    Objects with an empty name are not indexed.
+
+    The objects with a given name are kept in the breadth first order
+    of the traversal of the tree, so that the first object of the tree
+    with a name is found without comparing all the objects.
+
+    """
+    #: The indexed objects. It maps a name to the list of the objects
+    #: with that name, in the order of the traversal of the tree.
+    _objects = Typed(dict, ())
+
+    #: The positions of the children of the parents of the indexed
+    #: objects. It maps a parent to a dict mapping each child to its
+    #: index. A child appended to its parent is added to the map, and
+    #: a map is built again when it no longer matches the children.
+    _positions = Typed(dict, ())
+
+    def add(self, obj):
+        """ Add an object and its subtree to the index.
+
+        """
+        for item in obj.traverse():
+            name = item.name
+            if name:
+                self._insert(name, item)
+
+    def discard(self, obj):
+        """ Remove an object and its subtree from the index.
+
+        """
+        positions = self._positions
+        for item in obj.traverse():
+            self.rename(item, item.name, u'')
+            positions.pop(item, None)
+
+    def rename(self, obj, old, new):
+        """ Update the index for an object which has been renamed.
+
+        """
+        objects = self._objects
+        if old:
+            named = objects.get(old)
+            if named is not None and obj in named:
+                named.remove(obj)
+                if not named:
+                    del objects[old]
+        if new:
+            self._insert(new, obj)
+
+    def lookup(self, name, regex=False):
+        """ Get the indexed objects with a given name.
+
+        Parameters
+        ----------
+        name : string
+            The name of the objects for which to search.
+
+        regex : bool, optional
+            Whether the given name is a regex string which should be
+            matched against the indexed names.
+
+        Returns
+        -------
+        result : list of Object
+            The indexed objects with the given name, in the order of the
+            traversal of the tree.
+
+        """
+        lists = self.named_lists(name, regex)
+        res = []
+        for named in lists:
+            res.extend(named)
+        if len(lists) > 1:
+            res.sort(key=self.traversal_key)
+        return res
+
+    def named_lists(self, name, regex=False):
+        """ Get the lists of the indexed objects with a given name.
+
+        Parameters
+        ----------
+        name : string
+            The name of the objects for which to search.
+
+        regex : bool, optional
+            Whether the given name is a regex string which should be
+            matched against the indexed names.
+
+        Returns
+        -------
+        result : list of list of Object
+            The lists of the indexed objects with each matching name.
+            Each list is in the order of the traversal of the tree and
+            should not be modified.
+
+        """
+        objects = self._objects
+        if not regex:
+            named = objects.get(name)
+            return [named] if named else []
+        rgx = re.compile(name)
+        return [named for key, named in objects.items() if rgx.match(key)]
+
+    def position(self, obj):
+        """ Get the index of an object in the children of its parent.
+
+        The positions of the children of a parent are computed once and
+        reused until the children of the parent change. The position of
+        a child appended to its parent is added without computing the
+        others again. Returns None if the object is not yet in the
+        children of its parent.
+
+        """
+        parent = obj._parent
+        children = parent._children
+        positions = self._positions.get(parent)
+        if positions is not None:
+            pos = positions.get(obj)
+            if pos is not None and pos < len(children):
+                if children[pos] is obj:
+                    return pos
+            last = len(children) - 1
+            if last >= 0 and children[last] is obj:
+                positions[obj] = last
+                return last
+        positions = dict((child, i) for i, child in enumerate(children))
+        self._positions[parent] = positions
+        return positions.get(obj)
+
+    def traversal_key(self, obj, root=None):
+        """ Get the key ordering an object as in a breadth first traversal.
+
+        Returns None if the object is not in the subtree of the root. By
+        default, the key is computed for the whole tree.
+
+        """
+        path = []
+        while obj is not root:
+            if obj._parent is None:
+                if root is None:
+                    break
+                return None
+            pos = self.position(obj)
+            if pos is None:
+                # The object is being moved to another parent.
+                return None
+            path.append(pos)
+            obj = obj._parent
+        path.reverse()
+        return (len(path), path)
+
+    def _insert(self, name, obj):
+        """ Insert an object in the traversal order of the named objects.
+
+        The objects are most often added in the order of the traversal,
+        so the last object is checked before searching the list. An
+        object appended after a sibling with the same name is appended
+        without computing the keys.
+
+        """
+        objects = self._objects
+        named = objects.get(name)
+        if named is None:
+            objects[name] = [obj]
+            return
+        parent = obj._parent
+        if parent is not None and named[-1]._parent is parent:
+            if parent._children and parent._children[-1] is obj:
+                named.append(obj)
+                return
+        key = self.traversal_key(obj)
+        if self.traversal_key(named[-1]) < key:
+            named.append(obj)
+        else:
+            named.insert(self._bisect(named, key), obj)
+
+    def _bisect(self, named, key, lo=0):
+        """ Get the index of the first named object not before a key.
+
+        """
+        traversal_key = self.traversal_key
+        hi = len(named)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if traversal_key(named[mid]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def first_in_subtree(self, named, root):
+        """ Get the first named object in the traversal of a subtree.
+
+        The objects of a subtree at a given depth are contiguous in the
+        traversal order of the tree. The objects at each depth of the
+        subtree are searched with a bisection, starting with the depth
+        of the root, so that the objects outside of the subtree are not
+        all tested.
+
+        Parameters
+        ----------
+        named : list of Object
+            A list of named objects returned by 'named_lists'.
+
+        root : Object
+            The root of the subtree to search.
+
+        Returns
+        -------
+        result : Object or None
+            The first object of the list in the subtree of the root,
+            in the order of the traversal.
+
+        """
+        depth, path = self.traversal_key(root)
+        level = depth
+        lo = 0
+        while True:
+            bound = (level, path + [0] * (level - depth))
+            lo = self._bisect(named, bound, lo)
+            if lo == len(named):
+                return None
+            obj = named[lo]
+            if _in_subtree(obj, root):
+                return obj
+            # The object follows the subtree at its depth.
+            level = max(level + 1, self.traversal_key(obj)[0])
+
+
+def _tree_name_index(obj):
+    """ Get the name index of the tree of an object, if any.
+
+    """
+    if _name_index_count:
+        return obj.root_object()._name_index
+
+
+def _in_subtree(obj, root):
+    """ Get whether an object is in the subtree of a root.
+
+    """
+    while obj is not None:
+        if obj is root:
+            return True
+        obj = obj._parent
+    return False
+
+
 class Object(Atom):
     """ The most base class of the Enaml object hierarchy.
 
@@ -80,6 +346,7 @@ class Object(Atom):
     _parent = Value()   # Object or None
     _children = List()  # list of Object
     _flags = Value(0)   # object flags
+    _name_index = Value()   # NameIndex or None, only set on a root
 
     def __init__(self, parent=None, **kwargs):
         """ Initialize an Object.
@@ -110,6 +377,8 @@ class Object(Atom):
         self.is_destroyed = True
         self.destroyed()
         self.unobserve()
+        if _name_index_count:
+            self._release_name_index()
         for child in self._children:
             child.destroy()
         del self._children
@@ -117,6 +386,7 @@ class Object(Atom):
         if parent is not None:
             if parent.is_destroyed:
                 self._parent = None
+                invalidate_scope_caches()
             else:
                 self.set_parent(None)
 
@@ -151,12 +421,16 @@ class Object(Atom):
         if parent is not None and not isinstance(parent, Object):
             raise TypeError('parent must be an Object or None')
         self._parent = parent
+        invalidate_scope_caches()
         self.parent_changed(old_parent, parent)
         if old_parent is not None:
-            old_parent._children.remove(self)
+            old_parent._remove_child(self)
             old_parent.child_removed(self)
         if parent is not None:
             parent._children.append(self)
+        if _name_index_count:
+            self._move_name_index(old_parent, parent)
+        if parent is not None:
             parent.child_added(self)
 
     def insert_children(self, before, insert):
@@ -199,35 +473,146 @@ class Object(Atom):
             except IndexError:
                 before = None
 
-        new = []
-        added = False
-        for child in self._children:
-            if child in insert_set:
-                insert_set.remove(child)
-                continue
-            if child is before:
-                new.extend(insert_list)
-                added = True
-            new.append(child)
-        if not added:
-            new.extend(insert_list)
+        # The children already parented by this object are moved. The
+        # parent pointer is used to find them instead of scanning the
+        # children. The new children are then inserted with a single
+        # slice assignment, which is an append when there is no marker.
+        moved = [child for child in insert_list if child._parent is self]
 
+        reparented = []
         for child in insert_list:
             old_parent = child._parent
             if old_parent is not self:
                 child._parent = self
+                invalidate_scope_caches()
+                reparented.append((child, old_parent))
                 child.parent_changed(old_parent, self)
                 if old_parent is not None:
+                    old_parent._remove_child(child)
                     old_parent.child_removed(child)
 
-        self._children = new
+        children = self._children
+        if moved:
+            if len(moved) <= _MAX_REMOVALS:
+                for child in moved:
+                    children.remove(child)
+            else:
+                moved_set = set(moved)
+                children[:] = [c for c in children if c not in moved_set]
+        if before is None or before in insert_set:
+            index = len(children)
+        elif children and children[-1] is before:
+            index = len(children) - 1
+        else:
+            try:
+                index = children.index(before)
+            except ValueError:
+                index = len(children)
+        children[index:index] = insert_list
+
+        # The name indexes are updated once the children are in place,
+        # since the index orders the objects by their position.
+        if _name_index_count:
+            for child, old_parent in reparented:
+                child._move_name_index(old_parent, self)
+            if moved:
+                name_index = self.root_object()._name_index
+                if name_index is not None:
+                    for child in moved:
+                        name_index.discard(child)
+                    for child in moved:
+                        name_index.add(child)
+
         child_added = self.child_added
         child_moved = self.child_moved
-        for child in insert_list:
-            if child in insert_set:
+        if not moved:
+            for child in insert_list:
                 child_added(child)
-            else:
-                child_moved(child)
+        else:
+            moved_set = set(moved)
+            for child in insert_list:
+                if child in moved_set:
+                    child_moved(child)
+                else:
+                    child_added(child)
+
+    def enable_name_index(self):
+        """ Enable the name index of the tree of this object.
+
+        The index is stored on the root of the tree and is kept up to
+        date as the tree changes. The 'find' and 'find_all' methods
+        then look up the index instead of traversing the tree. The index
+        is discarded when the root is parented or destroyed.
+
+        """
+        global _name_index_count
+        root = self.root_object()
+        if root._name_index is None:
+            index = NameIndex()
+            index.add(root)
+            root._name_index = index
+            _name_index_count += 1
+
+    def disable_name_index(self):
+        """ Disable the name index of the tree of this object.
+
+        """
+        self.root_object()._discard_name_index()
+
+    def _move_name_index(self, old_parent, new_parent):
+        """ Update the name indexes when this object is reparented.
+
+        This is called after the object has been added to the children
+        of its new parent.
+
+        """
+        if old_parent is not None:
+            index = old_parent.root_object()._name_index
+            if index is not None:
+                index.discard(self)
+        else:
+            self._discard_name_index()
+        if new_parent is not None:
+            index = new_parent.root_object()._name_index
+            if index is not None:
+                index.add(self)
+
+    def _discard_name_index(self):
+        """ Discard the name index stored on this object, if any.
+
+        """
+        global _name_index_count
+        if self._name_index is not None:
+            self._name_index = None
+            _name_index_count -= 1
+
+    def _release_name_index(self):
+        """ Remove this object from the name index of its tree.
+
+        This is called when the object is destroyed, before its children
+        are destroyed.
+
+        """
+        parent = self._parent
+        if parent is None:
+            self._discard_name_index()
+        elif not parent.is_destroyed:
+            index = parent.root_object()._name_index
+            if index is not None:
+                index.discard(self)
+
+    def _remove_child(self, child):
+        """ Remove a child from the children of this object.
+
+        The last child is checked before searching the children, since
+        children are often removed from the end.
+
+        """
+        children = self._children
+        if children and children[-1] is child:
+            children.pop()
+        else:
+            children.remove(child)
 
     def parent_changed(self, old, new):
         """ A method invoked when the parent of the object changes.
@@ -366,6 +751,9 @@ class Object(Atom):
             object is found with the given name.
 
         """
+        index = _tree_name_index(self)
+        if index is not None and self._indexed_name(name, regex):
+            return self._index_find(index, name, regex)
         if regex:
             rgx = re.compile(name)
             match = lambda n: bool(rgx.match(n))
@@ -400,6 +788,9 @@ class Object(Atom):
             list if no objects are found with the given name.
 
         """
+        index = _tree_name_index(self)
+        if index is not None and self._indexed_name(name, regex):
+            return self._index_lookup(index, name, regex)
         if regex:
             rgx = re.compile(name)
             match = lambda n: bool(rgx.match(n))
@@ -411,3 +802,68 @@ class Object(Atom):
             if match(obj.name):
                 push(obj)
         return res
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _observe_name(self, change):
+        """ Update the name index of the tree when the object is renamed.
+
+        """
+        if _name_index_count:
+            index = self.root_object()._name_index
+            if index is not None:
+                old = change.get('oldvalue', u'') or u''
+                index.rename(self, old, change['value'])
+
+    @staticmethod
+    def _indexed_name(name, regex):
+        """ Get whether the objects matching a name are all indexed.
+
+        Objects with an empty name are not indexed, so a name matching
+        the empty string requires a traversal of the tree.
+
+        """
+        if regex:
+            return re.match(name, u'') is None
+        return bool(name)
+
+    def _index_find(self, index, name, regex):
+        """ Find the first object of the subtree with a name using an index.
+
+        The indexed objects are in the order of the traversal, so the
+        first object of the subtree with each matching name is found
+        without testing the others, and only these are compared.
+
+        """
+        root = self._parent is None
+        found = []
+        for named in index.named_lists(name, regex):
+            if root:
+                found.append(named[0])
+            else:
+                obj = index.first_in_subtree(named, self)
+                if obj is not None:
+                    found.append(obj)
+        if len(found) < 2:
+            return found[0] if found else None
+        return min(found, key=index.traversal_key)
+
+    def _index_lookup(self, index, name, regex):
+        """ Find the objects of the subtree with a name using an index.
+
+        The objects are returned in the breadth first order used by the
+        traversal of the tree.
+
+        """
+        root = self._parent is None
+        res = []
+        lists = index.named_lists(name, regex)
+        for named in lists:
+            if root:
+                res.extend(named)
+            else:
+                res.extend(obj for obj in named if _in_subtree(obj, self))
+        if len(lists) > 1:
+            res.sort(key=index.traversal_key)
+        return res
@@ -46,6 +46,153 @@ def optimize_locals(codelist):
             codelist[idx] = (DELETE_FAST, op_arg)  # py2.6 list comps
 
 
+def simple_code(code):
+    """ Transform a code object for use by a simple function.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code object created by the Enaml compiler.
+
+    Returns
+    -------
+    result : CodeType
+        A new code object with optimized local variable access.
+
+    """
+    bp_code = Code.from_code(code)
+    optimize_locals(bp_code.code)
+    bp_code.newlocals = False
+    return bp_code.to_code()
+
+
+def tracer_code(code):
+    """ Transform a code object for use by a trace function.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code object created by the Enaml compiler.
+
+    Returns
+    -------
+    result : CodeType
+        A new code object with optimized local variable access
+        and instrumentation for invoking a code tracer.
+
+    """
+    bp_code = Code.from_code(code)
+    optimize_locals(bp_code.code)
+    bp_code.code = inject_tracing(bp_code.code)
+    bp_code.newlocals = False
+    bp_code.args = ('_[tracer]',) + bp_code.args
+    return bp_code.to_code()
+
+
+def inverter_code(code):
+    """ Transform a code object for use by an inverter function.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code object created by the Enaml compiler.
+
+    Returns
+    -------
+    result : CodeType
+        A new code object with optimized local variable access
+        and instrumentation for inverting the operation.
+
+    """
+    bp_code = Code.from_code(code)
+    optimize_locals(bp_code.code)
+    bp_code.code = inject_inversion(bp_code.code)
+    bp_code.newlocals = False
+    bp_code.args = ('_[inverter]', '_[value]') + bp_code.args
+    return bp_code.to_code()
+
+
+#: The code transformations used by the standard operators.
+CODE_TRANSFORMS = {
+    'simple': simple_code,
+    'tracer': tracer_code,
+    'inverter': inverter_code,
+}
+
+
+#: The code transformations required by each standard operator. The
+#: Enaml compiler applies them ahead of time so that the transformed
+#: code objects are stored in the .enamlc cache.
+OPERATOR_TRANSFORMS = {
+    '=': ('simple',),
+    '::': ('simple',),
+    '>>': ('inverter',),
+    '<<': ('tracer',),
+    ':=': ('tracer', 'inverter'),
+}
+
+
+#: The code object of the operator being run and the dict of its code
+#: objects transformed ahead of time by the Enaml compiler, keyed by
+#: transformation kind. See `compiled_code`.
+_compiled_code = (None, None)
+
+
+@contextmanager
+def compiled_code(code, compiled):
+    """ Provide the transformed code objects to the running operator.
+
+    The transformed code objects are matched with the code object by
+    identity. Code objects from different files may compare equal.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code object created by the Enaml compiler.
+
+    compiled : tuple
+        A tuple of (kind, code) pairs holding the result of the code
+        transformations in `CODE_TRANSFORMS` applied to the code.
+
+    """
+    global _compiled_code
+    old = _compiled_code
+    _compiled_code = (code, dict(compiled))
+    try:
+        yield
+    finally:
+        _compiled_code = old
+
+
+def transform_code(code, kind):
+    """ Get the transformed version of a code object.
+
+    The code object transformed by the compiler for the running
+    operator is used if available, otherwise the transformation is
+    applied.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code object created by the Enaml compiler.
+
+    kind : str
+        The kind of transformation to apply. It must be a key of
+        `CODE_TRANSFORMS`.
+
+    Returns
+    -------
+    result : CodeType
+        The transformed code object.
+
+    """
+    current, compiled = _compiled_code
+    new_code = compiled.get(kind) if current is code else None
+    if new_code is None:
+        new_code = CODE_TRANSFORMS[kind](code)
+    return new_code
+
+
 def gen_simple(code, f_globals):
     """ Generate a simple function from a code object.
 
@@ -63,11 +210,7 @@ def gen_simple(code, f_globals):
         A new function with optimized local variable access.
 
     """
-    bp_code = Code.from_code(code)
-    optimize_locals(bp_code.code)
-    bp_code.newlocals = False
-    new_code = bp_code.to_code()
-    return FunctionType(new_code, f_globals)
+    return FunctionType(transform_code(code, 'simple'), f_globals)
 
 
 def gen_tracer(code, f_globals):
@@ -88,13 +231,7 @@ def gen_tracer(code, f_globals):
         and instrumentation for invoking a code tracer.
 
     """
-    bp_code = Code.from_code(code)
-    optimize_locals(bp_code.code)
-    bp_code.code = inject_tracing(bp_code.code)
-    bp_code.newlocals = False
-    bp_code.args = ('_[tracer]',) + bp_code.args
-    new_code = bp_code.to_code()
-    return FunctionType(new_code, f_globals)
+    return FunctionType(transform_code(code, 'tracer'), f_globals)
 
 
 def gen_inverter(code, f_globals):
@@ -115,13 +252,7 @@ def gen_inverter(code, f_globals):
         and instrumentation for inverting the operation.
 
     """
-    bp_code = Code.from_code(code)
-    optimize_locals(bp_code.code)
-    bp_code.code = inject_inversion(bp_code.code)
-    bp_code.newlocals = False
-    bp_code.args = ('_[inverter]', '_[value]') + bp_code.args
-    new_code = bp_code.to_code()
-    return FunctionType(new_code, f_globals)
+    return FunctionType(transform_code(code, 'inverter'), f_globals)
 
 
 def op_simple(code, scope_key, f_globals):
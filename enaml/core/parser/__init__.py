@@ -10,29 +10,42 @@ import sys
 from .base_parser import ParsingError
 
 py_version = sys.version_info
-if py_version < (3,):
-    from .parser2 import Python2EnamlParser
-    _parser = Python2EnamlParser()
-else:
-    if py_version[1] < 3:
-        raise ImportError('Python < 3.3 is not supported')
-    elif py_version[1] == 3:
-        from .parser3 import Python3EnamlParser
-        _parser = Python3EnamlParser()
-    elif py_version[1] == 4:
-        from .parser34 import Python34EnamlParser
-        _parser = Python34EnamlParser()
-    elif py_version[1] == 5:
-        from .parser35 import Python35EnamlParser
-        _parser = Python35EnamlParser()
-    else:
-        from .parser36 import Python36EnamlParser
-        _parser = Python36EnamlParser()
+if py_version >= (3,) and py_version[1] < 3:
+    raise ImportError('Python < 3.3 is not supported')
+
+
+#: The parser instance, created on the first call to get_parser. Building
+#: the parser loads the lexer and parser tables, which is not needed when
+#: all the modules are loaded from their cache.
+_parser = None
+
+
+def get_parser():
+    """ Get the enaml parser for the running version of Python.
+
+    The parser is created on the first call.
+
+    """
+    global _parser
+    if _parser is None:
+        if py_version < (3,):
+            from .parser2 import Python2EnamlParser as parser_class
+        elif py_version[1] == 3:
+            from .parser3 import Python3EnamlParser as parser_class
+        elif py_version[1] == 4:
+            from .parser34 import Python34EnamlParser as parser_class
+        elif py_version[1] == 5:
+            from .parser35 import Python35EnamlParser as parser_class
+        else:
+            from .parser36 import Python36EnamlParser as parser_class
+        _parser = parser_class()
+    return _parser
 
 
 def write_tables():
-    _parser.lexer().write_tables()
-    _parser.write_tables()
+    parser = get_parser()
+    parser.lexer().write_tables()
+    parser.write_tables()
 
 
 def parse(enaml_source, filename='Enaml'):
@@ -45,6 +58,6 @@ def parse(enaml_source, filename='Enaml'):
     # stop parsing immediately and then re-raise the errors outside
     # of the control of Ply.
     try:
-        return _parser.parse(enaml_source, filename)
+        return get_parser().parse(enaml_source, filename)
     except ParsingError as parse_error:
         raise parse_error()
@@ -500,9 +500,7 @@ class BaseEnamlLexer(object):
 
         _lex_dir, _lex_module = self._tables_location()
 
-        self.tokens = (self.delimiters +
-                       tuple(val[1] for val in self.operators) +
-                       tuple(self.reserved.values()))
+        self.tokens = self.token_names()
 
         self.lexer = lex.lex(
             module=self, outputdir=_lex_dir, lextab=_lex_module,
@@ -521,6 +519,15 @@ class BaseEnamlLexer(object):
         # that function, we add it as an attribute on both lexers.
         self.lexer.filename = filename
 
+    @classmethod
+    def token_names(cls):
+        """Get the names of the tokens produced by the lexer.
+
+        """
+        return (cls.delimiters +
+                tuple(val[1] for val in cls.operators) +
+                tuple(cls.reserved.values()))
+
     def write_tables(self):
         """Write the lexer tables.
 
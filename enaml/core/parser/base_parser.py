@@ -158,7 +158,9 @@ class BaseEnamlParser(object):
     lexer = BaseEnamlLexer
 
     def __init__(self):
-        self.tokens = self.lexer().tokens
+        # The tokens are read from the lexer class to avoid building a
+        # lexer which would not be used.
+        self.tokens = self.lexer.token_names()
         # Get a save directory for the lex and parse tables
         parse_dir, parse_mod = self._tables_location()
         self.parser = yacc.yacc(
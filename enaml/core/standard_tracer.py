@@ -9,6 +9,7 @@ from atom.api import Atom, atomref
 
 from .alias import Alias
 from .code_tracing import CodeTracer
+from .expression_engine import defer_update
 from ..compat import IS_PY3, basestring
 
 
@@ -50,14 +51,71 @@ class SubscriptionObserver(object):
         """ The handler for the change notification.
 
         This will be invoked by the Atom observer mechanism when the
-        item which is being observed changes.
+        item which is being observed changes. The update is deferred
+        if an update batch is active. See also: `batch_updates`.
+
+        The update is delayed while the owner is parked for reuse: the
+        name is recorded and the binding is evaluated again when the
+        owner is reused.
+
+        A container modified in place is still the value of the bound
+        attribute, in which case Atom does not notify the attribute
+        observers. For the attributes which handle the container changes,
+        the change is forwarded to them instead.
 
         """
         if self.ref:
             owner = self.ref()
             engine = owner._d_engine
-            if engine is not None:
-                engine.update(owner, self.name)
+            if engine is None:
+                return
+            name = self.name
+            if owner.is_parked:
+                stale = owner._d_stale
+                if stale is None:
+                    owner._d_stale = set([name])
+                else:
+                    stale.add(name)
+                return
+            if not defer_update(owner, name):
+                engine.update(owner, name)
+            if change['type'] == 'container':
+                forward_container_change(owner, name, change)
+
+
+def forward_container_change(owner, name, change):
+    """ Forward a container change to the observers of an attribute.
+
+    The change is only forwarded for the members tagged with the
+    'd_container_changes' metadata, such as the iterable of a Looper,
+    and if the attribute holds the container which was modified. The
+    other bindings are only updated.
+
+    Parameters
+    ----------
+    owner : Declarative
+        The declarative object owning the attribute.
+
+    name : string
+        The name of the attribute.
+
+    change : dict
+        The container change emitted by Atom.
+
+    """
+    member = owner.get_member(name)
+    if member is None:
+        return
+    metadata = member.metadata
+    if not metadata or not metadata.get('d_container_changes'):
+        return
+    if member.do_getattr(owner) is not change['value']:
+        return
+    change = dict(change)
+    change['object'] = owner
+    change['name'] = name
+    member.notify(owner, change)
+    owner.notify(name, change)
 
 
 class StandardTracer(CodeTracer):
@@ -104,26 +162,53 @@ class StandardTracer(CodeTracer):
     def finalize(self):
         """ Finalize the tracing process.
 
-        This method will discard the old observer and attach a new
-        observer to the traced dependencies.
+        This method will update the subscriptions of the observer for
+        the traced dependencies. The observer and the dependency set
+        from the previous evaluation are reused, so that only the items
+        which were added or removed since the last evaluation are
+        subscribed or unsubscribed.
 
         """
         owner = self.owner
         name = self.name
         key = '_[%s|trace]' % name
+        items_key = '_[%s|trace_items]' % name
         storage = owner._d_storage
-
-        # invalidate the old observer so that it can be collected
+        # The tracer can be finalized several times during an evaluation
+        # (by nested comprehensions), so a snapshot of the items is used.
+        items = frozenset(self.items)
         old_observer = storage.get(key)
-        if old_observer is not None:
-            old_observer.ref = None
+        old_items = storage.get(items_key)
+
+        # the common case: the dependencies did not change
+        if old_observer is not None and old_items == items:
+            return
+
+        # no more dependencies, drop the old observer entirely
+        if not items:
+            if old_observer is not None:
+                old_observer.ref = None
+                for obj, d_name in old_items:
+                    obj.unobserve(d_name, old_observer)
+                del storage[key]
+                del storage[items_key]
+            return
 
         # create a new observer and subscribe it to the dependencies
-        if self.items:
+        if old_observer is None:
             observer = SubscriptionObserver(owner, name)
             storage[key] = observer
-            for obj, d_name in self.items:
+            storage[items_key] = items
+            for obj, d_name in items:
                 obj.observe(d_name, observer)
+            return
+
+        # only subscribe or unsubscribe the changed dependencies
+        for obj, d_name in old_items - items:
+            obj.unobserve(d_name, old_observer)
+        for obj, d_name in items - old_items:
+            obj.observe(d_name, old_observer)
+        storage[items_key] = items
 
     #--------------------------------------------------------------------------
     # AbstractScopeListener Interface
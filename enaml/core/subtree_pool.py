@@ -0,0 +1,179 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+from atom.api import Atom, Int, Typed
+
+
+def set_parked(items, parked):
+    """ Set the parked flag of every declarative object of a subtree.
+
+    """
+    for item in items:
+        for obj in item.traverse():
+            if hasattr(obj, 'is_parked'):
+                obj.is_parked = parked
+
+
+def rebind_subtree(items, scopes=(), **values):
+    """ Update the scope of a subtree and evaluate its bindings again.
+
+    Only the bindings which may be out of date are evaluated: the
+    subscriptions which fired while the subtree was parked, and the
+    expressions which refer to one of the changed names of the scope.
+    An attribute updated that way is itself a changed name for the
+    expressions of the following objects, so that the expressions
+    reading an attribute of an ancestor are updated as well. The other
+    expressions, in particular the '=' initializers which do not depend
+    on the changed names, are not evaluated again, so that the state of
+    the subtree is kept.
+
+    Parameters
+    ----------
+    items : list
+        The root objects of the subtree.
+
+    scopes : iterable, optional
+        The local scope mappings of the subtree to update.
+
+    **values
+        The names and values to set in the local scopes.
+
+    """
+    for scope in scopes:
+        for name, value in values.items():
+            scope[name] = value
+    objects = []
+    for item in items:
+        objects.extend(item.traverse())
+    names = set(values)
+    for obj in objects:
+        engine = getattr(obj, '_d_engine', None)
+        if engine is None or obj.is_destroyed:
+            continue
+        stale = obj._d_stale
+        if stale is not None:
+            del obj._d_stale
+            for name in stale:
+                engine.update(obj, name)
+        if names:
+            names.update(engine.update_dependents(obj, names))
+
+
+def show_subtree(items):
+    """ Show again the visible widgets of a reinserted subtree.
+
+    A toolkit widget is hidden when it is detached from its parent.
+
+    """
+    for item in items:
+        if getattr(item, 'visible', False) and hasattr(item, 'show'):
+            item.show()
+
+
+class SubtreePool(Atom):
+    """ A pool of detached subtrees waiting to be reused.
+
+    The subtrees are parked under the key of the compiler node which
+    generated them, along with the state needed to rebind them, such as
+    their local scopes. Reusing a subtree avoids creating and activating
+    its objects again, at the cost of keeping it alive while parked.
+
+    The subscriptions of a parked subtree are not updated, since its
+    objects are detached from their parent. The ones which fired are
+    evaluated with `rebind_subtree` when the subtree is reused.
+
+    """
+    #: The maximum number of subtrees parked under a key.
+    limit = Int(16)
+
+    #: The parked subtrees. It maps a key to a list of (items, state)
+    #: tuples.
+    _parked = Typed(dict, ())
+
+    def park(self, key, items, state=None):
+        """ Detach a subtree and park it for reuse.
+
+        Parameters
+        ----------
+        key : object
+            The key of the compiler node which generated the subtree.
+
+        items : list
+            The root objects of the subtree.
+
+        state : object, optional
+            The state to return along with the items when reused.
+
+        Returns
+        -------
+        result : bool
+            Whether the subtree was parked. If the pool is full, the
+            subtree is left untouched and should be destroyed.
+
+        """
+        parked = self._parked.setdefault(key, [])
+        if len(parked) >= self.limit:
+            return False
+        if any(item.is_destroyed for item in items):
+            return False
+        set_parked(items, True)
+        for item in items:
+            item.set_parent(None)
+        parked.append((items, state))
+        return True
+
+    def take(self, key):
+        """ Take a parked subtree for reuse.
+
+        Parameters
+        ----------
+        key : object
+            The key of the compiler node which generated the subtree.
+
+        Returns
+        -------
+        result : tuple or None
+            The (items, state) tuple of a parked subtree or None if no
+            subtree is parked under the key.
+
+        """
+        parked = self._parked.get(key)
+        if parked:
+            items, state = parked.pop()
+            set_parked(items, False)
+            return (items, state)
+
+    def count(self):
+        """ Get the number of parked subtrees.
+
+        """
+        return sum(len(parked) for parked in self._parked.values())
+
+    def object_count(self):
+        """ Get the number of objects in the parked subtrees.
+
+        This is the number of objects kept alive by the pool.
+
+        """
+        count = 0
+        for subtrees in self._parked.values():
+            for items, _ in subtrees:
+                for item in items:
+                    count += sum(1 for _ in item.traverse())
+        return count
+
+    def clear(self):
+        """ Destroy all the parked subtrees.
+
+        """
+        parked = self._parked
+        self._parked = {}
+        for subtrees in parked.values():
+            for items, _ in subtrees:
+                for item in items:
+                    if not item.is_destroyed:
+                        item.destroy()
@@ -25,6 +25,14 @@ CONTENT_BOUNDARY_ATTRS = (
 )
 
 
+VARIABLE_ATTRS = (
+    'left',
+    'top',
+    'width',
+    'height',
+)
+
+
 class BoxHelper(ConstraintHelper, ConstrainableMixin):
     """ A constraint helper for creating a box layouts.
 
@@ -45,3 +53,60 @@ class BoxHelper(ConstraintHelper, ConstrainableMixin):
             f = lambda a, b: getattr(self, a) == getattr(component, b)
             cns.extend(f(a, b) for a, b in zip(a_attrs, b_attrs))
         return cns
+
+    def box_key(self, key):
+        """ Complete the cache key of the constraints of the box.
+
+        The variables of a box are only referred to by its own
+        constraints until they are accessed from outside, which can
+        only be after they were created. The identity of a box whose
+        variables were created is therefore added to its key, so that
+        its constraints are not reused in place of another box.
+
+        Parameters
+        ----------
+        key : tuple
+            The key identifying the configuration and items of the box.
+
+        Returns
+        -------
+        result : tuple
+            The cache key of the constraints of the box.
+
+        """
+        if self.variables_created():
+            key += (id(self),)
+        return key
+
+    def variables_created(self):
+        """ Get whether the variables of the box have been created.
+
+        The variables are created when they are first accessed.
+
+        """
+        for name in VARIABLE_ATTRS:
+            if self.get_member(name).get_slot(self) is not None:
+                return True
+        return False
+
+    def adopt_variables(self, other):
+        """ Use the variables of another box of the same type.
+
+        The generated constraints which do not depend on the changes
+        between the boxes are then equal to the constraints of the
+        other box, which keeps a solver update small. This has no
+        effect if the variables of this box have been created.
+
+        Parameters
+        ----------
+        other : BoxHelper
+            The box whose constraints were generated previously.
+
+        """
+        if type(other) is not type(self) or self.variables_created():
+            return
+        for name in VARIABLE_ATTRS:
+            member = self.get_member(name)
+            value = member.get_slot(other)
+            if value is not None:
+                member.set_slot(self, value)
@@ -7,6 +7,7 @@
 #------------------------------------------------------------------------------
 from atom.api import Atom
 
+from .spacers import Spacer
 from .strength_member import StrengthMember
 
 
@@ -74,6 +75,83 @@ class ConstraintHelper(Atom):
             cns = [cn | strength for cn in cns]
         return cns
 
+    def cache_key(self):
+        """ Get a key identifying the constraints of the helper.
+
+        Two helpers with the same key generate interchangeable
+        constraints for a given component, so the constraints of one
+        can be reused in place of the other. The default helper cannot
+        be cached. Subclasses should reimplement this method as needed.
+
+        Returns
+        -------
+        result : hashable or None
+            The key of the generated constraints, or None if the
+            constraints cannot be reused.
+
+        """
+        return None
+
+    def nested_helpers(self):
+        """ Get the helpers given as items to this helper.
+
+        The default helper has no nested helpers. Subclasses should
+        reimplement this method as needed.
+
+        Returns
+        -------
+        result : list
+            The list of the nested helpers, in order.
+
+        """
+        return []
+
+    @staticmethod
+    def item_key(item):
+        """ Get a key identifying an item of a helper.
+
+        Spacers, ints and None are identified by their value, helpers
+        by their cache key and other items by their identity. Whoever
+        stores the key must also keep the items alive.
+
+        Parameters
+        ----------
+        item : object
+            The item given to the helper.
+
+        Returns
+        -------
+        result : hashable or None
+            The key of the item, or None if the item is a helper which
+            cannot be cached.
+
+        """
+        if item is None:
+            return (None,)
+        if isinstance(item, int):
+            return (int, item)
+        if isinstance(item, Spacer):
+            return item.cache_key()
+        if isinstance(item, ConstraintHelper):
+            return item.cache_key()
+        return id(item)
+
+    @classmethod
+    def items_key(cls, items):
+        """ Get a key identifying a sequence of items of a helper.
+
+        Returns
+        -------
+        result : tuple or None
+            The tuple of the keys of the items, or None if one of the
+            items cannot be cached.
+
+        """
+        keys = tuple(cls.item_key(item) for item in items)
+        if None in keys:
+            return None
+        return keys
+
     def constraints(self, component):
         """ Generate the constraints for the given component.
 
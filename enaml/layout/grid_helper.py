@@ -7,7 +7,7 @@
 #------------------------------------------------------------------------------
 from collections import defaultdict
 
-from atom.api import Atom, Coerced, Int, Range, Str, Tuple, Value
+from atom.api import Atom, Coerced, Int, List, Range, Str, Tuple, Value
 
 import kiwisolver as kiwi
 
@@ -44,6 +44,12 @@ class GridHelper(BoxHelper):
     #: The margins to add around boundary of the grid.
     margins = Coerced(Box)
 
+    #: The row variables of the grid, created as needed.
+    _row_vars = List()
+
+    #: The column variables of the grid, created as needed.
+    _col_vars = List()
+
     class _Cell(Atom):
         """ A private class used by a GridHelper to track item cells.
 
@@ -172,6 +178,53 @@ class GridHelper(BoxHelper):
             valid_rows.append(tuple(row))
         return tuple(valid_rows)
 
+    def cache_key(self):
+        """ Get a key identifying the constraints of the grid.
+
+        """
+        rows = tuple(self.items_key(row) for row in self.rows)
+        if None in rows:
+            return None
+        key = (type(self), self.row_align, self.row_spacing,
+               self.column_align, self.column_spacing, self.margins,
+               self.strength, rows)
+        return self.box_key(key)
+
+    def adopt_variables(self, other):
+        """ Use the variables of another grid.
+
+        This reimplementation also adopts the row and column variables
+        of the other grid. The variables are only adopted if the grids
+        have the same number of rows and columns: adding a variable to
+        the chain of ordered row or column variables of a solved system
+        is slower than building the system again.
+
+        """
+        if type(other) is not type(self) or self._shape() != other._shape():
+            return
+        if not self.variables_created():
+            self._row_vars = list(other._row_vars)
+            self._col_vars = list(other._col_vars)
+        super(GridHelper, self).adopt_variables(other)
+
+    def _shape(self):
+        """ Get the number of rows and columns of the grid.
+
+        """
+        rows = self.rows
+        return (len(rows), max(len(row) for row in rows) if rows else 0)
+
+    def nested_helpers(self):
+        """ Get the helpers given as items to this helper.
+
+        """
+        helpers = []
+        for row in self.rows:
+            for item in row:
+                if isinstance(item, ConstraintHelper) and item not in helpers:
+                    helpers.append(item)
+        return helpers
+
     def constraints(self, component):
         """ Generate the grid constraints for the given component.
 
@@ -207,16 +260,19 @@ class GridHelper(BoxHelper):
                     cell_map[item] = cell
                     cells.append(cell)
 
-        # Create the row and column variables and their default limits.
-        row_vars = []
-        col_vars = []
-        for idx in range(num_rows + 1):
-            var = kiwi.Variable('row%d' % idx)
-            row_vars.append(var)
+        # Create the missing row and column variables and add their
+        # default limits.
+        row_vars = self._row_vars
+        for idx in range(len(row_vars), num_rows + 1):
+            row_vars.append(kiwi.Variable('row%d' % idx))
+        col_vars = self._col_vars
+        for idx in range(len(col_vars), num_cols + 1):
+            col_vars.append(kiwi.Variable('col%d' % idx))
+        row_vars = row_vars[:num_rows + 1]
+        col_vars = col_vars[:num_cols + 1]
+        for var in row_vars:
             cns.append(var >= 0)
-        for idx in range(num_cols + 1):
-            var = kiwi.Variable('col%d' % idx)
-            col_vars.append(var)
+        for var in col_vars:
             cns.append(var >= 0)
 
         # Add the neighbor constraints for the row and column vars.
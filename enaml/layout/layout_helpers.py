@@ -5,6 +5,9 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
+from atom.api import Atom, Dict, List
+
+from .box_helper import BoxHelper
 from .constraint_helper import ConstraintHelper
 from .factory_helper import FactoryHelper
 from .grid_helper import GridHelper
@@ -129,7 +132,131 @@ def grid(*rows, **config):
     return GridHelper(rows, **config)
 
 
-def expand_constraints(component, constraints):
+class ConstraintCache(Atom):
+    """ A cache of the constraints generated by the helpers of a
+    component.
+
+    The constraints generated by a helper are reused for a helper with
+    the same cache key on the next expansion, so an unchanged helper
+    yields the same constraint objects. A box helper which misses the
+    cache, and the box helpers nested in it, adopt the variables of the
+    box helpers which were at the same position and are no longer used,
+    so only the constraints depending on the changes differ. The entries
+    which are not used by an expansion are discarded.
+
+    """
+    #: The helpers and their constraints of the last expansion, keyed
+    #: by the cache key of the helpers.
+    _entries = Dict()
+
+    #: The helpers of the last expansion, in order.
+    _helpers = List()
+
+    def expand(self, component, constraints):
+        """ Expand the helpers in a list of constraints.
+
+        Parameters
+        ----------
+        component : Constrainable
+            The constrainable component with which the constraints are
+            associated.
+
+        constraints : list
+            The list of constraints to expand.
+
+        Returns
+        -------
+        result : list
+            The list of expanded constraints.
+
+        """
+        # Look up the helpers first, so that a box does not adopt the
+        # variables of a helper which is used by this expansion. A key
+        # or an entry repeated in an expansion generates new constraints,
+        # since a solver cannot hold the same constraint twice.
+        cached = self._entries
+        keys = set()
+        reused = set()
+        lookups = []
+        for cn in constraints:
+            if isinstance(cn, ConstraintHelper):
+                key = cn.cache_key()
+                entry = None
+                if key in keys:
+                    key = None
+                elif key is not None:
+                    keys.add(key)
+                    entry = cached.get(key)
+                    if entry is not None:
+                        if id(entry[0]) in reused:
+                            key = entry = None
+                        else:
+                            reused.add(id(entry[0]))
+                lookups.append((cn, key, entry))
+            elif cn is not None:
+                lookups.append((cn, None, None))
+
+        used = set()
+        for cn, key, entry in lookups:
+            if isinstance(cn, ConstraintHelper):
+                _add_helpers(entry[0] if entry else cn, used)
+
+        previous = self._helpers
+        entries = {}
+        helpers = []
+        cns = []
+        for cn, key, entry in lookups:
+            if not isinstance(cn, ConstraintHelper):
+                cns.append(cn)
+                continue
+            if entry is None:
+                index = len(helpers)
+                if index < len(previous):
+                    _adopt_variables(cn, previous[index], used)
+                entry = (cn, cn.create_constraints(component))
+                # The key of a box changes once its variables are created,
+                # and it is the key of the box on the next expansion if
+                # the box is reused.
+                if key is not None:
+                    created = cn.cache_key()
+                    if created is not None:
+                        entries[created] = entry
+            if key is not None:
+                entries[key] = entry
+            helpers.append(entry[0])
+            cns.extend(entry[1])
+        self._entries = entries
+        self._helpers = helpers
+        return cns
+
+
+def _add_helpers(helper, ids):
+    """ Add the ids of a helper and of its nested helpers to a set.
+
+    """
+    ids.add(id(helper))
+    for nested in helper.nested_helpers():
+        _add_helpers(nested, ids)
+
+
+def _adopt_variables(helper, other, used):
+    """ Adopt the variables of another helper and of its nested helpers.
+
+    The helpers whose id is in the used set keep their variables, and
+    the id of the helpers whose variables are adopted is added to it.
+
+    """
+    if type(helper) is not type(other) or id(other) in used:
+        return
+    used.add(id(other))
+    if isinstance(helper, BoxHelper):
+        helper.adopt_variables(other)
+    for nested, other_nested in zip(helper.nested_helpers(),
+                                    other.nested_helpers()):
+        _adopt_variables(nested, other_nested, used)
+
+
+def expand_constraints(component, constraints, cache=None):
     """ A function which expands any ConstraintHelper in the list.
 
     Parameters
@@ -142,12 +269,18 @@ def expand_constraints(component, constraints):
     constraints : list
         The list of constraints to expand.
 
+    cache : ConstraintCache, optional
+        The cache holding the constraints generated by the previous
+        expansion for the component.
+
     Returns
     -------
     result : list
         The list of expanded constraints.
 
     """
+    if cache is not None:
+        return cache.expand(component, constraints)
     cns = []
     for cn in constraints:
         if isinstance(cn, ConstraintHelper):
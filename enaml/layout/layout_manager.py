@@ -7,11 +7,31 @@
 #------------------------------------------------------------------------------
 from contextlib import contextmanager
 
-from atom.api import Atom, List, Typed
+from atom.api import Atom, Dict, Int, List, Tuple, Typed
 
 import kiwisolver as kiwi
 
-from .layout_helpers import expand_constraints
+from .layout_helpers import ConstraintCache, expand_constraints
+
+
+#: The fraction of the constraints of a new system which can be added or
+#: removed before the solver is rebuilt from scratch instead. Changing a
+#: constraint of a solved system costs tens of times more than adding it
+#: while the system is built.
+_MAX_DIFF_RATIO = 0.05
+
+
+def _constraint_key(cn):
+    """ Get a key identifying the content of a constraint.
+
+    Two constraints with the same key are interchangeable in a solver.
+    The variables are identified by their id, since they are compared
+    symbolically. They are kept alive by the constraint in the solver.
+
+    """
+    expr = cn.expression()
+    terms = tuple((id(t.variable()), t.coefficient()) for t in expr.terms())
+    return (terms, expr.constant(), cn.op(), cn.strength())
 
 
 class LayoutItem(Atom):
@@ -29,18 +49,36 @@ class LayoutItem(Atom):
     #: by the layout manager.
     _margin_cache = List()
 
+    #: The last geometry applied to the item. This is used by the layout
+    #: manager to skip the items whose geometry has not changed.
+    _geometry = Tuple()
+
+    #: The cache of the constraints generated by the helpers of the
+    #: item. This is used for storage by the layout manager.
+    _constraint_cache = Typed(ConstraintCache)
+
     def __call__(self):
         """ Update the geometry of the underlying toolkit widget.
 
-        This should not be called directly by user code.
+        The geometry is only applied if it differs from the last one
+        applied to the item. This should not be called directly by
+        user code.
+
+        Returns
+        -------
+        result : bool
+            Whether the geometry of the widget was updated.
 
         """
         d = self.constrainable()
-        x = d.left.value()
-        y = d.top.value()
-        w = d.width.value()
-        h = d.height.value()
-        self.set_geometry(x, y, w, h)
+        geometry = (
+            d.left.value(), d.top.value(), d.width.value(), d.height.value()
+        )
+        if geometry == self._geometry:
+            return False
+        self._geometry = geometry
+        self.set_geometry(*geometry)
+        return True
 
     def hard_constraints(self):
         """ Generate a list of hard constraints for the item.
@@ -128,7 +166,9 @@ class LayoutItem(Atom):
             The list of layout constraints for the item.
 
         """
-        return expand_constraints(self.constrainable(), self.constraints())
+        return expand_constraints(
+            self.constrainable(), self.constraints(), self._constraint_cache
+        )
 
     def constrainable(self):
         """ Get a reference to the underlying constrainable object.
@@ -260,6 +300,36 @@ class LayoutManager(Atom):
     #: The list of layout items handled by the manager.
     _layout_items = List()
 
+    #: The constraints in the solver, grouped in lists by their key.
+    _constraints = Dict()
+
+    #: The keys of the constraints in the solver, keyed by their id. A
+    #: constraint reused from a constraint cache is found by its id.
+    _keys = Dict()
+
+    #: The constraint caches of the items, keyed by the id of their
+    #: constrainable. The values are tuples of (constrainable, cache).
+    _constraint_caches = Dict()
+
+    #: The computed best, min and max sizes of the system, which are
+    #: valid until the constraints of the system change.
+    _size_cache = Dict()
+
+    #: The number of solves run to compute the best, min and max sizes.
+    size_solves = Int()
+
+    #: The number of solves avoided by reusing a computed size.
+    size_solves_avoided = Int()
+
+    #: The number of solves run to resize the layout.
+    resize_solves = Int()
+
+    #: The number of item geometries applied by the resize updates.
+    geometry_updates = Int()
+
+    #: The number of item geometries left unchanged by the resize updates.
+    geometry_updates_avoided = Int()
+
     def __init__(self, item):
         """ Initialize a LayoutManager.
 
@@ -278,8 +348,11 @@ class LayoutManager(Atom):
     def set_items(self, items):
         """ Set the layout items for this layout manager.
 
-        This method will reset the internal solver state and build a
-        new system of constraints using the new list of items.
+        This method will build a new system of constraints using the
+        new list of items. Only the constraints which differ from the
+        current ones are removed from and added to the solver, unless
+        too many of them differ, in which case the internal solver
+        state is reset.
 
         Parameters
         ----------
@@ -288,46 +361,42 @@ class LayoutManager(Atom):
             item should *not* be included in this list.
 
         """
-        # Reset the state of the solver.
-        del self._edit_stack
         del self._layout_items
-        solver = self._solver
-        solver.reset()
-
-        # Setup the standard edit variables.
-        root = self._root_item
-        d = root.constrainable()
-        strength = kiwi.strength.medium
-        pairs = ((d.width, strength), (d.height, strength))
-        self._push_edit_vars(pairs)
 
         # Generate the constraints for the layout system. The size hint
         # and bounds of the root item are ignored since the input to the
         # solver is the suggested size of the root item and the output
         # of the solver is used to compute the bounds of the item.
+        root = self._root_item
+        caches = {}
+        self._attach_cache(root, caches)
+        for child in items:
+            self._attach_cache(child, caches)
+        self._constraint_caches = caches
         cns = []
-        hc = root.hard_constraints()
-        mc = root.margin_constraints()
-        lc = root.layout_constraints()
-        root._margin_cache = mc
-        cns.extend(hc)
-        cns.extend(mc)
-        cns.extend(lc)
+        cns.extend(root.hard_constraints())
+        root_mc = root.margin_constraints()
+        margin_start = len(cns)
+        cns.extend(root_mc)
+        cns.extend(root.layout_constraints())
+        spans = []
         for child in items:
-            hc = child.hard_constraints()
+            cns.extend(child.hard_constraints())
             gc = child.geometry_constraints()
             mc = child.margin_constraints()
-            lc = child.layout_constraints()
-            child._geometry_cache = gc
-            child._margin_cache = mc
-            cns.extend(hc)
+            start = len(cns)
             cns.extend(gc)
             cns.extend(mc)
-            cns.extend(lc)
+            spans.append((start, len(gc), len(mc)))
+            cns.extend(child.layout_constraints())
 
-        # Add the new constraints to the solver.
-        for cn in cns:
-            solver.addConstraint(cn)
+        # Update the solver, and refer to the constraints which it holds
+        # from the caches used by the geometry and margin updates.
+        cns = self._update_constraints(cns)
+        root._margin_cache = cns[margin_start:margin_start + len(root_mc)]
+        for child, (start, n_gc, n_mc) in zip(items, spans):
+            child._geometry_cache = cns[start:start + n_gc]
+            child._margin_cache = cns[start + n_gc:start + n_gc + n_mc]
 
         # Store the layout items for resize updates.
         self._layout_items = items
@@ -342,7 +411,8 @@ class LayoutManager(Atom):
         """ Update the size of target size of the layout.
 
         This method will update the solver and make a pass over
-        the layout table to update the item layout geometries.
+        the layout table to update the item layout geometries. Only
+        the items whose solved geometry has changed are updated.
 
         Parameters
         ----------
@@ -358,15 +428,22 @@ class LayoutManager(Atom):
         solver.suggestValue(d.width, width)
         solver.suggestValue(d.height, height)
         solver.updateVariables()
-        for item in self._layout_items:
-            item()
+        self.resize_solves += 1
+        items = self._layout_items
+        updated = 0
+        for item in items:
+            if item():
+                updated += 1
+        self.geometry_updates += updated
+        self.geometry_updates_avoided += len(items) - updated
 
     def best_size(self):
         """ Get the best size for the layout owner.
 
         The best size is computed by invoking the solver with a zero
         size suggestion at a strength of 0.1 * weak. The resulting
-        values for width and height are taken as the best size.
+        values for width and height are taken as the best size. The
+        result is cached until the constraints of the system change.
 
         Returns
         -------
@@ -374,6 +451,10 @@ class LayoutManager(Atom):
             The 2-tuple of (width, height) best size values.
 
         """
+        result = self._size_cache.get('best')
+        if result is not None:
+            self.size_solves_avoided += 1
+            return result
         d = self._root_item.constrainable()
         width = d.width
         height = d.height
@@ -385,6 +466,8 @@ class LayoutManager(Atom):
             solver.suggestValue(height, 0.0)
             solver.updateVariables()
             result = (width.value(), height.value())
+        self.size_solves += 1
+        self._size_cache['best'] = result
         return result
 
     def min_size(self):
@@ -393,6 +476,7 @@ class LayoutManager(Atom):
         The minimum size is computed by invoking the solver with a
         zero size suggestion at a strength of medium. The resulting
         values for width and height are taken as the minimum size.
+        The result is cached until the constraints of the system change.
 
         Returns
         -------
@@ -400,6 +484,10 @@ class LayoutManager(Atom):
             The 2-tuple of (width, height) min size values.
 
         """
+        result = self._size_cache.get('min')
+        if result is not None:
+            self.size_solves_avoided += 1
+            return result
         d = self._root_item.constrainable()
         width = d.width
         height = d.height
@@ -407,7 +495,10 @@ class LayoutManager(Atom):
         solver.suggestValue(width, 0.0)
         solver.suggestValue(height, 0.0)
         solver.updateVariables()
-        return (width.value(), height.value())
+        result = (width.value(), height.value())
+        self.size_solves += 1
+        self._size_cache['min'] = result
+        return result
 
     def max_size(self):
         """ Compute the maximum size for the container.
@@ -415,6 +506,7 @@ class LayoutManager(Atom):
         The maximum size is computed by invoking the solver with a
         max size suggestion at a strength of medium. The resulting
         values for width and height are taken as the maximum size.
+        The result is cached until the constraints of the system change.
 
         Returns
         -------
@@ -422,6 +514,10 @@ class LayoutManager(Atom):
             The 2-tuple of (width, height) max size values.
 
         """
+        result = self._size_cache.get('max')
+        if result is not None:
+            self.size_solves_avoided += 1
+            return result
         d = self._root_item.constrainable()
         width = d.width
         height = d.height
@@ -429,7 +525,10 @@ class LayoutManager(Atom):
         solver.suggestValue(width, 16777215.0)  # max allowed by Qt
         solver.suggestValue(height, 16777215.0)
         solver.updateVariables()
-        return (width.value(), height.value())
+        result = (width.value(), height.value())
+        self.size_solves += 1
+        self._size_cache['max'] = result
+        return result
 
     def update_geometry(self, index):
         """ Update the geometry for the given layout item.
@@ -447,8 +546,7 @@ class LayoutManager(Atom):
         item = self._layout_items[index]
         old = item._geometry_cache
         new = item.geometry_constraints()
-        item._geometry_cache = new
-        self._replace(old, new)
+        item._geometry_cache = self._replace(old, new)
 
     def update_margins(self, index):
         """ Update the margins for the given layout item.
@@ -467,15 +565,81 @@ class LayoutManager(Atom):
         item = self._root_item if index < 0 else self._layout_items[index]
         old = item._margin_cache
         new = item.margin_constraints()
-        item._margin_cache = new
-        self._replace(old, new)
+        item._margin_cache = self._replace(old, new)
 
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _update_constraints(self, cns):
+        """ Update the solver to hold the given constraints.
+
+        The constraints which are equal to a constraint of the solver
+        are not added, and the solver constraints which are not part of
+        the new system are removed. If the difference is large, the
+        solver is reset and all the constraints are added instead.
+
+        Parameters
+        ----------
+        cns : list
+            The list of constraints of the new system.
+
+        Returns
+        -------
+        result : list
+            The list of the constraints held by the solver, in the order
+            of the given constraints.
+
+        """
+        current = self._constraints
+        keys = self._keys
+        constraints = {}
+        used_keys = {}
+        used = []
+        added = []
+        for cn in cns:
+            key = keys.get(id(cn))
+            if key is None:
+                key = _constraint_key(cn)
+            bucket = current.get(key)
+            if bucket:
+                cn = bucket.pop()
+            else:
+                added.append(cn)
+            used.append(cn)
+            used_keys[id(cn)] = key
+            if key in constraints:
+                constraints[key].append(cn)
+            else:
+                constraints[key] = [cn]
+        removed = [cn for bucket in current.values() for cn in bucket]
+        self._constraints = constraints
+        self._keys = used_keys
+
+        solver = self._solver
+        changes = len(added) + len(removed)
+        if changes:
+            self._size_cache = {}
+        if not self._edit_stack or changes > len(used) * _MAX_DIFF_RATIO:
+            del self._edit_stack
+            solver.reset()
+            d = self._root_item.constrainable()
+            strength = kiwi.strength.medium
+            self._push_edit_vars(((d.width, strength), (d.height, strength)))
+            for cn in used:
+                solver.addConstraint(cn)
+        else:
+            for cn in removed:
+                solver.removeConstraint(cn)
+            for cn in added:
+                solver.addConstraint(cn)
+        return used
+
     def _replace(self, old, new):
         """ Replace constraints in the solver.
 
+        The constraints which are equal in both lists are left in the
+        solver.
+
         Parameters
         ----------
         old : list
@@ -484,12 +648,75 @@ class LayoutManager(Atom):
         new : list
             The list of constraints to add to the solver.
 
+        Returns
+        -------
+        result : list
+            The list of the constraints held by the solver, in the order
+            of the new constraints.
+
         """
-        solver = self._solver
+        keys = self._keys
+        kept = {}
         for cn in old:
-            solver.removeConstraint(cn)
+            key = keys.get(id(cn))
+            if key is None:
+                key = _constraint_key(cn)
+            if key in kept:
+                kept[key].append(cn)
+            else:
+                kept[key] = [cn]
+        used = []
+        added = []
         for cn in new:
+            key = _constraint_key(cn)
+            bucket = kept.get(key)
+            if bucket:
+                cn = bucket.pop()
+            else:
+                added.append((key, cn))
+            used.append(cn)
+
+        solver = self._solver
+        constraints = self._constraints
+        if added or any(kept.values()):
+            self._size_cache = {}
+        for key, bucket in kept.items():
+            for cn in bucket:
+                solver.removeConstraint(cn)
+                del keys[id(cn)]
+                current = constraints[key]
+                del current[next(i for i, c in enumerate(current)
+                                 if c is cn)]
+                if not current:
+                    del constraints[key]
+        for key, cn in added:
             solver.addConstraint(cn)
+            keys[id(cn)] = key
+            if key in constraints:
+                constraints[key].append(cn)
+            else:
+                constraints[key] = [cn]
+        return used
+
+    def _attach_cache(self, item, caches):
+        """ Give a layout item the constraint cache of its constrainable.
+
+        Parameters
+        ----------
+        item : LayoutItem
+            The layout item which will generate its constraints.
+
+        caches : dict
+            The caches used by the new system of constraints, to which
+            the cache of the item is added.
+
+        """
+        d = item.constrainable()
+        entry = self._constraint_caches.get(id(d))
+        if entry is None or entry[0] is not d:
+            entry = (d, ConstraintCache())
+        caches[id(d)] = entry
+        item._constraint_cache = entry[1]
 
     def _push_edit_vars(self, pairs):
         """ Push edit variables into the solver.
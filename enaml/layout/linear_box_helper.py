@@ -117,6 +117,24 @@ class LinearBoxHelper(BoxHelper):
 
         return items
 
+    def cache_key(self):
+        """ Get a key identifying the constraints of the box.
+
+        """
+        items = self.items_key(self.items)
+        if items is None:
+            return None
+        key = (type(self), self.orientation, self.spacing, self.margins,
+               self.strength, items)
+        return self.box_key(key)
+
+    def nested_helpers(self):
+        """ Get the helpers given as items to this helper.
+
+        """
+        return [item for item in self.items
+                if isinstance(item, ConstraintHelper)]
+
     def constraints(self, component):
         """ Generate the box constraints for the given component.
 
@@ -112,6 +112,23 @@ class SequenceHelper(ConstraintHelper):
 
         return items
 
+    def cache_key(self):
+        """ Get a key identifying the constraints of the sequence.
+
+        """
+        items = self.items_key(self.items)
+        if items is None:
+            return None
+        return (type(self), self.first_name, self.second_name,
+                self.spacing, self.strength, items)
+
+    def nested_helpers(self):
+        """ Get the helpers given as items to this helper.
+
+        """
+        return [item for item in self.items
+                if isinstance(item, ConstraintHelper)]
+
     def constraints(self, component):
         """ Generate the constraints for the sequence.
 
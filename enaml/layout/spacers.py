@@ -70,6 +70,17 @@ class Spacer(Atom):
         """
         return self if switch else None
 
+    def cache_key(self):
+        """ Get a key identifying the constraints of the spacer.
+
+        Returns
+        -------
+        result : tuple
+            A tuple of the spacer type, size and strengths.
+
+        """
+        return (type(self), self.size, self.strength)
+
     def create_constraints(self, first, second):
         """ Generate the spacer constraints for the given anchors.
 
@@ -184,6 +195,13 @@ class FlexSpacer(Spacer):
         if eq_strength is not None:
             self.eq_strength = eq_strength
 
+    def cache_key(self):
+        """ Get a key identifying the constraints of the spacer.
+
+        """
+        return (FlexSpacer, self.size, self.strength, self.min_strength,
+                self.eq_strength)
+
     def constraints(self, first, second):
         """ Generate the constraints for the spacer.
 
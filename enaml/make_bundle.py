@@ -0,0 +1,132 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" Command-line tool to pack the compiled .enaml files of an application
+in a single bundle file.
+
+Each root directory is treated as an entry of sys.path: the modules are
+named after their path relative to it. The bundle is loaded using the
+EnamlBundleImporter.
+
+"""
+from __future__ import print_function
+
+import optparse
+import os
+import sys
+
+from enaml.compat import read_source
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.import_hooks import CACHEDIR, write_bundle
+from enaml.core.parser import parse
+
+
+def find_enaml_modules(root):
+    """ Find the enaml modules located under a root directory.
+
+    Parameters
+    ----------
+    root : string
+        The directory used as a sys.path entry.
+
+    Returns
+    -------
+    result : list
+        A sorted list of (fullname, filename, path) tuples giving the fully
+        qualified name of each module, its path relative to the root using
+        '/' as separator and its full path.
+
+    """
+    modules = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if CACHEDIR in dirnames:
+            dirnames.remove(CACHEDIR)
+        for name in filenames:
+            stem, ext = os.path.splitext(name)
+            if ext != '.enaml':
+                continue
+            path = os.path.join(dirpath, name)
+            parts = os.path.relpath(path, root).split(os.sep)
+            fullname = '.'.join(parts[:-1] + [stem])
+            modules.append((fullname, '/'.join(parts), path))
+    return sorted(modules)
+
+
+def make_bundle(output, roots, quiet=False):
+    """ Compile the enaml modules found under the roots in a bundle.
+
+    Parameters
+    ----------
+    output : string
+        The path of the bundle file to write.
+
+    roots : list
+        The directories in which to look for enaml modules. When a module
+        is found in several roots, the first one is used as it would be
+        on sys.path.
+
+    quiet : bool
+        Whether to only print the errors.
+
+    Returns
+    -------
+    success : bool
+        Whether all the modules compiled successfully. The bundle is not
+        written otherwise.
+
+    """
+    seen = set()
+    modules = []
+    success = True
+    for root in roots:
+        for fullname, filename, path in find_enaml_modules(root):
+            if fullname in seen:
+                continue
+            seen.add(fullname)
+            if not quiet:
+                print('Compiling {}...'.format(path))
+            try:
+                ast = parse(read_source(path), path)
+                code = EnamlCompiler.compile(ast, path)
+            except Exception as e:
+                if quiet:
+                    print('Compiling {}...'.format(path))
+                print(str(e))
+                success = False
+                continue
+            modules.append((fullname, filename, code))
+    if success:
+        write_bundle(output, modules)
+        if not quiet:
+            print('Wrote {} modules to {}'.format(len(modules), output))
+    return success
+
+
+def main():
+    usage = 'usage: %prog [options] root [root ...]'
+    parser = optparse.OptionParser(usage=usage, description=__doc__)
+    parser.add_option(
+        '-o', '--output', default='app.enamlb',
+        help='The path of the bundle file [default: %default]'
+    )
+    parser.add_option(
+        '-q', '--quiet', action='store_true', default=False,
+        help='Only print the errors'
+    )
+
+    options, args = parser.parse_args()
+
+    if len(args) == 0:
+        print('No root directory specified')
+        sys.exit(2)
+
+    success = make_bundle(options.output, args, options.quiet)
+    sys.exit(int(not success))
+
+
+if __name__ == '__main__':
+    main()
@@ -73,7 +73,8 @@ class QtAbstractButton(QtControl, ProxyAbstractButton):
         # grab the checked attribute directly, which works on both.
         checked = self.widget.isChecked()
         if not self._guard & CHECKED_GUARD:
-            self.declaration.checked = checked
+            with self.write_back():
+                self.declaration.checked = checked
             self.declaration.clicked(checked)
 
     def on_toggled(self, checked):
@@ -81,7 +82,8 @@ class QtAbstractButton(QtControl, ProxyAbstractButton):
 
         """
         if not self._guard & CHECKED_GUARD:
-            self.declaration.checked = checked
+            with self.write_back():
+                self.declaration.checked = checked
             self.declaration.toggled(checked)
 
     #--------------------------------------------------------------------------
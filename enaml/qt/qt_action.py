@@ -75,7 +75,8 @@ class QtAction(QtToolkitObject, ProxyAction):
         # grab the checked attribute directly, which works on both.
         checked = self.widget.isChecked()
         if not self._guard & CHECKED_GUARD:
-            self.declaration.checked = checked
+            with self.write_back():
+                self.declaration.checked = checked
             self.declaration.triggered(checked)
 
     def on_toggled(self, checked):
@@ -83,7 +84,8 @@ class QtAction(QtToolkitObject, ProxyAction):
 
         """
         if not self._guard & CHECKED_GUARD:
-            self.declaration.checked = checked
+            with self.write_back():
+                self.declaration.checked = checked
             self.declaration.toggled(checked)
 
     #--------------------------------------------------------------------------
@@ -50,7 +50,8 @@ class QtBoundedDate(QtControl, ProxyBoundedDate):
 
         """
         if not self._guard & CHANGED_GUARD:
-            self.declaration.date = self.get_date()
+            with self.write_back():
+                self.declaration.date = self.get_date()
 
     #--------------------------------------------------------------------------
     # Abstract Methods and ProxyBoundedDate API
@@ -50,7 +50,8 @@ class QtBoundedDatetime(QtControl, ProxyBoundedDatetime):
 
         """
         if not self._guard & CHANGED_GUARD:
-            self.declaration.datetime = self.get_datetime()
+            with self.write_back():
+                self.declaration.datetime = self.get_datetime()
 
     #--------------------------------------------------------------------------
     # Abstract Methods and ProxyBoundedDate API
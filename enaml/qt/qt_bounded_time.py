@@ -50,7 +50,8 @@ class QtBoundedTime(QtControl, ProxyBoundedTime):
 
         """
         if not self._guard & CHANGED_GUARD:
-            self.declaration.time = self.get_time()
+            with self.write_back():
+                self.declaration.time = self.get_time()
 
     #--------------------------------------------------------------------------
     # Abstract Methods and ProxyBoundedDate API
@@ -111,7 +111,8 @@ class QtColorDialog(QtToolkitDialog, ProxyColorDialog):
         if d is not None:
             self._guard |= CURRENT_GUARD
             try:
-                d.current_color = color_from_qcolor(qcolor)
+                with self.write_back():
+                    d.current_color = color_from_qcolor(qcolor)
             finally:
                 self._guard &= ~CURRENT_GUARD
 
@@ -121,7 +122,8 @@ class QtColorDialog(QtToolkitDialog, ProxyColorDialog):
         """
         d = self.declaration
         if d is not None:
-            d.selected_color = color_from_qcolor(qcolor)
+            with self.write_back():
+                d.selected_color = color_from_qcolor(qcolor)
 
     #--------------------------------------------------------------------------
     # ProxyColorDialog API
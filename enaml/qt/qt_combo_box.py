@@ -58,7 +58,8 @@ class QtComboBox(QtControl, ProxyComboBox):
 
         """
         if not self._guard & INDEX_GUARD:
-            self.declaration.index = self.widget.currentIndex()
+            with self.write_back():
+                self.declaration.index = self.widget.currentIndex()
 
     #--------------------------------------------------------------------------
     # ProxyComboBox API
@@ -7,8 +7,9 @@
 #------------------------------------------------------------------------------
 from collections import deque
 from contextlib import contextmanager
+from weakref import WeakKeyDictionary
 
-from atom.api import Atom, Callable, Float, Typed
+from atom.api import Atom, Bool, Callable, Float, Int, List, Tuple, Typed
 
 from enaml.layout.layout_manager import LayoutItem, LayoutManager
 from enaml.widgets.constraints_widget import ConstraintsWidget
@@ -42,6 +43,140 @@ class LayoutPoint(Atom):
     y = Float(0.0)
 
 
+#: The relayout schedulers, keyed by their top-level window widget.
+_schedulers = WeakKeyDictionary()
+
+
+class RelayoutScheduler(Atom):
+    """ A class which schedules the relayouts of the containers of a
+    top-level window.
+
+    The relayout requests of the containers are collected and run once
+    per event loop cycle, the innermost containers first. A container
+    with a pending relayout ignores the geometry updates of its child
+    containers, so an ancestor is laid out once after its descendants
+    instead of once per updated descendant.
+
+    """
+    # PySide requires weakrefs for using bound methods as slots.
+    # PyQt doesn't, but executes unsafe code if not using weakrefs.
+    __slots__ = '__weakref__'
+
+    #: The number of passes run by the scheduler.
+    passes = Int()
+
+    #: The number of container relayouts run by the scheduler.
+    relayouts = Int()
+
+    #: The number of solves run by the layout managers of the relaid
+    #: out containers and of their ancestors during the passes.
+    solves = Int()
+
+    #: The containers with a pending relayout.
+    _containers = List()
+
+    #: The timer used to run the next pass. It is created on demand.
+    _timer = Typed(QTimer)
+
+    @staticmethod
+    def for_widget(widget):
+        """ Get the relayout scheduler for the window of a widget.
+
+        Parameters
+        ----------
+        widget : QWidget
+            A widget of the top-level window of interest.
+
+        Returns
+        -------
+        result : RelayoutScheduler
+            The scheduler of the top-level window of the widget. It is
+            created if needed.
+
+        """
+        window = widget.window()
+        scheduler = _schedulers.get(window)
+        if scheduler is None:
+            scheduler = _schedulers[window] = RelayoutScheduler()
+        return scheduler
+
+    def schedule(self, container):
+        """ Schedule the relayout of a container on the next pass.
+
+        Parameters
+        ----------
+        container : QtContainer
+            The container which owns its layout manager.
+
+        """
+        self._containers.append(container)
+        timer = self._timer
+        if timer is None:
+            timer = self._timer = QTimer()
+            timer.setSingleShot(True)
+            timer.timeout.connect(self.run)
+        if not timer.isActive():
+            timer.start()
+
+    def run(self):
+        """ Run the pending relayouts, the innermost containers first.
+
+        This is called by the timer of the scheduler, but may also be
+        called directly to run the pending relayouts immediately. The
+        relayouts requested while it runs are scheduled for the next
+        pass.
+
+        """
+        containers = self._containers
+        if not containers:
+            return
+        self._containers = []
+        if self._timer is not None:
+            self._timer.stop()
+        self.passes += 1
+
+        # The solves are counted by the managers of the containers and
+        # of their ancestors, which are updated by the geometry changes.
+        counted = {}
+        for container in containers:
+            proxy = container
+            while proxy is not None and id(proxy) not in counted:
+                if isinstance(proxy, QtContainer):
+                    counted[id(proxy)] = (proxy, _solves(proxy))
+                proxy = proxy.parent()
+
+        containers.sort(key=_depth, reverse=True)
+        for container in containers:
+            if container._relayout_pending:
+                container._relayout()
+                self.relayouts += 1
+
+        for proxy, solves in counted.values():
+            self.solves += max(_solves(proxy) - solves, 0)
+
+
+def _depth(proxy):
+    """ Get the depth of a proxy in its tree of proxies.
+
+    """
+    depth = 0
+    parent = proxy.parent()
+    while parent is not None:
+        depth += 1
+        parent = parent.parent()
+    return depth
+
+
+def _solves(container):
+    """ Get the number of solves run by the manager of a container.
+
+    """
+    manager = container._layout_manager
+    if manager is None:
+        return 0
+    return manager.size_solves + manager.resize_solves
+
+
 class QtLayoutItem(LayoutItem):
     """ A concrete LayoutItem implementation for a QtConstraintsWidget.
 
@@ -60,6 +195,24 @@ class QtLayoutItem(LayoutItem):
     #: the offset of the root item.
     origin = Typed(LayoutPoint)
 
+    #: The offset of the parent item when the geometry was last applied.
+    _applied_offset = Tuple()
+
+    def __call__(self):
+        """ Update the geometry of the underlying toolkit widget.
+
+        This reimplementation also updates the geometry when the offset
+        of the parent item has moved, since the widget geometry is set
+        relative to its parent.
+
+        """
+        offset = self.offset
+        applied = (offset.x, offset.y)
+        if applied != self._applied_offset:
+            self._applied_offset = applied
+            del self._geometry
+        return super(QtLayoutItem, self).__call__()
+
     def constrainable(self):
         """ Get a reference to the underlying constrainable object.
 
@@ -297,9 +450,9 @@ class QtContainer(QtFrame, ProxyContainer):
     #: used by the QtChildContainerItem to generate size constraints.
     max_size = Typed(QSize)
 
-    #: A timer used to collapse relayout requests. The timer is created
-    #: on an as needed basis and destroyed when it is no longer needed.
-    _layout_timer = Typed(QTimer)
+    #: Whether a relayout of the container is scheduled. The requests
+    #: are collected by the RelayoutScheduler of the window.
+    _relayout_pending = Bool(False)
 
     #: The layout manager which handles the system of constraints.
     _layout_manager = Typed(LayoutManager)
@@ -307,11 +460,12 @@ class QtContainer(QtFrame, ProxyContainer):
     def destroy(self):
         """ A reimplemented destructor.
 
-        This destructor clears the layout timer and layout manager
-        so that any potential reference cycles are broken.
+        This destructor cancels a pending relayout and clears the
+        layout manager so that any potential reference cycles are
+        broken.
 
         """
-        del self._layout_timer
+        self._relayout_pending = False
         del self._layout_manager
         super(QtContainer, self).destroy()
 
@@ -367,20 +521,19 @@ class QtContainer(QtFrame, ProxyContainer):
         """ Request a relayout of the container.
 
         """
-        # If this container owns the layout, (re)start the timer. The
-        # list of layout items is cleared to prevent an edge case where
-        # a parent container layout occurs before the child container,
-        # causing the child to resize potentially deleted widgets which
-        # still have strong refs in the layout items list.
+        # If this container owns the layout, schedule a relayout with
+        # the scheduler of the window. The list of layout items is
+        # cleared to prevent an edge case where a parent container
+        # layout occurs before the child container, causing the child
+        # to resize potentially deleted widgets which still have strong
+        # refs in the layout items list.
         manager = self._layout_manager
         if manager is not None:
-            if self._layout_timer is None:
+            if not self._relayout_pending:
                 manager.clear_items()
                 self.widget.setUpdatesEnabled(False)
-                timer = self._layout_timer = QTimer()
-                timer.setSingleShot(True)
-                timer.timeout.connect(self._on_relayout_timer)
-            self._layout_timer.start()
+                self._relayout_pending = True
+                RelayoutScheduler.for_widget(self.widget).schedule(self)
             return
 
         # If an ancestor container owns the layout, proxy the call.
@@ -415,7 +568,7 @@ class QtContainer(QtFrame, ProxyContainer):
         # has already been reset and the layout indices are invalid.
         manager = self._layout_manager
         if manager is not None:
-            if self._layout_timer is None:
+            if not self._relayout_pending:
                 with self.geometry_guard():
                     manager.update_geometry(item.layout_index)
                     self._update_size_bounds()
@@ -477,7 +630,7 @@ class QtContainer(QtFrame, ProxyContainer):
         # has already been reset and the layout indices are invalid.
         manager = self._layout_manager
         if manager is not None:
-            if self._layout_timer is None:
+            if not self._relayout_pending:
                 index = item.layout_index if item else -1
                 with self.geometry_guard():
                     manager.update_margins(index)
@@ -491,25 +644,23 @@ class QtContainer(QtFrame, ProxyContainer):
             container.margins_updated(item or self)
 
     #--------------------------------------------------------------------------
-    # Private Signal Handlers
+    # Private Layout Handling
     #--------------------------------------------------------------------------
-    def _on_relayout_timer(self):
+    def _relayout(self):
         """ Rebuild the layout for the container.
 
-        This method is invoked when the relayout timer is triggered. It
-        will reset the manager and update the geometries of the children.
+        This method is invoked by the relayout scheduler of the window.
+        It will reset the manager and update the geometries of the
+        children.
 
         """
-        del self._layout_timer
+        self._relayout_pending = False
         with self.geometry_guard():
             self._setup_manager()
             self._update_size_bounds()
             self._update_geometries()
         self.widget.setUpdatesEnabled(True)
 
-    #--------------------------------------------------------------------------
-    # Private Layout Handling
-    #--------------------------------------------------------------------------
     def _setup_manager(self):
         """ Setup the layout manager.
 
@@ -522,7 +673,7 @@ class QtContainer(QtFrame, ProxyContainer):
         # manager is only created if ownership is unlikely to change.
         share_layout = self.declaration.share_layout
         if share_layout and isinstance(self.parent(), QtContainer):
-            del self._layout_timer
+            self._relayout_pending = False
             del self._layout_manager
             return
 
@@ -87,7 +87,8 @@ class QtDialog(QtWindow, ProxyDialog):
         """
         result = bool(self.widget.result())
         d = self.declaration
-        d.result = result
+        with self.write_back():
+            d.result = result
         d.finished(result)
         if result:
             d.accepted()
@@ -157,7 +157,8 @@ class QtDockItem(QtWidget, ProxyDockItem):
         if d is not None:
             self._guard |= TITLE_GUARD
             try:
-                d.title = text
+                with self.write_back():
+                    d.title = text
             finally:
                 self._guard &= ~TITLE_GUARD
 
@@ -252,7 +252,8 @@ class QtDockPane(QtWidget, ProxyDockPane):
         """
         # The closed signal is only emitted when the widget is closed
         # by the user, so there is no need for a loopback guard.
-        self.declaration.visible = False
+        with self.write_back():
+            self.declaration.visible = False
         self.declaration.closed()
 
     def on_floated(self):
@@ -262,7 +263,8 @@ class QtDockPane(QtWidget, ProxyDockPane):
         if not self._guard & FLOATED_GUARD:
             self._guard |= FLOATED_GUARD
             try:
-                self.declaration.floating = True
+                with self.write_back():
+                    self.declaration.floating = True
             finally:
                 self._guard &= ~FLOATED_GUARD
 
@@ -273,8 +275,9 @@ class QtDockPane(QtWidget, ProxyDockPane):
         if not self._guard & FLOATED_GUARD:
             self._guard |= FLOATED_GUARD
             try:
-                self.declaration.floating = False
-                self.declaration.dock_area = _DOCK_AREA_INV_MAP[area]
+                with self.write_back():
+                    self.declaration.floating = False
+                    self.declaration.dock_area = _DOCK_AREA_INV_MAP[area]
             finally:
                 self._guard &= ~FLOATED_GUARD
 
@@ -351,7 +351,8 @@ class QtDualSlider(QtControl, ProxyDualSlider):
         if not self._guard & LOW_VALUE_FLAG:
             self._guard |= LOW_VALUE_FLAG
             try:
-                self.declaration.low_value = self.widget.lowValue()
+                with self.write_back():
+                    self.declaration.low_value = self.widget.lowValue()
             finally:
                 self._guard &= ~LOW_VALUE_FLAG
 
@@ -363,7 +364,8 @@ class QtDualSlider(QtControl, ProxyDualSlider):
         if not self._guard & HIGH_VALUE_FLAG:
             self._guard |= HIGH_VALUE_FLAG
             try:
-                self.declaration.high_value = self.widget.highValue()
+                with self.write_back():
+                    self.declaration.high_value = self.widget.highValue()
             finally:
                 self._guard &= ~HIGH_VALUE_FLAG
 
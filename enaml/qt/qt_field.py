@@ -105,7 +105,8 @@ class QtField(QtControl, ProxyField):
             self.widget.setText(text)
 
         self._clear_error_state()
-        d.text = text
+        with self.write_back():
+            d.text = text
 
     def _set_error_state(self):
         """ Set the error state of the widget.
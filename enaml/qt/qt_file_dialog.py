@@ -44,7 +44,8 @@ class QtFileDialog(QtToolkitObject, ProxyFileDialog):
             path = exec_func(self.parent_widget(), caption, path)
             paths = [path] if path else []
         result = 'accepted' if paths else 'rejected'
-        d._handle_close(result, paths, selected_filter)
+        with self.write_back():
+            d._handle_close(result, paths, selected_filter)
 
     #--------------------------------------------------------------------------
     # ProxyFileDialog API
@@ -91,7 +91,8 @@ class QtFileDialogEx(QtToolkitDialog, ProxyFileDialogEx):
         if d is not None:
             self._guard |= PATH_GUARD
             try:
-                d.current_path = path
+                with self.write_back():
+                    d.current_path = path
             finally:
                 self._guard &= ~PATH_GUARD
 
@@ -101,7 +102,8 @@ class QtFileDialogEx(QtToolkitDialog, ProxyFileDialogEx):
         """
         d = self.declaration
         if d is not None:
-            d.selected_paths = paths
+            with self.write_back():
+                d.selected_paths = paths
 
     def on_filter_selected(self, selected):
         """ Handle the 'filterSelected' signal from the dialog.
@@ -111,7 +113,8 @@ class QtFileDialogEx(QtToolkitDialog, ProxyFileDialogEx):
         if d is not None:
             self._guard |= FILTER_GUARD
             try:
-                d.selected_name_filter = selected
+                with self.write_back():
+                    d.selected_name_filter = selected
             finally:
                 self._guard &= ~FILTER_GUARD
 
@@ -52,4 +52,5 @@ class QtFocusTracker(QtToolkitObject, ProxyFocusTracker):
 
         """
         fd = focus_registry.focused_declaration()
-        self.declaration.focused_widget = fd
+        with self.write_back():
+            self.declaration.focused_widget = fd
@@ -129,7 +129,8 @@ class QtMultilineField(QtControl, ProxyMultilineField):
         if not self._guard & TEXT_GUARD:
             self._guard |= TEXT_GUARD
             try:
-                self.declaration.text = self.widget.toPlainText()
+                with self.write_back():
+                    self.declaration.text = self.widget.toPlainText()
             finally:
                 self._guard &= ~TEXT_GUARD
 
@@ -411,6 +411,7 @@ class QtNotebook(QtConstraintsWidget, ProxyNotebook):
         for page in self.pages():
             widget.addPage(page)
         self.init_selected_tab()
+        self.select_current_page()
         widget.layoutRequested.connect(self.on_layout_requested)
         widget.currentChanged.connect(self.on_current_changed)
 
@@ -444,6 +445,18 @@ class QtNotebook(QtConstraintsWidget, ProxyNotebook):
             if page.objectName() == name:
                 return page
 
+    def select_current_page(self):
+        """ Notify the declarations of the pages of the selection.
+
+        """
+        current = self.widget.currentWidget()
+        if current is not None:
+            for p in self.declaration.pages():
+                if p.proxy.widget is current:
+                    p._handle_selected()
+                else:
+                    p._handle_deselected()
+
     def init_selected_tab(self):
         """ Initialize the selected tab.
 
@@ -458,7 +471,8 @@ class QtNotebook(QtConstraintsWidget, ProxyNotebook):
             name = current.objectName() if current is not None else u''
             self._guard |= CHANGE_GUARD
             try:
-                d.selected_tab = name
+                with self.write_back():
+                    d.selected_tab = name
             finally:
                 self._guard &= ~CHANGE_GUARD
 
@@ -501,9 +515,11 @@ class QtNotebook(QtConstraintsWidget, ProxyNotebook):
             try:
                 page = self.widget.currentWidget()
                 name = page.objectName() if page is not None else u''
-                self.declaration.selected_tab = name
+                with self.write_back():
+                    self.declaration.selected_tab = name
             finally:
                 self._guard &= ~CHANGE_GUARD
+        self.select_current_page()
 
     #--------------------------------------------------------------------------
     # ProxyNotebook API
@@ -114,7 +114,8 @@ class QtObjectCombo(QtControl, ProxyObjectCombo):
             self._guard |= SELECTED_GUARD
             try:
                 item = self.declaration.items[index]
-                self.declaration.selected = item
+                with self.write_back():
+                    self.declaration.selected = item
             finally:
                 self._guard &= ~SELECTED_GUARD
 
@@ -336,7 +336,7 @@ class QtPage(QtWidget, ProxyPage):
         """ Handle the child added event for a QtPage.
 
         """
-        super(QtPage, self).child_removed(child)
+        super(QtPage, self).child_added(child)
         if isinstance(child, QtContainer):
             self.widget.setPageWidget(self.page_widget())
 
@@ -355,7 +355,8 @@ class QtPage(QtWidget, ProxyPage):
         """ The signal handler for the 'pageClosed' signal.
 
         """
-        self.declaration._handle_close()
+        with self.write_back():
+            self.declaration._handle_close()
 
     #--------------------------------------------------------------------------
     # ProxyPage API
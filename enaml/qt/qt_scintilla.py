@@ -222,7 +222,8 @@ class QtScintilla(QtControl, ProxyScintilla):
         """
         d = self.declaration
         if d is not None:
-            d.cursor_position = self.widget.getCursorPosition()
+            with self.write_back():
+                d.cursor_position = self.widget.getCursorPosition()
 
     #--------------------------------------------------------------------------
     # Helper Methods
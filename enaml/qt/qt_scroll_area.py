@@ -5,8 +5,9 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Typed, Value
+from atom.api import Int, Typed, Value
 
+from enaml.layout.geometry import Pos, Size
 from enaml.widgets.scroll_area import ProxyScrollArea
 
 from .QtCore import Qt, QEvent, QSize, QRect, QPoint, Signal
@@ -24,6 +25,10 @@ POLICIES = {
 }
 
 
+#: A cyclic guard flag
+POSITION_FLAG = 0x1
+
+
 class QCustomScrollArea(QScrollArea):
     """ A custom QScrollArea for use with the QtScrollArea.
 
@@ -35,6 +40,9 @@ class QCustomScrollArea(QScrollArea):
     #: the scroll area is no longer valid.
     layoutRequested = Signal()
 
+    #: A signal emitted when the viewport of the scroll area is resized.
+    viewportResized = Signal()
+
     #: A private internally cached size hint.
     _size_hint = QSize()
 
@@ -59,6 +67,17 @@ class QCustomScrollArea(QScrollArea):
             self.layoutRequested.emit()
         return res
 
+    def viewportEvent(self, event):
+        """ A custom event handler for the viewport.
+
+        This handler emits the `viewportResized` signal.
+
+        """
+        res = super(QCustomScrollArea, self).viewportEvent(event)
+        if event.type() == QEvent.Resize:
+            self.viewportResized.emit()
+        return res
+
     def setWidget(self, widget):
         """ Set the widget for this scroll area.
 
@@ -118,6 +137,9 @@ class QtScrollArea(QtFrame, ProxyScrollArea):
     #: A private cache of the old size hint for the scroll area.
     _old_hint = Value()
 
+    #: Cyclic notification guard flags.
+    _guard = Int(0)
+
     #--------------------------------------------------------------------------
     # Initialization API
     #--------------------------------------------------------------------------
@@ -145,6 +167,11 @@ class QtScrollArea(QtFrame, ProxyScrollArea):
         widget = self.widget
         widget.setWidget(self.scroll_widget())
         widget.layoutRequested.connect(self.on_layout_requested)
+        widget.horizontalScrollBar().valueChanged.connect(self.on_scrolled)
+        widget.verticalScrollBar().valueChanged.connect(self.on_scrolled)
+        widget.viewportResized.connect(self.on_viewport_resized)
+        self.set_scroll_position(self.declaration.scroll_position)
+        self.on_viewport_resized()
 
     #--------------------------------------------------------------------------
     # Utility Methods
@@ -188,6 +215,29 @@ class QtScrollArea(QtFrame, ProxyScrollArea):
             self._old_hint = new_hint
             self.geometry_updated()
 
+    def on_scrolled(self):
+        """ Handle the `valueChanged` signal of the scroll bars.
+
+        """
+        if not self._guard & POSITION_FLAG:
+            self._guard |= POSITION_FLAG
+            try:
+                widget = self.widget
+                x = widget.horizontalScrollBar().value()
+                y = widget.verticalScrollBar().value()
+                with self.write_back():
+                    self.declaration.scroll_position = Pos(x, y)
+            finally:
+                self._guard &= ~POSITION_FLAG
+
+    def on_viewport_resized(self):
+        """ Handle the `viewportResized` signal from the QScrollArea.
+
+        """
+        size = self.widget.viewport().size()
+        with self.write_back():
+            self.declaration.viewport_size = Size(size.width(), size.height())
+
     #--------------------------------------------------------------------------
     # Overrides
     #--------------------------------------------------------------------------
@@ -220,3 +270,16 @@ class QtScrollArea(QtFrame, ProxyScrollArea):
 
         """
         self.widget.setWidgetResizable(resizable)
+
+    def set_scroll_position(self, position):
+        """ Set the position of the scroll bars of the widget.
+
+        """
+        if not self._guard & POSITION_FLAG:
+            self._guard |= POSITION_FLAG
+            try:
+                widget = self.widget
+                widget.horizontalScrollBar().setValue(position.x)
+                widget.verticalScrollBar().setValue(position.y)
+            finally:
+                self._guard &= ~POSITION_FLAG
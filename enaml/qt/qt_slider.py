@@ -85,7 +85,8 @@ class QtSlider(QtControl, ProxySlider):
         if not self._guard & VALUE_FLAG:
             self._guard |= VALUE_FLAG
             try:
-                self.declaration.value = self.widget.value()
+                with self.write_back():
+                    self.declaration.value = self.widget.value()
             finally:
                 self._guard &= ~VALUE_FLAG
 
@@ -66,7 +66,8 @@ class QtSpinBox(QtControl, ProxySpinBox):
         if not self._guard & VALUE_FLAG:
             self._guard |= VALUE_FLAG
             try:
-                self.declaration.value = self.widget.value()
+                with self.write_back():
+                    self.declaration.value = self.widget.value()
             finally:
                 self._guard &= ~VALUE_FLAG
 
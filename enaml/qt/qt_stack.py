@@ -335,6 +335,7 @@ class QtStack(QtConstraintsWidget, ProxyStack):
             widget.addWidget(item)
         # Bypass the transition effect during initialization.
         widget.setCurrentIndex(self.declaration.index)
+        self.select_item(self.declaration.index)
         widget.layoutRequested.connect(self.on_layout_requested)
         widget.currentChanged.connect(self.on_current_changed)
 
@@ -350,6 +351,18 @@ class QtStack(QtConstraintsWidget, ProxyStack):
             if w is not None:
                 yield w
 
+    def select_item(self, index):
+        """ Notify the declarations of the stack items of the selection.
+
+        """
+        items = self.declaration.stack_items()
+        if 0 <= index < len(items):
+            for i, item in enumerate(items):
+                if i == index:
+                    item._handle_selected()
+                else:
+                    item._handle_deselected()
+
     #--------------------------------------------------------------------------
     # Child Events
     #--------------------------------------------------------------------------
@@ -387,9 +400,11 @@ class QtStack(QtConstraintsWidget, ProxyStack):
         if not self._guard & INDEX_FLAG:
             self._guard |= INDEX_FLAG
             try:
-                self.declaration.index = self.widget.currentIndex()
+                with self.write_back():
+                    self.declaration.index = self.widget.currentIndex()
             finally:
                 self._guard &= ~INDEX_FLAG
+        self.select_item(self.widget.currentIndex())
 
     #--------------------------------------------------------------------------
     # Widget Update Methods
@@ -399,6 +414,7 @@ class QtStack(QtConstraintsWidget, ProxyStack):
 
         """
         if not self._guard & INDEX_FLAG:
+            self.select_item(index)
             self._guard |= INDEX_FLAG
             try:
                 self.widget.transitionTo(index)
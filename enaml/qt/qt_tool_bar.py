@@ -290,7 +290,8 @@ class QtToolBar(QtConstraintsWidget, ProxyToolBar):
         if not self._guard & FLOATED_GUARD:
             self._guard |= FLOATED_GUARD
             try:
-                self.declaration.floating = True
+                with self.write_back():
+                    self.declaration.floating = True
             finally:
                 self._guard &= ~FLOATED_GUARD
 
@@ -301,8 +302,9 @@ class QtToolBar(QtConstraintsWidget, ProxyToolBar):
         if not self._guard & FLOATED_GUARD:
             self._guard |= FLOATED_GUARD
             try:
-                self.declaration.floating = False
-                self.declaration.dock_area = DOCK_AREAS_INV[area]
+                with self.write_back():
+                    self.declaration.floating = False
+                    self.declaration.dock_area = DOCK_AREAS_INV[area]
             finally:
                 self._guard &= ~FLOATED_GUARD
 
@@ -87,11 +87,21 @@ class QtToolkitObject(ProxyToolkitObject):
         This destructor will clear the reference to the toolkit widget
         and set its parent to None.
 
+        When the declaration is destroyed along with its parent, a widget
+        which has a parent is deleted by Qt along with the widget of the
+        destroyed subtree root. Its signals are blocked instead, since
+        the proxies they are connected to are destroyed.
+
         """
         widget = self.widget
         if widget is not None:
-            widget.setParent(None)
-            widget.deleteLater()
+            d = self.declaration
+            if (d is not None and d.is_destroyed_with_parent and
+                    widget.parent() is not None):
+                widget.blockSignals(True)
+            else:
+                widget.setParent(None)
+                widget.deleteLater()
             del self.widget
         super(QtToolkitObject, self).destroy()
 
@@ -100,6 +100,23 @@ class QtWidget(QtToolkitObject, ProxyWidget):
         # the QWidgetAction is dropped.
         del self._widget_action
 
+    def apply_updates(self, changes):
+        """ Apply a batch of coalesced attribute changes.
+
+        The updates of the widget are disabled while several changes
+        are applied, so that it is repainted once.
+
+        """
+        widget = self.widget
+        if len(changes) > 1 and widget.updatesEnabled():
+            widget.setUpdatesEnabled(False)
+            try:
+                super(QtWidget, self).apply_updates(changes)
+            finally:
+                widget.setUpdatesEnabled(True)
+        else:
+            super(QtWidget, self).apply_updates(changes)
+
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
@@ -38,7 +38,12 @@ def finalize_close(d):
     close before the declaration is potentially destroyed.
 
     """
-    d.visible = False
+    proxy = d.proxy
+    if proxy is not None:
+        with proxy.write_back():
+            d.visible = False
+    else:
+        d.visible = False
     d.closed()
     if d.destroy_on_close:
         d.destroy()
@@ -21,6 +21,9 @@ using namespace PythonHelpers;
 
 static PyObject* parent_str;
 static PyObject* dynamic_load_str;
+static PyObject* scope_cache_str;
+static PyObject* scope_generation;
+static unsigned long scope_generation_count;
 static PyObject* UserKeyError;
 
 
@@ -136,73 +139,100 @@ run_tracer( PyObject* tracer, PyObject* owner, PyObject* name, PyObject* value )
 
 
 static PyObject*
-load_dynamic_attr( PyObject* obj, PyObject* name, PyObject* tracer=0 )
+load_object_attr( PyObject* obj, PyObject* name, PyObject* tracer, bool* found )
 {
     PyTypeObject* tp;
     PyObject** dictptr;
     PyObjectPtr descr;
     descrgetfunc descr_f;
-    PyObjectPtr objptr( newref( obj ) );
 
-    // The body of this loop is PyObject_GenericGetAttr, modified to
-    // use smart pointers and _PyObject_GetDictPtr, and run a tracer.
-    while( objptr.get() != Py_None )
+    // The body of this function is PyObject_GenericGetAttr, modified to
+    // use smart pointers and _PyObject_GetDictPtr, and run a tracer. The
+    // `found` flag is set to false if the object does not provide the
+    // attribute, in which case the return value is null without error.
+    *found = true;
+    tp = Py_TYPE( obj );
+
+    // Data descriptor
+    descr_f = 0;
+    descr = xnewref( _PyType_Lookup( tp, name ) );
+    if( descr )
     {
-        tp = Py_TYPE( objptr.get() );
-
-        // Data descriptor
-        descr_f = 0;
-        descr = xnewref( _PyType_Lookup( tp, name ) );
-        if( descr )
-        {
-            descr_f = descr.get()->ob_type->tp_descr_get;
-            if( descr_f && PyDescr_IsData( descr.get() ) )
-            {
-                PyObjectPtr res(
-                    descr_f( descr.get(), objptr.get(), pyobject_cast( tp ) )
-                );
-                if( !res )
-                    maybe_translate_key_error();
-                else if( tracer && !run_tracer( tracer, objptr.get(), name, res.get() ) )
-                    return 0;
-                return res.release();
-            }
-        }
-
-        // Instance dictionary
-        dictptr = _PyObject_GetDictPtr( objptr.get() );
-        if( dictptr && *dictptr )
-        {
-            PyObject* item = PyDict_GetItem( *dictptr, name );
-            if( item )
-            {
-                if( tracer && !run_tracer( tracer, objptr.get(), name, item ) )
-                    return 0;
-                return newref( item );
-            }
-        }
-
-        // Non-data descriptor
-        if( descr_f )
+        descr_f = descr.get()->ob_type->tp_descr_get;
+        if( descr_f && PyDescr_IsData( descr.get() ) )
         {
-            PyObjectPtr res(
-                descr_f( descr.get(), objptr.get(), pyobject_cast( tp ) )
-            );
+            PyObjectPtr res( descr_f( descr.get(), obj, pyobject_cast( tp ) ) );
             if( !res )
                 maybe_translate_key_error();
-            else if( tracer && !run_tracer( tracer, objptr.get(), name, res.get() ) )
+            else if( tracer && !run_tracer( tracer, obj, name, res.get() ) )
                 return 0;
             return res.release();
         }
+    }
 
-        // Non-readable descriptor
-        if( descr )
+    // Instance dictionary
+    dictptr = _PyObject_GetDictPtr( obj );
+    if( dictptr && *dictptr )
+    {
+        PyObject* item = PyDict_GetItem( *dictptr, name );
+        if( item )
         {
-            if( tracer && !run_tracer( tracer, objptr.get(), name, descr.get() ) )
+            if( tracer && !run_tracer( tracer, obj, name, item ) )
                 return 0;
-            return descr.release();
+            return newref( item );
+        }
+    }
+
+    // Non-data descriptor
+    if( descr_f )
+    {
+        PyObjectPtr res( descr_f( descr.get(), obj, pyobject_cast( tp ) ) );
+        if( !res )
+            maybe_translate_key_error();
+        else if( tracer && !run_tracer( tracer, obj, name, res.get() ) )
+            return 0;
+        return res.release();
+    }
+
+    // Non-readable descriptor
+    if( descr )
+    {
+        if( tracer && !run_tracer( tracer, obj, name, descr.get() ) )
+            return 0;
+        return descr.release();
+    }
+
+    *found = false;
+    return 0;
+}
+
+
+static PyObject*
+load_dynamic_attr( PyObject* obj, PyObject* name, PyObject* tracer=0,
+                   PyObject** resolver=0 )
+{
+    bool found;
+    PyObjectPtr objptr( newref( obj ) );
+
+    // Walk up the parent hierarchy until an object provides the name.
+    // If `resolver` is given, it is set to a new reference to the object
+    // which provided the name, provided that the lookup of the name can
+    // be safely cached: none of the skipped objects has an instance dict
+    // which could later shadow the resolved attribute.
+    bool cacheable = resolver != 0;
+    while( objptr.get() != Py_None )
+    {
+        PyObject* res = load_object_attr( objptr.get(), name, tracer, &found );
+        if( found )
+        {
+            if( res && cacheable )
+                *resolver = objptr.release();
+            return res;
         }
 
+        if( cacheable && _PyObject_GetDictPtr( objptr.get() ) )
+            cacheable = false;
+
         // Step up to the parent object
         objptr = PyObject_GetAttr( objptr.get(), parent_str );
         if( !objptr )
@@ -213,6 +243,83 @@ load_dynamic_attr( PyObject* obj, PyObject* name, PyObject* tracer=0 )
 }
 
 
+static PyObject*
+get_scope_cache( PyObject* owner )
+{
+    // Only objects which declare the cache member participate in the
+    // caching, since only they invalidate the cache when reparented.
+    PyTypeObject* tp = Py_TYPE( owner );
+    PyObject* descr = _PyType_Lookup( tp, scope_cache_str );
+    if( !descr || !descr->ob_type->tp_descr_get )
+        return 0;
+    PyObjectPtr cache(
+        descr->ob_type->tp_descr_get( descr, owner, pyobject_cast( tp ) )
+    );
+    if( !cache )
+    {
+        PyErr_Clear();
+        return 0;
+    }
+    if( !PyDict_CheckExact( cache.get() ) )
+    {
+        cache = PyDict_New();
+        if( !cache || PyObject_SetAttr( owner, scope_cache_str, cache.get() ) < 0 )
+        {
+            PyErr_Clear();
+            return 0;
+        }
+    }
+
+    // Discard the cache content if any object was reparented since the
+    // cache was filled. The generation is stored under the None key.
+    if( PyDict_GetItem( cache.get(), Py_None ) != scope_generation )
+    {
+        PyDict_Clear( cache.get() );
+        if( PyDict_SetItem( cache.get(), Py_None, scope_generation ) < 0 )
+        {
+            PyErr_Clear();
+            return 0;
+        }
+    }
+    return cache.release();
+}
+
+
+static PyObject*
+load_cached_dynamic_attr( PyObject* owner, PyObject* name, PyObject* tracer )
+{
+    PyObjectPtr cache( get_scope_cache( owner ) );
+    if( !cache )
+        return load_dynamic_attr( owner, name, tracer );
+
+    // Lookup the attribute directly on the object which resolved the name
+    // during a previous evaluation.
+    PyObjectPtr resolver( xnewref( PyDict_GetItem( cache.get(), name ) ) );
+    if( resolver )
+    {
+        bool found;
+        PyObject* res = load_object_attr( resolver.get(), name, tracer, &found );
+        if( found )
+            return res;
+        if( PyDict_DelItem( cache.get(), name ) < 0 )
+            return 0;
+    }
+
+    PyObject* new_resolver = 0;
+    PyObject* res = load_dynamic_attr( owner, name, tracer, &new_resolver );
+    if( new_resolver )
+    {
+        PyObjectPtr resolverptr( new_resolver );
+        if( PyDict_SetItem( cache.get(), name, new_resolver ) < 0 )
+        {
+            Py_XDECREF( res );
+            return 0;
+        }
+    }
+    return res;
+}
+
+
 static int
 set_dynamic_attr( PyObject* obj, PyObject* name, PyObject* value )
 {
@@ -659,7 +766,7 @@ DynamicScope_getitem( DynamicScope* self, PyObject* key )
     if( res )
         return newref( res );
 
-    res = load_dynamic_attr( self->owner, key, self->tracer );
+    res = load_cached_dynamic_attr( self->owner, key, self->tracer );
     if( res )
         return res;
     if( PyErr_Occurred() )
@@ -834,8 +941,23 @@ struct module_state {
 };
 
 
+static PyObject*
+invalidate_scope_caches( PyObject* mod, PyObject* args )
+{
+    PyObject* generation = PyLong_FromUnsignedLong( ++scope_generation_count );
+    if( !generation )
+        return 0;
+    PyObject* old = scope_generation;
+    scope_generation = generation;
+    Py_DECREF( old );
+    Py_RETURN_NONE;
+}
+
+
 static PyMethodDef
 dynamicscope_methods[] = {
+    { "invalidate_scope_caches", ( PyCFunction )invalidate_scope_caches, METH_NOARGS,
+      "Invalidate the name resolution caches of all dynamic scopes." },
     { 0 } // sentinel
 };
 
@@ -888,6 +1010,12 @@ MOD_INIT_FUNC(dynamicscope)
     dynamic_load_str = Py23Str_FromString( "dynamic_load" );
     if( !dynamic_load_str )
         INITERROR;
+    scope_cache_str = Py23Str_FromString( "_d_scope_cache" );
+    if( !scope_cache_str )
+        INITERROR;
+    scope_generation = PyLong_FromUnsignedLong( 0 );
+    if( !scope_generation )
+        INITERROR;
     UserKeyError = PyErr_NewException( "dynamicscope.UserKeyError", 0, 0 );
     if( !UserKeyError )
         INITERROR;
@@ -0,0 +1,170 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+""" A mixin for the widgets whose content is shown upon selection.
+
+"""
+from atom.api import Bool, Int, List
+
+from enaml.application import timed_call
+from enaml.core.compiler_nodes import reenter_scope
+from enaml.core.declarative import Declarative, d_
+
+
+class LazyContent(Declarative):
+    """ A mixin class for the items of a Notebook or a Stack.
+
+    The content of such an item is only visible once the item has been
+    selected by its parent. When the item is `lazy`, the declarative
+    children of the item are not built with it. They are built the
+    first time the item is selected, and can be destroyed again when
+    the item has not been selected for `release_timeout` milliseconds.
+
+    The children of a lazy item do not exist until it is selected, so
+    the identifiers and aliases which refer to them should not be used
+    before that.
+
+    """
+    #: Whether the children of the item are built upon its selection.
+    #: This value is not expected to change once the item is created.
+    #: When it is bound to an expression, the expression is evaluated
+    #: when the item is initialized, and the children of an item which
+    #: is not lazy are built at that time.
+    lazy = d_(Bool(False))
+
+    #: The time in milliseconds after which the children of a lazy
+    #: item which is no longer selected are destroyed. They are built
+    #: again when the item is selected. Zero keeps the children alive.
+    release_timeout = d_(Int(0))
+
+    #: Whether the item has been selected. The content of an item is
+    #: deferred by a lazy activation until it is selected.
+    _was_selected = Bool(False)
+
+    #: The child nodes of the item, stored as (nodes, key, f_locals).
+    _content_nodes = List()
+
+    #: The children built from the child nodes.
+    _content = List()
+
+    #: The identifier of the pending release of the content, used to
+    #: discard a release which was cancelled by a selection.
+    _release_id = Int(0)
+
+    #: Whether a release of the content is pending.
+    _release_pending = Bool(False)
+
+    #: The item intercepts its child nodes to be able to defer them.
+    #: The child nodes of an item which is not lazy are populated as
+    #: for any declarative object.
+    __intercepts_child_nodes__ = True
+
+    def content_is_built(self):
+        """ Get whether the children of the item have been built.
+
+        """
+        return len(self._content) > 0 or not self._content_nodes
+
+    #--------------------------------------------------------------------------
+    # Reimplementations
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Build the children of an item whose lazy flag was bound.
+
+        """
+        if not self._content and self._content_nodes and not self.lazy:
+            self._build_content()
+        super(LazyContent, self).initialize()
+
+    def child_node_intercept(self, nodes, key, f_locals):
+        """ Store the child nodes until the content is built.
+
+        The child nodes of an item which is not lazy are populated
+        right away. Those of an item whose lazy flag is bound are
+        stored until the flag is evaluated when it is initialized.
+
+        """
+        if not self._lazy_is_bound() and not self.lazy:
+            for node in nodes:
+                node(self)
+            return
+        self._content_nodes.append((nodes, key, f_locals))
+
+    def defer_child_activation(self, child):
+        """ Defer the activation of the content until the item is selected.
+
+        """
+        if not self._was_selected:
+            return True
+        return super(LazyContent, self).defer_child_activation(child)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _lazy_is_bound(self):
+        """ Get whether the lazy flag is computed by an expression.
+
+        The expression may depend on the ancestors of the item, which
+        are not known when the item is created.
+
+        """
+        engine = self._d_engine
+        return (engine is not None and engine.has_reader('lazy') and
+                self.get_member('lazy').get_slot(self) is None)
+
+    def _build_content(self):
+        """ Build the children from the stored child nodes.
+
+        """
+        items = []
+        for nodes, key, f_locals in self._content_nodes:
+            with reenter_scope(key, f_locals):
+                for node in nodes:
+                    child = node(None)
+                    if isinstance(child, list):
+                        items.extend(child)
+                    else:
+                        items.append(child)
+        if items:
+            self.insert_children(None, items)
+        self._content = items
+
+    def _release_content(self, release_id):
+        """ Destroy the children of an item which is no longer selected.
+
+        """
+        if release_id != self._release_id or self.is_destroyed:
+            return
+        self._release_pending = False
+        for item in self._content:
+            if not item.is_destroyed:
+                item.destroy()
+        self._content = []
+
+    def _handle_selected(self):
+        """ A method called by the proxy when the item is selected.
+
+        """
+        if self._release_pending:
+            self._release_id += 1
+            self._release_pending = False
+        if not self._was_selected:
+            self._was_selected = True
+            self.activate_deferred_children()
+        if self.lazy and not self._content and self._content_nodes:
+            self._build_content()
+
+    def _handle_deselected(self):
+        """ A method called by the proxy when another item is selected.
+
+        """
+        if (self.lazy and self.release_timeout > 0 and self._content and
+                not self._release_pending):
+            self._release_id += 1
+            self._release_pending = True
+            timed_call(self.release_timeout, self._release_content,
+                       self._release_id)
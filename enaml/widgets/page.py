@@ -11,6 +11,7 @@ from enaml.core.declarative import d_
 from enaml.icon import Icon
 
 from .container import Container
+from .lazy_content import LazyContent
 from .widget import Widget, ProxyWidget
 
 
@@ -31,12 +32,13 @@ class ProxyPage(ProxyWidget):
         raise NotImplementedError
 
 
-class Page(Widget):
+class Page(LazyContent, Widget):
     """ A widget which can be used as a page in a Notebook control.
 
     A Page is a widget which can be used as a child of a Notebook
     control. It can have at most a single child widget which is an
-    instance of Container.
+    instance of Container. The children of a `lazy` page are built the
+    first time the page is selected.
 
     """
     #: The title to use for the page in the notebook.
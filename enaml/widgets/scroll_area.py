@@ -5,9 +5,12 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Enum, Bool, Typed, ForwardTyped, observe, set_default
+from atom.api import (
+    Enum, Bool, Coerced, Typed, ForwardTyped, observe, set_default
+)
 
 from enaml.core.declarative import d_
+from enaml.layout.geometry import Pos, Size
 
 from .container import Container
 from .frame import Frame, ProxyFrame, Border
@@ -29,6 +32,9 @@ class ProxyScrollArea(ProxyFrame):
     def set_widget_resizable(self, resizable):
         raise NotImplementedError
 
+    def set_scroll_position(self, position):
+        raise NotImplementedError
+
 
 class ScrollArea(Frame):
     """ A Frame which displays a single child in a scrollable area.
@@ -46,6 +52,15 @@ class ScrollArea(Frame):
     #: need for scrollbars or to make use of extra space.
     widget_resizable = d_(Bool(True))
 
+    #: The position of the scroll widget visible at the top left corner
+    #: of the viewport. It is updated when the user scrolls the area, and
+    #: setting it scrolls the area.
+    scroll_position = d_(Coerced(Pos, (0, 0)))
+
+    #: The size of the viewport displaying the scroll widget. It is
+    #: updated by the toolkit when the viewport is resized.
+    viewport_size = d_(Coerced(Size, (0, 0)), writable=False)
+
     #: A scroll area is free to expand in width and height by default.
     hug_width = set_default('ignore')
     hug_height = set_default('ignore')
@@ -77,7 +92,8 @@ class ScrollArea(Frame):
     #--------------------------------------------------------------------------
     # Observers
     #--------------------------------------------------------------------------
-    @observe('horizontal_policy', 'vertical_policy', 'widget_resizable')
+    @observe('horizontal_policy', 'vertical_policy', 'widget_resizable',
+             'scroll_position')
     def _update_proxy(self, change):
         """ An observer which sends state change to the proxy.
 
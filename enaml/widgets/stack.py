@@ -84,6 +84,17 @@ class Stack(ConstraintsWidget):
         """
         return [c for c in self.children if isinstance(c, StackItem)]
 
+    #--------------------------------------------------------------------------
+    # Reimplementations
+    #--------------------------------------------------------------------------
+    def defer_child_activation(self, child):
+        """ Never defer the stack items, since the index refers to them.
+
+        """
+        if isinstance(child, StackItem):
+            return False
+        return super(Stack, self).defer_child_activation(child)
+
     #--------------------------------------------------------------------------
     # Observers
     #--------------------------------------------------------------------------
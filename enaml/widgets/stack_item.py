@@ -8,6 +8,7 @@
 from atom.api import Typed, ForwardTyped
 
 from .container import Container
+from .lazy_content import LazyContent
 from .widget import Widget, ProxyWidget
 
 
@@ -19,12 +20,13 @@ class ProxyStackItem(ProxyWidget):
     declaration = ForwardTyped(lambda: StackItem)
 
 
-class StackItem(Widget):
+class StackItem(LazyContent, Widget):
     """ A widget which can be used as an item in a Stack.
 
     A StackItem is a widget which can be used as a child of a Stack
     widget. It can have at most a single child widget which is an
-    instance of Container.
+    instance of Container. The children of a `lazy` item are built the
+    first time the item is selected.
 
     """
     #: A reference to the ProxyStackItem object.
@@ -5,7 +5,10 @@
 #
 # The full license is in the file COPYING.txt, distributed with this software.
 #------------------------------------------------------------------------------
-from atom.api import Atom, Event, Typed, ForwardTyped
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from atom.api import Atom, Bool, Event, Int, Typed, ForwardTyped
 
 from enaml.application import Application
 from enaml.core.declarative import Declarative, d_
@@ -29,6 +32,9 @@ class ProxyToolkitObject(Atom):
     #: A reference to the ToolkitObject declaration.
     declaration = ForwardTyped(lambda: ToolkitObject)
 
+    #: The number of nested 'write_back' contexts of the proxy.
+    _write_back_depth = Int(0)
+
     @property
     def is_active(self):
         """ Test whether or not the proxy is fully activated.
@@ -59,11 +65,59 @@ class ProxyToolkitObject(Atom):
 
         This method is called by the declaration when it is destroyed.
         It should be reimplemented by subclasses when more control
-        is required.
+        is required. When the declaration is destroyed along with its
+        parent, the 'is_destroyed_with_parent' flag of the declaration
+        is set and the resources owned by the parent resources need not
+        be released one at a time.
 
         """
         del self.declaration
 
+    def apply_updates(self, changes):
+        """ Apply a batch of coalesced attribute changes.
+
+        This method is called when the declaration coalesces its
+        updates. The default implementation calls the setter of each
+        attribute in order. It may be reimplemented by subclasses which
+        can apply related changes more efficiently together.
+
+        Parameters
+        ----------
+        changes : list
+            The list of (name, value) pairs to apply, with the last
+            value of each changed attribute.
+
+        """
+        for name, value in changes:
+            handler = getattr(self, 'set_' + name, None)
+            if handler is not None:
+                handler(value)
+
+    @contextmanager
+    def write_back(self):
+        """ A context manager for writing the widget state to the declaration.
+
+        A proxy which writes the state of its widget back to its
+        declaration, such as the user input, should do so within this
+        context. See 'updates_declaration'.
+
+        """
+        self._write_back_depth += 1
+        try:
+            yield
+        finally:
+            self._write_back_depth -= 1
+
+    def updates_declaration(self):
+        """ Get whether the proxy is writing to its declaration.
+
+        A change written by the proxy is not coalesced, so that it is
+        not applied back to the proxy later. The proxy is writing to
+        its declaration within a 'write_back' context.
+
+        """
+        return self._write_back_depth > 0
+
     def parent(self):
         """ Get the parent proxy object for this object.
 
@@ -81,6 +135,9 @@ class ProxyToolkitObject(Atom):
     def children(self):
         """ Get the child objects for this object.
 
+        The children whose activation is deferred by a lazy activation
+        are not included.
+
         Returns
         -------
         result : generator
@@ -88,7 +145,7 @@ class ProxyToolkitObject(Atom):
 
         """
         for d in self.declaration.children:
-            if isinstance(d, ToolkitObject):
+            if isinstance(d, ToolkitObject) and not d.proxy_is_deferred:
                 yield d.proxy
 
     def child_added(self, child):
@@ -127,6 +184,41 @@ class ProxyToolkitObject(Atom):
 ACTIVE_PROXY_FLAG = next(flag_generator)
 
 
+#: A flag indicating that the object is destroyed along with its parent.
+DESTROYED_WITH_PARENT_FLAG = next(flag_generator)
+
+
+#: A flag indicating that the activation of the object's proxy is deferred.
+DEFERRED_PROXY_FLAG = next(flag_generator)
+
+
+#: A flag indicating that the object inherits a lazy activation.
+LAZY_ACTIVATION_FLAG = next(flag_generator)
+
+
+#: A flag indicating that the object coalesces its proxy updates.
+COALESCE_UPDATES_FLAG = next(flag_generator)
+
+
+#: The toolkit objects with pending proxy updates, mapped to the ordered
+#: last values of their changed attributes. See `flush_proxy_updates`.
+_pending_updates = OrderedDict()
+
+
+def flush_proxy_updates():
+    """ Apply the pending proxy updates of the coalescing objects.
+
+    This is called on the next cycle of the event loop after a proxy
+    update is queued. It can be called directly to apply the pending
+    updates synchronously.
+
+    """
+    while _pending_updates:
+        obj, pending = _pending_updates.popitem(last=False)
+        if obj.proxy_is_active:
+            obj.proxy.apply_updates(list(pending.items()))
+
+
 class ToolkitObject(Declarative):
     """ The base class of all toolkit objects in Enaml.
 
@@ -136,6 +228,18 @@ class ToolkitObject(Declarative):
     #: activate_proxy method.
     activated = d_(Event(), writable=False)
 
+    #: Whether the proxies of the hidden children are activated when
+    #: they are first shown instead of along with this object. This
+    #: applies to all the descendants of the object, and must be set
+    #: before the proxy is activated.
+    lazy_activation = d_(Bool(False))
+
+    #: Whether the changes to the attributes of the object and of its
+    #: descendants are queued and applied to their proxies once per
+    #: cycle of the event loop. Only the last value of each attribute
+    #: is applied. This must be set before the proxy is activated.
+    coalesce_updates = d_(Bool(False))
+
     #: A reference to the ProxyToolkitObject
     proxy = Typed(ProxyToolkitObject)
 
@@ -144,6 +248,27 @@ class ToolkitObject(Declarative):
     #: True by external code after the proxy widget hierarchy is setup.
     proxy_is_active = flag_property(ACTIVE_PROXY_FLAG)
 
+    #: A property which gets and sets the flag indicating that the object
+    #: is destroyed because its parent is destroyed. The proxy can then
+    #: leave the resources which are released along with the ones of the
+    #: parent. This should not be manipulated directly by user code.
+    is_destroyed_with_parent = flag_property(DESTROYED_WITH_PARENT_FLAG)
+
+    #: A property which gets and sets the flag indicating that the proxy
+    #: activation is deferred until the object is shown. This should not
+    #: be manipulated directly by user code.
+    proxy_is_deferred = flag_property(DEFERRED_PROXY_FLAG)
+
+    #: A property which gets and sets the flag indicating that an
+    #: ancestor enabled the lazy activation. This should not be
+    #: manipulated directly by user code.
+    _lazy_ancestor = flag_property(LAZY_ACTIVATION_FLAG)
+
+    #: A property which gets and sets the flag indicating that the
+    #: updates of the proxy are coalesced. This should not be
+    #: manipulated directly by user code.
+    _coalesces_updates = flag_property(COALESCE_UPDATES_FLAG)
+
     def initialize(self):
         """ A reimplemented initializer.
 
@@ -166,6 +291,9 @@ class ToolkitObject(Declarative):
         toolkit object.
 
         """
+        parent = self.parent
+        if parent is not None and parent.is_destroyed:
+            self.is_destroyed_with_parent = True
         super(ToolkitObject, self).destroy()
         self.proxy_is_active = False
         if self.proxy:
@@ -182,6 +310,8 @@ class ToolkitObject(Declarative):
         super(ToolkitObject, self).child_added(child)
         if isinstance(child, ToolkitObject) and self.proxy_is_active:
             if not child.proxy_is_active:
+                if self._defer_activation(child):
+                    return
                 child.activate_proxy()
             self.proxy.child_added(child.proxy)
 
@@ -196,7 +326,8 @@ class ToolkitObject(Declarative):
         """
         super(ToolkitObject, self).child_removed(child)
         if isinstance(child, ToolkitObject) and self.proxy_is_active:
-            self.proxy.child_removed(child.proxy)
+            if not child.proxy_is_deferred:
+                self.proxy.child_removed(child.proxy)
 
     def activate_proxy(self):
         """ Activate the proxy object tree.
@@ -207,14 +338,65 @@ class ToolkitObject(Declarative):
         times and should not normally need to be invoked by user code.
 
         """
+        self.proxy_is_deferred = False
+        parent = self.parent
+        self._coalesces_updates = self.coalesce_updates or (
+            isinstance(parent, ToolkitObject) and parent._coalesces_updates)
         self.activate_top_down()
         for child in self.children:
             if isinstance(child, ToolkitObject):
-                child.activate_proxy()
+                if not self._defer_activation(child):
+                    child.activate_proxy()
         self.activate_bottom_up()
         self.proxy_is_active = True
         self.activated()
 
+    def defer_child_activation(self, child):
+        """ Get whether the proxy activation of a child can be deferred.
+
+        This method is only called when the lazy activation is enabled.
+        The default implementation returns False. It may be reimplemented
+        by subclasses which hide some of their children.
+
+        Parameters
+        ----------
+        child : ToolkitObject
+            The child about to be activated.
+
+        Returns
+        -------
+        result : bool
+            Whether the child is hidden and can be activated later with
+            'activate_deferred_children()'.
+
+        """
+        return False
+
+    def activate_deferred_children(self, children=None):
+        """ Activate the proxies of the children deferred until shown.
+
+        The proxies are activated and added to the proxy of this object
+        as if the children had just been added.
+
+        Parameters
+        ----------
+        children : iterable, optional
+            The deferred children to activate. By default, the deferred
+            children which can no longer be deferred are activated.
+
+        """
+        if not self.proxy_is_active:
+            return
+        if children is None:
+            children = [
+                c for c in self.children if isinstance(c, ToolkitObject)
+                and c.proxy_is_deferred and not self.defer_child_activation(c)
+            ]
+        for child in children:
+            if child.proxy_is_deferred and child.parent is self:
+                child.activate_proxy()
+                self.proxy.child_added(child.proxy)
+
     def activate_top_down(self):
         """ Initialize the proxy on the top-down activation pass.
 
@@ -238,6 +420,22 @@ class ToolkitObject(Declarative):
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _defer_activation(self, child):
+        """ Mark a child as deferred if its activation can be deferred.
+
+        Returns
+        -------
+        result : bool
+            Whether the activation of the child is deferred.
+
+        """
+        if self.lazy_activation or self._lazy_ancestor:
+            child._lazy_ancestor = True
+            if self.defer_child_activation(child):
+                child.proxy_is_deferred = True
+                return True
+        return False
+
     def _update_proxy(self, change):
         """ Update the proxy widget when the Widget data changes.
 
@@ -247,6 +445,30 @@ class ToolkitObject(Declarative):
 
         """
         if change['type'] == 'update' and self.proxy_is_active:
+            if self._coalesces_updates:
+                self._queue_proxy_update(change['name'], change['value'])
+                return
             handler = getattr(self.proxy, 'set_' + change['name'], None)
             if handler is not None:
                 handler(change['value'])
+
+    def _queue_proxy_update(self, name, value):
+        """ Queue an attribute change until the updates are flushed.
+
+        A change written by the proxy itself is applied immediately and
+        discards the pending value of the attribute.
+
+        """
+        pending = _pending_updates.get(self)
+        if self.proxy.updates_declaration():
+            if pending is not None:
+                pending.pop(name, None)
+            handler = getattr(self.proxy, 'set_' + name, None)
+            if handler is not None:
+                handler(value)
+            return
+        if pending is None:
+            if not _pending_updates:
+                Application.instance().deferred_call(flush_proxy_updates)
+            pending = _pending_updates[self] = OrderedDict()
+        pending[name] = value
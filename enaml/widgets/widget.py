@@ -150,9 +150,24 @@ class Widget(ToolkitObject, Stylable):
         # The superclass implementation is sufficient.
         super(Widget, self)._update_proxy(change)
 
+    @observe('visible')
+    def _activate_when_shown(self, change):
+        """ Activate the deferred proxy of the widget when it is shown.
+
+        """
+        if change['type'] == 'update' and change['value']:
+            if self.proxy_is_deferred:
+                self.parent.activate_deferred_children([self])
+
     #--------------------------------------------------------------------------
     # Reimplementations
     #--------------------------------------------------------------------------
+    def defer_child_activation(self, child):
+        """ Defer the activation of the hidden child widgets.
+
+        """
+        return isinstance(child, Widget) and not child.visible
+
     def restyle(self):
         """ Restyle the toolkit widget.
 
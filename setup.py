@@ -180,6 +180,7 @@ setup(
     entry_points={'console_scripts': [
         'enaml-run = enaml.runner:main',
         'enaml-compileall = enaml.compile_all:main',
+        'enaml-bundle = enaml.make_bundle:main',
     ]},
     ext_modules=ext_modules,
     cmdclass={'install': Install,
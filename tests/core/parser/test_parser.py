@@ -82,3 +82,22 @@ def test_syntax_error_traceback_correct_path(tmpdir):
         assert 'File "{}", line 5'.format(test_module_path) in lines[-4]
     finally:
         sys.path.remove(tmpdir.strpath)
+
+
+def test_parser_created_lazily():
+    """Test that importing the import hooks does not build the parser.
+
+    """
+    import subprocess
+    code = ('import sys\n'
+            'import enaml.core.import_hooks\n'
+            'import enaml.core.parser as p\n'
+            'assert p._parser is None\n'
+            'assert not [m for m in sys.modules if m.startswith('
+            '"enaml.core.parser.parser")]\n'
+            'assert p.parse("a = 1\\n") is not None\n'
+            'assert p._parser is p.get_parser()\n')
+    root = os.path.dirname(os.path.dirname(os.path.dirname(enaml.__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([root, env.get('PYTHONPATH', '')])
+    subprocess.check_call([sys.executable, '-c', code], env=env)
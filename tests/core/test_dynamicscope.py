@@ -11,7 +11,9 @@ import sys
 import pytest
 
 from atom.datastructures.api import sortedmap
-from enaml.core.dynamicscope import UserKeyError, DynamicScope
+from enaml.core.dynamicscope import (
+    UserKeyError, DynamicScope, invalidate_scope_caches
+)
 
 
 @pytest.fixture
@@ -338,3 +340,103 @@ def test_nonlocals_call(dynamicscope, nonlocals):
     with pytest.raises(ValueError):
         nonlocals(level=2)
 
+
+class CachedNode(object):
+    """Node participating in the name resolution cache.
+
+    """
+    __slots__ = ('_parent', '_d_scope_cache')
+
+    def __init__(self, parent=None):
+        self._parent = parent
+        self._d_scope_cache = None
+
+
+class Root(CachedNode):
+    __slots__ = ()
+
+    value = 1
+
+
+class OtherRoot(CachedNode):
+    __slots__ = ()
+
+    value = 2
+
+
+def test_dynamicscope_resolution_cache():
+    """Test that the ancestor resolving a name is cached on the owner.
+
+    """
+    root = Root()
+    owner = CachedNode(CachedNode(CachedNode(root)))
+    scope = DynamicScope(owner, sortedmap(), {}, {})
+    assert scope['value'] == 1
+    assert owner._d_scope_cache['value'] is root
+
+    # The cached resolution is used by new scopes
+    scope = DynamicScope(owner, sortedmap(), {}, {})
+    assert scope['value'] == 1
+
+    with pytest.raises(KeyError):
+        scope['unknown']
+    assert 'unknown' not in owner._d_scope_cache
+
+
+def test_dynamicscope_resolution_cache_invalidation():
+    """Test that reparenting and invalidating clears the cache.
+
+    """
+    owner = CachedNode(CachedNode(Root()))
+    scope = DynamicScope(owner, sortedmap(), {}, {})
+    assert scope['value'] == 1
+
+    other = OtherRoot()
+    owner._parent._parent = other
+    invalidate_scope_caches()
+    scope = DynamicScope(owner, sortedmap(), {}, {})
+    assert scope['value'] == 2
+    assert owner._d_scope_cache['value'] is other
+
+
+def test_dynamicscope_resolution_not_cached_with_dict():
+    """Test that a resolution skipping an instance dict is not cached.
+
+    """
+    class DictNode(object):
+
+        def __init__(self, parent):
+            self._parent = parent
+
+    owner = CachedNode(DictNode(Root()))
+    scope = DynamicScope(owner, sortedmap(), {}, {})
+    assert scope['value'] == 1
+    assert 'value' not in owner._d_scope_cache
+
+    owner._parent.value = 3
+    assert scope['value'] == 3
+
+
+def test_dynamicscope_resolution_cache_set_parent():
+    """Test that a cached name resolves through the new ancestor after
+    a reparenting with set_parent.
+
+    """
+    from atom.api import Int
+    from enaml.core.declarative import Declarative, d_
+
+    class Holder(Declarative):
+        value = d_(Int())
+
+    first = Holder(value=1)
+    second = Holder(value=2)
+    middle = Declarative(parent=first)
+    owner = Declarative(parent=middle)
+    scope = DynamicScope(owner, sortedmap(), {}, {})
+    assert scope['value'] == 1
+    assert owner._d_scope_cache['value'] is first
+
+    middle.set_parent(second)
+    scope = DynamicScope(owner, sortedmap(), {}, {})
+    assert scope['value'] == 2
+    assert owner._d_scope_cache['value'] is second
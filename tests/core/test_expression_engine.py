@@ -0,0 +1,103 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the batching of expression updates.
+
+"""
+from atom.api import Atom, Int
+
+from enaml.core.api import batch_updates
+
+from utils import compile_source
+
+
+class Model(Atom):
+
+    a = Int()
+
+    b = Int()
+
+
+SOURCE =\
+"""from enaml.core.api import Declarative
+
+def compute(a, b):
+    calls.append((a, b))
+    return a + b
+
+enamldef Main(Declarative):
+
+    attr model
+    attr value << compute(model.a, model.b)
+
+"""
+
+
+def build():
+    calls = []
+    main = compile_source(SOURCE, 'Main', namespace={'calls': calls})
+    model = Model()
+    obj = main(model=model)
+    assert obj.value == 0
+    del calls[:]
+    return obj, model, calls
+
+
+def test_unbatched_updates():
+    """Test that without a batch each change triggers an evaluation.
+
+    """
+    obj, model, calls = build()
+    model.a = 1
+    model.b = 2
+    assert calls == [(1, 0), (1, 2)]
+    assert obj.value == 3
+
+
+def test_batched_updates():
+    """Test that a batch evaluates each binding once on exit.
+
+    """
+    obj, model, calls = build()
+    with batch_updates():
+        model.a = 1
+        model.b = 2
+        model.a = 3
+        assert calls == []
+        assert obj.value == 0
+    assert calls == [(3, 2)]
+    assert obj.value == 5
+
+
+def test_nested_batches():
+    """Test that nested batches are flushed by the outermost one.
+
+    """
+    obj, model, calls = build()
+    with batch_updates():
+        with batch_updates():
+            model.a = 1
+        assert calls == []
+        model.b = 1
+    assert calls == [(1, 1)]
+    assert obj.value == 2
+
+
+def test_batch_flushed_on_error():
+    """Test that the queued updates are run when the block raises.
+
+    """
+    obj, model, calls = build()
+    try:
+        with batch_updates():
+            model.a = 1
+            raise ValueError()
+    except ValueError:
+        pass
+    assert obj.value == 1
+    model.b = 1
+    assert obj.value == 2
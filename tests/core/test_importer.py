@@ -12,7 +12,11 @@ import time
 
 import pytest
 
-from enaml.core.import_hooks import AbstractEnamlImporter, imports
+from enaml.core.import_hooks import (
+    AbstractEnamlImporter, EnamlBundle, EnamlBundleImporter, EnamlImporter,
+    imports, make_file_info, BUNDLE_MAGIC, CHECKED_HASH, UNCHECKED_HASH,
+    HEADER_SIZE, MAGIC
+)
 
 
 # Test handling wrong loader type
@@ -127,6 +131,92 @@ def test_import_cache_only(enaml_module):
     assert name in sys.modules
 
 
+def test_import_with_corrupted_cache(enaml_module):
+    """Test that a corrupted cache is ignored and rewritten.
+
+    """
+    name, _, path = enaml_module
+    importer = EnamlImporter(make_file_info(path))
+    importer.get_code()
+    cache_path = importer.file_info.cache_path
+    with open(cache_path, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+    with open(cache_path, 'wb') as f:
+        f.write(header + b'corrupted')
+
+    code, _ = importer.get_code()
+    assert code.co_filename == path
+    with open(cache_path, 'rb') as f:
+        assert len(f.read()) > HEADER_SIZE + len(b'corrupted')
+
+
+@pytest.mark.parametrize('mode', [CHECKED_HASH, UNCHECKED_HASH])
+def test_hash_based_cache(enaml_module, mode):
+    """Test writing and validating a cache using the source hash.
+
+    """
+    name, folder, path = enaml_module
+    importer = EnamlImporter(make_file_info(path))
+    importer.invalidation_mode = mode
+    importer.get_code()
+
+    cache_path = importer.file_info.cache_path
+    with open(cache_path, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+    assert header[:4] == MAGIC
+    assert importer._is_cache_valid(header)
+
+    # Touching the source does not invalidate the cache
+    os.utime(path, (0, 0))
+    assert importer._is_cache_valid(header)
+
+    # Modifying the source invalidates a checked cache only
+    with open(path, 'a') as f:
+        f.write('\n')
+    assert importer._is_cache_valid(header) == (mode == UNCHECKED_HASH)
+
+    # A cache written with another mode is invalid when a mode is requested
+    importer.invalidation_mode = (CHECKED_HASH if mode == UNCHECKED_HASH
+                                  else UNCHECKED_HASH)
+    assert not importer._is_cache_valid(header)
+
+    # No temporary file should be left behind
+    assert os.listdir(os.path.dirname(cache_path)) == [
+        os.path.basename(cache_path)]
+
+
+def test_directory_listing_cache(tmpdir):
+    """Test that the directory content is cached until it is modified or
+    the caches are invalidated.
+
+    """
+    folder = str(tmpdir)
+    name = '__enaml_test_listing__'
+    sys.path.append(folder)
+    try:
+        assert EnamlImporter.locate_module(name) is None
+
+        path = os.path.join(folder, name + '.enaml')
+        mtime = os.stat(folder).st_mtime
+        with open(path, 'w') as f:
+            f.write(SOURCE)
+
+        # Hide the modification of the directory to the cache
+        os.utime(folder, (mtime, mtime))
+        assert EnamlImporter.locate_module(name) is None
+
+        with imports():
+            importlib.invalidate_caches()
+            assert EnamlImporter.locate_module(name).file_info.src_path == path
+
+        # A modification of the directory is detected
+        os.remove(path)
+        os.utime(folder, (mtime + 10, mtime + 10))
+        assert EnamlImporter.locate_module(name) is None
+    finally:
+        sys.path.remove(folder)
+
+
 def test_handling_importing_a_bugged_module(enaml_module):
     """Test that when importing a bugged module it does not stay in sys.modules
 
@@ -152,7 +242,7 @@ def enaml_importer():
 
     yield imports
 
-    imports._imports__importers = old
+    imports._imports__importers = list(old)
 
 
 def test_importer_management(enaml_importer):
@@ -172,3 +262,49 @@ def test_importer_management(enaml_importer):
 
     with pytest.raises(TypeError):
         enaml_importer.add_importer(object)
+
+
+def test_import_from_bundle(enaml_module, enaml_importer, tmpdir):
+    """Test importing a module packed in a bundle file.
+
+    """
+    from enaml.make_bundle import make_bundle
+    name, folder, path = enaml_module
+    bundle_path = os.path.join(str(tmpdir), 'app.enamlb')
+    assert make_bundle(bundle_path, [folder], quiet=True)
+
+    # Only the bundle can provide the module
+    os.remove(path)
+    enaml_importer.add_importer(EnamlBundleImporter)
+    EnamlBundleImporter.add_bundle(bundle_path)
+    try:
+        EnamlBundleImporter.add_bundle(bundle_path)
+        assert len(EnamlBundleImporter._bundles) == 1
+        with imports():
+            mod = importlib.import_module(name)
+        assert mod.Main
+        assert mod.__file__ == os.path.join(bundle_path, name + '.enaml')
+        assert isinstance(mod.__loader__, EnamlBundleImporter)
+    finally:
+        EnamlBundleImporter.remove_bundle(bundle_path)
+    assert not EnamlBundleImporter._bundles
+    assert EnamlBundleImporter.locate_module(name) is None
+
+
+def test_bundle_for_other_version(tmpdir):
+    """Test that a bundle written for another compiler is rejected.
+
+    """
+    import marshal
+    import struct
+    path = os.path.join(str(tmpdir), 'app.enamlb')
+    head = marshal.dumps(('enaml-py00-cv0', {}))
+    with open(path, 'wb') as f:
+        f.write(BUNDLE_MAGIC + struct.pack('<I', len(head)) + head)
+    with pytest.raises(ValueError):
+        EnamlBundle(path)
+
+    with open(path, 'wb') as f:
+        f.write(b'not a bundle')
+    with pytest.raises(ValueError):
+        EnamlBundle(path)
@@ -0,0 +1,296 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the incremental refresh of the Looper.
+
+"""
+from atom.api import Atom, ContainerList, Int, Str
+
+from utils import compile_source
+
+
+class Model(Atom):
+
+    rows = ContainerList()
+
+
+SOURCE =\
+"""from enaml.core.api import Declarative, Looper
+
+enamldef Item(Declarative):
+    attr value
+    attr text
+
+enamldef Main(Declarative):
+    attr model
+    attr key = None
+    Looper:
+        key << parent.key
+        iterable << model.rows
+        Item:
+            value = loop_item
+            text = '%d:%s' % (loop_index, loop_item)
+
+"""
+
+
+def build(rows, key=None):
+    main = compile_source(SOURCE, 'Main')
+    model = Model(rows=rows)
+    obj = main(model=model, key=key)
+    obj.initialize()
+    return obj, model
+
+
+def looper(obj):
+    return obj.children[-1]
+
+
+def children(obj):
+    return [child for child in obj.children if hasattr(child, 'value')]
+
+
+def values(obj):
+    return [child.value for child in children(obj)]
+
+
+def texts(obj):
+    return [child.text for child in children(obj)]
+
+
+def test_looper_reuses_unchanged_iterations():
+    """Test that reassigning the iterable only creates the new items.
+
+    """
+    obj, model = build([1, 2, 3])
+    assert values(obj) == [1, 2, 3]
+    old = children(obj)
+
+    model.rows = [0, 1, 3, 2, 4]
+    assert values(obj) == [0, 1, 3, 2, 4]
+    new = children(obj)
+    assert new[1] is old[0]
+    assert new[2] is old[2]
+    assert new[3] is old[1]
+    assert obj.children[-1] is looper(obj)
+
+    model.rows = [3]
+    assert children(obj) == [old[2]]
+    assert old[0].is_destroyed and not old[2].is_destroyed
+
+    model.rows = []
+    assert children(obj) == []
+
+
+def test_looper_key_allows_duplicate_and_unhashable_items():
+    """Test matching the iterations with a key callable.
+
+    """
+    a, b = {'id': 1}, {'id': 2}
+    obj, model = build([a, b, a], key=lambda item: item['id'])
+    assert values(obj) == [a, b, a]
+    old = children(obj)
+
+    model.rows = [a, a, b, {'id': 2}]
+    new = children(obj)
+    assert [child.value for child in new] == [a, a, b, b]
+    assert new[0] is old[0] and new[1] is old[2] and new[2] is old[1]
+
+    # Without a key, unhashable items are matched by identity.
+    obj, model = build([a, b])
+    old = children(obj)
+    model.rows = [b, a, dict(a)]
+    assert children(obj)[:2] == [old[1], old[0]]
+
+
+def test_looper_applies_container_changes():
+    """Test applying the changes made in place to the iterable.
+
+    """
+    obj, model = build([1, 2, 3])
+    old = children(obj)
+
+    model.rows.append(4)
+    assert values(obj) == [1, 2, 3, 4]
+    assert children(obj)[:3] == old
+
+    model.rows.insert(1, 5)
+    model.rows.extend([6, 7])
+    assert values(obj) == [1, 5, 2, 3, 4, 6, 7]
+    assert looper(obj).items[1][0].value == 5
+
+    model.rows.pop(2)
+    del model.rows[-1]
+    assert values(obj) == [1, 5, 3, 4, 6]
+    assert old[1].is_destroyed
+
+    model.rows.reverse()
+    assert values(obj) == [6, 4, 3, 5, 1]
+    assert children(obj)[-1] is old[0]
+    assert looper(obj)._iter_keys == [6, 4, 3, 5, 1]
+
+
+def test_looper_rebinds_moved_iterations():
+    """Test that the kept iterations get their new loop index.
+
+    """
+    obj, model = build(['a', 'b', 'c'])
+    old = children(obj)
+
+    model.rows = ['x', 'a', 'b', 'c']
+    assert texts(obj) == ['0:x', '1:a', '2:b', '3:c']
+    assert children(obj)[1:] == old
+
+    model.rows = ['a', 'c', 'b']
+    assert texts(obj) == ['0:a', '1:c', '2:b']
+
+    model.rows.insert(0, 'y')
+    assert texts(obj) == ['0:y', '1:a', '2:c', '3:b']
+
+    model.rows.pop(1)
+    assert texts(obj) == ['0:y', '1:c', '2:b']
+
+
+class Row(Atom):
+
+    id = Int()
+
+    name = Str()
+
+    def __repr__(self):
+        return self.name
+
+
+def test_looper_rebinds_replaced_items_with_same_key():
+    """Test that an iteration reused by key gets the new item.
+
+    """
+    rows = [Row(id=1, name='a'), Row(id=2, name='b')]
+    obj, model = build(rows, key=lambda row: row.id)
+    old = children(obj)
+
+    new_rows = [Row(id=1, name='c'), Row(id=2, name='d')]
+    model.rows = new_rows
+    assert children(obj) == old
+    assert values(obj) == new_rows
+    assert texts(obj) == ['0:c', '1:d']
+
+    model.rows = [Row(id=2, name='e'), Row(id=1, name='f')]
+    assert children(obj) == old[::-1]
+    assert texts(obj) == ['0:e', '1:f']
+
+
+SUBCLASS_SOURCE =\
+"""from enaml.core.api import Declarative, Looper
+
+enamldef Item(Declarative):
+    attr value
+
+enamldef RowLooper(Looper):
+    pass
+
+enamldef Main(Declarative):
+    attr model
+    attr rows << model.rows
+    RowLooper:
+        iterable << model.rows
+        Item:
+            value = loop_item
+
+"""
+
+
+def test_container_changes_only_forwarded_to_loopers():
+    """Test that only the looper bindings receive the container changes.
+
+    """
+    main = compile_source(SUBCLASS_SOURCE, 'Main')
+    model = Model(rows=[1, 2])
+    obj = main(model=model)
+    obj.initialize()
+    assert obj.rows is model.rows
+    changes = []
+    obj.observe('rows', changes.append)
+
+    model.rows.append(3)
+    assert values(obj) == [1, 2, 3]
+    assert changes == []
+
+
+VIRTUAL_SOURCE =\
+"""from enaml.core.api import Declarative, VirtualLooper
+
+enamldef Item(Declarative):
+    attr value
+    attr index
+    attr label
+
+enamldef Main(Declarative):
+    attr rows
+    attr offset = 0
+    attr window = 3
+    VirtualLooper:
+        iterable << rows
+        offset << parent.offset
+        window << parent.window
+        Item:
+            value = loop_item
+            index = loop_index
+            label << str(loop_item)
+
+"""
+
+
+def build_virtual(rows):
+    main = compile_source(VIRTUAL_SOURCE, 'Main')
+    obj = main(rows=rows)
+    obj.initialize()
+    return obj
+
+
+def test_virtual_looper_creates_the_window_only():
+    """Test that only the items in the window are created.
+
+    """
+    obj = build_virtual(list(range(100)))
+    assert values(obj) == [0, 1, 2]
+    assert looper(obj).row_count == 100
+    assert looper(obj).first_index == 0
+
+    obj.offset = 98
+    assert values(obj) == [97, 98, 99]
+    assert looper(obj).first_index == 97
+
+    obj.rows = list(range(2))
+    assert values(obj) == [0, 1]
+    assert looper(obj).row_count == 2
+
+
+def test_virtual_looper_recycles_iterations():
+    """Test that the iterations leaving the window are reused.
+
+    """
+    obj = build_virtual(list(range(100)))
+    old = children(obj)
+
+    obj.offset = 1
+    new = children(obj)
+    assert new == old[1:] + old[:1]
+    assert [(c.value, c.index, c.label) for c in new][-1] == (3, 3, '3')
+
+    obj.offset = 50
+    assert sorted(children(obj), key=id) == sorted(old, key=id)
+    assert values(obj) == [50, 51, 52]
+    assert not any(child.is_destroyed for child in old)
+
+    obj.window = 2
+    assert values(obj) == [50, 51]
+    assert sum(child.is_destroyed for child in old) == 1
+
+    obj.window = 4
+    assert values(obj) == [50, 51, 52, 53]
+    assert [child.index for child in children(obj)] == [50, 51, 52, 53]
@@ -0,0 +1,244 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the parenting API of Object.
+
+"""
+import pytest
+from atom.api import List
+
+from enaml.core.object import Object
+
+
+class Recorder(Object):
+    """An object recording the children notifications.
+
+    """
+    events = List()
+
+    def child_added(self, child):
+        self.events.append(('added', child))
+
+    def child_moved(self, child):
+        self.events.append(('moved', child))
+
+    def child_removed(self, child):
+        self.events.append(('removed', child))
+
+
+def test_insert_children_before_marker():
+    """Test inserting new children before a child or an index.
+
+    """
+    parent = Recorder()
+    a, b = Object(parent=parent), Object(parent=parent)
+    c, d = Object(), Object()
+    parent.insert_children(b, [c])
+    assert parent.children == [a, c, b]
+    parent.insert_children(0, [d])
+    assert parent.children == [d, a, c, b]
+    e = Object()
+    parent.insert_children(10, [e])
+    assert parent.children == [d, a, c, b, e]
+    f = Object()
+    parent.insert_children(Object(), [f])
+    assert parent.children[-1] is f
+    assert all(child.parent is parent for child in parent.children)
+
+
+@pytest.mark.parametrize('count', [2, 40])
+def test_insert_children_moves_children(count):
+    """Test moving existing children along with new ones.
+
+    """
+    parent = Recorder()
+    children = [Object(parent=parent) for i in range(count)]
+    marker = children[0]
+    new = Object()
+    del parent.events[:]
+
+    parent.insert_children(marker, children[1:] + [new])
+    assert parent.children == children[1:] + [new, marker]
+    assert parent.events == ([('moved', c) for c in children[1:]] +
+                             [('added', new)])
+
+
+def test_insert_children_before_inserted_child():
+    """Test that the children are appended when the marker is inserted.
+
+    """
+    parent = Object()
+    a, b, c = [Object(parent=parent) for i in range(3)]
+    parent.insert_children(a, [a, b])
+    assert parent.children == [c, a, b]
+
+
+def test_insert_children_from_other_parent():
+    """Test that a child is removed from the children of its old parent.
+
+    """
+    old = Recorder()
+    child = Object(parent=old)
+    other = Object(parent=old)
+    new = Recorder()
+    new.insert_children(None, [child])
+    assert old.children == [other]
+    assert old.events[-1] == ('removed', child)
+    assert new.children == [child]
+    assert new.events == [('added', child)]
+
+
+def test_set_parent_removes_child():
+    """Test removing children from the end and from the middle.
+
+    """
+    parent = Object()
+    a, b, c = [Object(parent=parent) for i in range(3)]
+    c.set_parent(None)
+    assert parent.children == [a, b]
+    a.set_parent(None)
+    assert parent.children == [b]
+
+
+def test_insert_children_validation():
+    """Test the errors raised for invalid children.
+
+    """
+    parent = Object()
+    child = Object()
+    with pytest.raises(ValueError):
+        parent.insert_children(None, [parent])
+    with pytest.raises(ValueError):
+        parent.insert_children(None, [child, child])
+    with pytest.raises(TypeError):
+        parent.insert_children(None, [1])
+
+
+def build_named_tree():
+    """Build a tree of named objects.
+
+    """
+    root = Object(name='root')
+    a = Object(parent=root, name='a')
+    b = Object(parent=root, name='b')
+    a1 = Object(parent=a, name='item')
+    b1 = Object(parent=b, name='item')
+    b2 = Object(parent=b1, name='deep')
+    return root, a, b, a1, b1, b2
+
+
+@pytest.mark.parametrize('indexed', [False, True])
+def test_find_with_name_index(indexed):
+    """Test that the name index gives the results of a traversal.
+
+    """
+    root, a, b, a1, b1, b2 = build_named_tree()
+    if indexed:
+        b.enable_name_index()
+        assert root._name_index is not None
+
+    assert root.find('item') is a1
+    assert b.find('item') is b1
+    assert root.find_all('item') == [a1, b1]
+    assert root.find('missing') is None
+    assert root.find_all('i.*', regex=True) == [a1, b1]
+    assert root.find_all('.*', regex=True) == list(root.traverse())
+    assert b.find_all('.*', regex=True) == [b, b1, b2]
+
+    c = Object(name='item')
+    root.insert_children(a, [c])
+    assert root.find('item') is c
+    c.name = 'other'
+    assert root.find('item') is a1
+    assert root.find('other') is c
+
+    b1.set_parent(a)
+    assert root.find_all('deep') == [b2]
+    assert b.find('deep') is None
+    b2.set_parent(None)
+    assert root.find('deep') is None
+
+    a1.destroy()
+    assert root.find_all('item') == [b1]
+    root.disable_name_index()
+
+
+@pytest.mark.parametrize('indexed', [False, True])
+def test_find_common_name_in_wide_tree(indexed):
+    """Test that find returns the first of many objects with a name.
+
+    """
+    root = Object()
+    groups = [Object(parent=root) for i in range(20)]
+    labels = [Object(parent=group, name='label') for group in groups]
+    deep = Object(parent=labels[0], name='label')
+    if indexed:
+        root.enable_name_index()
+
+    assert root.find('label') is labels[0]
+    assert groups[3].find('label') is labels[3]
+    assert labels[0].find('label') is labels[0]
+
+    # The positions of the children are updated as the tree changes.
+    root.insert_children(groups[0], [groups[5]])
+    assert root.find('label') is labels[5]
+    groups[5].destroy()
+    labels[0].name = 'first'
+    assert root.find('label') is labels[1]
+    assert root.find('first') is labels[0]
+    assert groups[0].find('label') is deep
+    assert groups[4].find('l.*', regex=True) is labels[4]
+    first = Object(parent=groups[2], name='label')
+    groups[2].insert_children(labels[2], [first])
+    groups[1].destroy()
+    assert root.find('label') is first
+    expected = [first] + labels[2:5] + labels[6:] + [deep]
+    assert root.find_all('label') == expected
+
+
+def test_name_index_appends_same_named_children():
+    """Test that appending children does not compute the positions again.
+
+    """
+    root = Object()
+    root.enable_name_index()
+    index = root._name_index
+    first = Object(parent=root, name='item')
+    assert index.position(first) == 0
+    positions = index._positions[root]
+    items = [first]
+    for i in range(1, 50):
+        items.append(Object(parent=root, name='item'))
+        assert index.position(items[-1]) == i
+    assert index._positions[root] is positions
+    assert index.lookup('item') == items
+    assert root.find('item') is first
+
+    # A child inserted before the others is still found first.
+    other = Object(name='item')
+    root.insert_children(first, [other])
+    assert root.find('item') is other
+    assert index.lookup('item') == [other] + items
+
+
+def test_name_index_lifetime():
+    """Test that the name index is discarded with its root.
+
+    """
+    root, a, b, a1, b1, b2 = build_named_tree()
+    root.enable_name_index()
+    index = root._name_index
+    assert index.lookup('item') == [a1, b1]
+
+    parent = Object()
+    root.set_parent(parent)
+    assert root._name_index is None
+    root.set_parent(None)
+
+    root.enable_name_index()
+    root.destroy()
+    assert root._name_index is None
@@ -0,0 +1,125 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the use of the code transformed by the compiler for the operators.
+
+"""
+import importlib
+import os
+import sys
+
+import pytest
+
+from enaml.compat import exec_
+from enaml.core import operators
+from enaml.core.enaml_compiler import EnamlCompiler
+from enaml.core.import_hooks import imports
+from enaml.core.parser import parse
+
+
+SOURCE =\
+"""from enaml.core.api import Declarative
+
+enamldef Main(Declarative):
+
+    attr a = 1
+    attr b << a + 1
+    attr c := a
+    attr d
+    a >> d
+    a ::
+        self.d = change['value']
+
+"""
+
+
+def test_compiled_code_used_by_standard_operators(monkeypatch):
+    """Test that no code transformation is run when executing the module.
+
+    """
+    code = EnamlCompiler.compile(parse(SOURCE, '<test>'), '<test>')
+
+    def fail(code):
+        raise AssertionError('Code transformation run at import time')
+
+    for kind in operators.CODE_TRANSFORMS:
+        monkeypatch.setitem(operators.CODE_TRANSFORMS, kind, fail)
+
+    namespace = {}
+    exec_(code, namespace)
+    main = namespace['Main']()
+    assert main.b == 2
+    assert main.c == 1
+    main.a = 2
+    assert main.b == 3
+    assert main.d == 2
+
+
+def test_compiled_code_loaded_from_enamlc(tmpdir, monkeypatch):
+    """Test that the transformed code stored in an .enamlc is used.
+
+    """
+    name = '__enaml_test_operators__'
+    folder = str(tmpdir)
+    path = os.path.join(folder, name + '.enaml')
+    with open(path, 'w') as f:
+        f.write(SOURCE)
+    monkeypatch.syspath_prepend(folder)
+    try:
+        with imports():
+            importlib.import_module(name)
+        del sys.modules[name]
+        assert os.listdir(os.path.join(folder, '__enamlcache__'))
+
+        # Only the cache is left, so the module is loaded from it.
+        os.remove(path)
+        transformed = []
+        for kind, transform in list(operators.CODE_TRANSFORMS.items()):
+            def wrapper(code, transform=transform):
+                transformed.append(code)
+                return transform(code)
+            monkeypatch.setitem(operators.CODE_TRANSFORMS, kind, wrapper)
+
+        with imports():
+            module = importlib.import_module(name)
+        main = module.Main()
+        assert main.b == 2
+        main.a = 2
+        assert main.b == 3
+        assert main.d == 2
+        assert not transformed
+    finally:
+        sys.modules.pop(name, None)
+
+    # The transformed code is only kept by the functions of the module.
+    assert operators._compiled_code == (None, None)
+
+
+def test_compiled_code_matched_by_identity():
+    """Test that equal code objects from two files get their own code.
+
+    """
+    first = compile('a + 1', 'first.enaml', 'eval')
+    second = compile('a + 1', 'second.enaml', 'eval')
+    assert first == second
+    compiled = (('simple', operators.simple_code(first)),)
+    with operators.compiled_code(first, compiled):
+        assert operators.transform_code(first, 'simple') is compiled[0][1]
+        new_code = operators.transform_code(second, 'simple')
+    assert new_code.co_filename == 'second.enaml'
+    assert operators.transform_code(first, 'simple') is not compiled[0][1]
+
+
+@pytest.mark.parametrize('kind', sorted(operators.CODE_TRANSFORMS))
+def test_transform_code_fallback(kind):
+    """Test that the transformation is applied when not precompiled.
+
+    """
+    code = compile('a.b', '<test>', 'eval')
+    new_code = operators.transform_code(code, kind)
+    assert new_code is not code
+    assert new_code.co_flags == operators.CODE_TRANSFORMS[kind](code).co_flags
@@ -0,0 +1,118 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the subscription management of the standard tracer.
+
+"""
+from atom.api import Atom, Bool, Int
+
+from utils import compile_source
+
+
+class Model(Atom):
+
+    a = Int()
+
+    b = Int()
+
+    use_a = Bool(True)
+
+
+SOURCE =\
+"""from enaml.core.api import Declarative
+
+enamldef Main(Declarative):
+
+    attr model
+    attr value << model.a if model.use_a else model.b
+
+"""
+
+
+def test_observer_reused_for_unchanged_dependencies():
+    """Test that re-evaluating with the same dependencies keeps the observer.
+
+    """
+    model = Model()
+    main = compile_source(SOURCE, 'Main')(model=model)
+    assert main.value == 0
+    observer = main._d_storage.get('_[value|trace]')
+    assert observer is not None
+
+    model.a = 1
+    assert main.value == 1
+    assert main._d_storage.get('_[value|trace]') is observer
+    assert model.has_observer('a', observer)
+
+
+def test_only_dependency_delta_is_resubscribed():
+    """Test that dependencies which disappeared are unsubscribed.
+
+    """
+    model = Model()
+    main = compile_source(SOURCE, 'Main')(model=model)
+    assert main.value == 0
+    observer = main._d_storage.get('_[value|trace]')
+    assert model.has_observer('a', observer)
+    assert not model.has_observer('b', observer)
+
+    model.use_a = False
+    assert not model.has_observer('a', observer)
+    assert model.has_observer('b', observer)
+    assert model.has_observer('use_a', observer)
+
+    model.b = 2
+    assert main.value == 2
+    model.a = 3
+    assert main.value == 2
+
+
+NESTED_SOURCE =\
+"""from enaml.core.api import Declarative
+
+enamldef Main(Declarative):
+
+    attr models
+    attr other
+    attr value << sum([sum([m.a for i in range(2)]) for m in models]) + other.b
+
+"""
+
+
+def test_dependency_traced_after_nested_comprehension(monkeypatch):
+    """Test that a finalization does not hide the later dependencies.
+
+    """
+    from enaml.core.standard_tracer import StandardTracer
+    calls = []
+    finalize = StandardTracer.finalize
+
+    def counting_finalize(self):
+        calls.append(self.name)
+        finalize(self)
+
+    monkeypatch.setattr(StandardTracer, 'finalize', counting_finalize)
+
+    models = [Model(a=1), Model(a=2)]
+    other = Model(b=10)
+    main = compile_source(NESTED_SOURCE, 'Main')(models=models, other=other)
+    assert main.value == 16
+    assert calls.count('value') > 1
+    observer = main._d_storage.get('_[value|trace]')
+    assert all(model.has_observer('a', observer) for model in models)
+
+    # The dependency traced after the comprehensions is subscribed.
+    assert other.has_observer('b', observer)
+    other.b = 20
+    assert main.value == 26
+
+    # A dependency added by a later evaluation is subscribed as well.
+    main.models = models + [Model(a=3)]
+    assert main.value == 32
+    assert main.models[-1].has_observer('a', observer)
+    main.models[-1].a = 4
+    assert main.value == 34
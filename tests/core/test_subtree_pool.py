@@ -0,0 +1,340 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+"""Test the recycling of the subtrees generated by the patterns.
+
+"""
+import pytest
+
+from enaml.core.api import Declarative
+from enaml.core.subtree_pool import SubtreePool
+
+from utils import compile_source, is_qt_available, wait_for_window_displayed
+
+
+def test_pool_parks_detached_subtrees():
+    """Test parking, taking and clearing subtrees.
+
+    """
+    parent = Declarative()
+    items = [Declarative(parent=parent), Declarative(parent=parent)]
+    pool = SubtreePool(limit=1)
+    assert pool.park('node', items, 'state')
+    assert not parent.children
+    assert all(item.parent is None for item in items)
+
+    other = [Declarative()]
+    assert not pool.park('node', other)
+    assert pool.count() == 1
+    assert pool.take('other') is None
+    assert pool.take('node') == (items, 'state')
+    assert pool.count() == 0
+
+    pool.park('node', items)
+    pool.clear()
+    assert pool.count() == 0
+    assert all(item.is_destroyed for item in items)
+
+
+LOOPER_SOURCE =\
+"""from enaml.core.api import Declarative, Looper
+
+enamldef Item(Declarative):
+    attr value
+    attr label
+    attr initial
+    attr note = 'default'
+
+enamldef Main(Declarative):
+    attr rows
+    Looper:
+        recycle = 4
+        iterable << rows
+        Item:
+            value << loop_item
+            label << '%d: %s' % (loop_index, loop_item)
+            initial = [loop_item for i in range(1)][0]
+
+"""
+
+
+def items(obj):
+    return [child for child in obj.children if hasattr(child, 'value')]
+
+
+def test_looper_recycles_removed_iterations():
+    """Test that a looper reuses the iterations of the removed items.
+
+    """
+    main = compile_source(LOOPER_SOURCE, 'Main')
+    obj = main(rows=[1, 2, 3])
+    obj.initialize()
+    old = items(obj)
+
+    obj.rows = [1]
+    assert [child.value for child in items(obj)] == [1]
+    assert obj.children[-1]._pool.count() == 2
+
+    obj.rows = [1, 5, 6]
+    new = items(obj)
+    assert [child.value for child in new] == [1, 5, 6]
+    assert [child.label for child in new] == ['0: 1', '1: 5', '2: 6']
+    assert [child.initial for child in new] == [1, 5, 6]
+    assert set(new) == set(old)
+    assert obj.children[-1]._pool.count() == 0
+
+    looper = obj.children[-1]
+    obj.rows = []
+    parked = [child for child in old]
+    looper.destroy()
+    assert all(child.is_destroyed for child in parked)
+
+
+def test_looper_recycling_keeps_independent_state():
+    """Test that a reused iteration only evaluates the changed bindings.
+
+    """
+    main = compile_source(LOOPER_SOURCE, 'Main')
+    obj = main(rows=[1, 2])
+    obj.initialize()
+    for child in items(obj):
+        child.note = 'changed'
+
+    obj.rows = [1]
+    obj.rows = [1, 7]
+    new = items(obj)
+    assert [child.initial for child in new] == [1, 7]
+    assert [child.note for child in new] == ['changed', 'changed']
+
+
+CONDITIONAL_SOURCE =\
+"""from enaml.core.api import Conditional, Declarative
+
+enamldef Item(Declarative):
+    attr value
+
+enamldef Main(Declarative):
+    attr show = True
+    attr value = 0
+    attr recycle = 1
+    Conditional:
+        recycle << parent.recycle
+        condition << show
+        Item:
+            value << parent.value
+
+"""
+
+
+def test_conditional_recycles_items():
+    """Test that a conditional reinserts the items it detached.
+
+    """
+    main = compile_source(CONDITIONAL_SOURCE, 'Main')
+    obj = main()
+    obj.initialize()
+    item = items(obj)[0]
+
+    obj.show = False
+    assert items(obj) == []
+    assert not item.is_destroyed
+
+    obj.value = 5
+    obj.show = True
+    assert items(obj) == [item]
+    assert item.value == 5
+
+
+def test_conditional_without_recycling_destroys_items():
+    """Test that the items are destroyed when recycling is disabled.
+
+    """
+    main = compile_source(CONDITIONAL_SOURCE, 'Main')
+    obj = main(recycle=0)
+    obj.initialize()
+    item = items(obj)[0]
+
+    obj.show = False
+    assert item.is_destroyed
+    obj.show = True
+    assert items(obj)[0] is not item
+
+
+def test_conditional_stops_recycling_when_disabled():
+    """Test that disabling recycling on a conditional destroys its items.
+
+    """
+    main = compile_source(CONDITIONAL_SOURCE, 'Main')
+    obj = main()
+    obj.initialize()
+    obj.show = False
+    obj.show = True
+    item = items(obj)[0]
+
+    obj.recycle = 0
+    obj.show = False
+    assert item.is_destroyed
+
+
+KEEP_ALIVE_SOURCE =\
+"""from enaml.core.api import Conditional, Declarative
+
+enamldef Item(Declarative):
+    attr value
+    attr text = 'default'
+    Declarative:
+        pass
+
+enamldef Main(Declarative):
+    attr show = True
+    attr value = 0
+    Conditional:
+        keep_alive = True
+        condition << show
+        Item:
+            value << parent.value
+
+"""
+
+
+def test_conditional_keeps_items_alive():
+    """Test that a kept alive conditional reinserts its items.
+
+    """
+    main = compile_source(KEEP_ALIVE_SOURCE, 'Main')
+    obj = main()
+    obj.initialize()
+    item = items(obj)[0]
+    conditional = obj.children[-1]
+    assert conditional.kept_count() == 0
+
+    obj.show = False
+    assert items(obj) == []
+    assert not item.is_destroyed
+    assert conditional.kept_count() == 2
+
+    obj.value = 5
+    obj.show = True
+    assert items(obj) == [item]
+    assert item.value == 5
+    assert conditional.kept_count() == 0
+
+    obj.show = False
+    conditional.destroy()
+    assert item.is_destroyed
+
+
+def test_conditional_keep_alive_keeps_state():
+    """Test that the state of the kept alive items survives a toggle.
+
+    """
+    main = compile_source(KEEP_ALIVE_SOURCE, 'Main')
+    obj = main()
+    obj.initialize()
+    item = items(obj)[0]
+    item.text = 'user typed'
+
+    for i in range(2):
+        obj.show = False
+        obj.show = True
+    assert items(obj) == [item]
+    assert item.text == 'user typed'
+
+    obj.show = False
+    obj.value = 7
+    obj.show = True
+    assert item.text == 'user typed'
+    assert item.value == 7
+
+
+KEEP_ALIVE_FIELD_SOURCE =\
+"""from enaml.core.api import Conditional
+from enaml.widgets.api import Container, Field, Window
+
+enamldef Main(Window):
+    attr shown = True
+    Container:
+        Conditional:
+            keep_alive = True
+            condition << shown
+            Field:
+                text = 'default'
+
+"""
+
+
+@pytest.mark.skipif(not is_qt_available(), reason='Requires a Qt binding')
+def test_conditional_keep_alive_keeps_widget_state(enaml_qtbot):
+    """Test that the text typed in a kept alive field survives a toggle.
+
+    """
+    win = compile_source(KEEP_ALIVE_FIELD_SOURCE, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+    field = win.children[0].widgets()[0]
+    field.proxy.widget.setText('user typed')
+    field.proxy.on_submit_text()
+    assert field.text == 'user typed'
+
+    win.shown = False
+    win.shown = True
+    assert win.children[0].widgets() == [field]
+    assert field.text == 'user typed'
+    assert field.proxy.widget.text() == 'user typed'
+
+
+TEMPLATE_SOURCE =\
+"""from enaml.core.api import Declarative, DynamicTemplate
+
+enamldef Item(Declarative):
+    attr value
+    attr kind
+    attr label = 'default'
+
+template Tmpl(Kind):
+    Item:
+        kind = Kind
+
+enamldef Main(Declarative):
+    attr kind = 'a'
+    attr value = 0
+    DynamicTemplate:
+        recycle = 2
+        base = Tmpl
+        args << (kind,)
+        data << {'value': value, 'label': 'label %s' % kind}
+
+"""
+
+
+def test_dynamic_template_recycles_items_by_node(enaml_qtbot):
+    """Test that a dynamic template reuses the items of a template node.
+
+    """
+    main = compile_source(TEMPLATE_SOURCE, 'Main')
+    obj = main()
+    obj.initialize()
+    first = items(obj)[0]
+    template = obj.children[-1]
+
+    obj.kind = 'b'
+    enaml_qtbot.wait(10)
+    second = items(obj)[0]
+    assert second is not first
+    assert second.kind == 'b'
+    assert not first.is_destroyed
+
+    obj.value = 3
+    obj.kind = 'a'
+    enaml_qtbot.wait(10)
+    assert items(obj) == [first]
+    assert first.value == 3
+    assert first.label == 'label a'
+    assert template.tagged == {}
+
+    template.destroy()
+    assert second.is_destroyed
@@ -8,7 +8,6 @@
 import os
 import sys
 import enaml
-import struct
 import marshal
 import zipfile
 
@@ -16,7 +15,9 @@ import pytest
 
 from enaml.core.parser import parse
 from enaml.core.enaml_compiler import EnamlCompiler
-from enaml.core.import_hooks import MAGIC, make_file_info
+from enaml.core.import_hooks import (
+    TIMESTAMP, EnamlZipImporter, make_cache_header, make_file_info
+)
 from utils import wait_for_window_displayed, is_qt_available
 
 
@@ -35,8 +36,8 @@ def generate_cache(path):
 
     #: Generate cache
     with open('tmp.enamlc', 'wb') as f:
-        f.write(MAGIC)
-        f.write(struct.pack('i', int(os.path.getmtime(path))))
+        f.write(make_cache_header(TIMESTAMP, int(os.path.getmtime(path)),
+                                  os.path.getsize(path)))
         marshal.dump(code, f)
     with open('tmp.enamlc', 'rb') as f:
         data = f.read()
@@ -151,3 +152,28 @@ def test_zipimport_package_from_cache(enaml_qtbot, enaml_sleep, zip_library):
         #                                 notebook-enaml-py<ver>-cv<ver>.enamlc
         from package.subpackage import notebook
     assert_window_displays(enaml_qtbot, enaml_sleep, notebook.Main())
+
+
+def test_zipimport_archive_index(zip_library):
+    """Test that the archive index is reused and refreshed on changes.
+
+    """
+    EnamlZipImporter.invalidate_caches()
+    try:
+        archive, names = EnamlZipImporter._get_archive(zip_library)
+        assert 'buttons.enaml' in names
+        assert 'extra.enaml' not in names
+        assert EnamlZipImporter._get_archive(zip_library)[0] is archive
+
+        # Rewriting the archive changes its size which invalidates the index
+        with zipfile.ZipFile(zip_library, 'a') as zf:
+            zf.writestr('extra.enaml', 'a = 1\n')
+        new_archive, names = EnamlZipImporter._get_archive(zip_library)
+        assert new_archive is not archive
+        assert 'extra.enaml' in names
+        assert EnamlZipImporter.locate_module('extra') is not None
+
+        assert EnamlZipImporter._get_archive('missing.zip') is None
+    finally:
+        EnamlZipImporter.invalidate_caches()
+    assert not EnamlZipImporter._archives
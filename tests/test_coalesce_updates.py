@@ -0,0 +1,122 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import pytest
+from utils import compile_source, wait_for_window_displayed, is_qt_available
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+SOURCE = \
+"""from enaml.widgets.api import Window, Container, DateSelector, Field, Label
+
+
+enamldef Main(Window):
+
+    alias label
+    alias field
+    alias selector
+
+    coalesce_updates = True
+    Container:
+        Label: label:
+            text = 'Initial'
+        Field: field:
+            text = 'Initial'
+        DateSelector: selector:
+            pass
+"""
+
+
+def test_coalesced_updates(enaml_qtbot, monkeypatch):
+    """Test that only the last value of each attribute is applied.
+
+    """
+    from enaml.qt.qt_label import QtLabel
+    from enaml.widgets.toolkit_object import flush_proxy_updates
+
+    win = compile_source(SOURCE, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+
+    calls = []
+    set_text = QtLabel.set_text
+
+    def counting_set_text(self, text):
+        calls.append(text)
+        set_text(self, text)
+
+    monkeypatch.setattr(QtLabel, 'set_text', counting_set_text)
+
+    label = win.label
+    widget = label.proxy.widget
+    for i in range(3):
+        label.text = 'Text %d' % i
+    label.tool_tip = 'Tip'
+    label.enabled = False
+    assert widget.text() == 'Initial'
+    assert widget.isEnabled()
+
+    enaml_qtbot.wait_until(lambda: widget.text() == 'Text 2')
+    assert calls == ['Text 2']
+    assert widget.toolTip() == 'Tip'
+    assert not widget.isEnabled()
+    assert widget.updatesEnabled()
+
+    label.text = 'Flushed'
+    flush_proxy_updates()
+    assert widget.text() == 'Flushed'
+    assert calls == ['Text 2', 'Flushed']
+
+
+def test_coalesced_updates_proxy_write(enaml_qtbot):
+    """Test that a change written by the proxy discards the pending value.
+
+    """
+    from enaml.widgets.toolkit_object import flush_proxy_updates
+
+    win = compile_source(SOURCE, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+
+    field = win.field
+    widget = field.proxy.widget
+    field.text = 'Model'
+    widget.setText('User')
+    widget.setCursorPosition(1)
+    field.proxy.on_submit_text()
+    assert field.text == 'User'
+
+    flush_proxy_updates()
+    assert widget.text() == 'User'
+    assert widget.cursorPosition() == 1
+
+
+def test_coalesced_updates_unguarded_write(enaml_qtbot):
+    """Test that a write back done outside of a guard is not queued.
+
+    """
+    import datetime
+    from enaml.qt.QtCore import QDate
+    from enaml.widgets.toolkit_object import _pending_updates
+
+    win = compile_source(SOURCE, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+
+    selector = win.selector
+    widget = selector.proxy.widget
+    selector.date = datetime.date(2000, 1, 1)
+    assert 'date' in _pending_updates[selector]
+    widget.setDate(QDate(2001, 2, 3))
+    assert selector.date == datetime.date(2001, 2, 3)
+    assert 'date' not in _pending_updates.get(selector, {})
+
+    win.close()
+    enaml_qtbot.wait_until(lambda: not win.visible)
+    assert win not in _pending_updates
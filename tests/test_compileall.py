@@ -78,3 +78,71 @@ def test_tutorials(enaml_run, tmpdir, tutorial):
         # Now run from cache
         mod = importlib.import_module(tutorial)
         mod.main()
+
+
+def test_pop_workers_option():
+    from enaml.compile_all import pop_workers_option
+    argv = ['enaml-compileall', '-j', '4', '-q', 'src']
+    assert pop_workers_option(argv) == 4
+    assert argv == ['enaml-compileall', '-q', 'src']
+    argv = ['enaml-compileall', '--workers=0', 'src']
+    assert pop_workers_option(argv) == 0
+    assert argv == ['enaml-compileall', 'src']
+    argv = ['enaml-compileall', '-j2', 'src']
+    assert pop_workers_option(argv) == 2
+    assert pop_workers_option(argv) is None
+    with pytest.raises(ValueError, match='non-negative'):
+        pop_workers_option(['enaml-compileall', '--workers', '-1'])
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5),
+                    reason='compileall supports workers on Python 3.5+')
+def test_main_passes_workers_to_compileall(tmpdir, monkeypatch):
+    from enaml import compile_all
+    from enaml.core.import_hooks import make_file_info
+    view = tmpdir.join('view.enaml')
+    view.write('a = 1\n')
+    tmpdir.join('module.py').write('b = 2\n')
+
+    calls = []
+    compile_dir = compileall.compile_dir
+
+    def record(*args, **kwargs):
+        calls.append(kwargs.get('workers'))
+        return compile_dir(*args, **kwargs)
+
+    monkeypatch.setattr(compileall, 'compile_dir', record)
+    monkeypatch.setattr(sys, 'argv', ['enaml-compileall', '--workers', '2',
+                                      '-q', tmpdir.strpath])
+    with pytest.raises(SystemExit) as exc:
+        compile_all.main()
+    assert exc.value.code == 0
+    assert calls == [2]
+    assert os.path.exists(make_file_info(view.strpath).cache_path)
+    assert tmpdir.join('__pycache__').listdir()
+
+
+def test_compile_enaml_files_parallel(tmpdir, capsys):
+    from enaml.compile_all import compile_enaml_files
+    from enaml.core.import_hooks import make_file_info
+    names = []
+    for i in range(4):
+        path = tmpdir.join('view_%d.enaml' % i)
+        path.write('a = %d\n' % i)
+        names.append(path.strpath)
+    broken = tmpdir.join('broken.enaml')
+    broken.write('enamldef Main(\n')
+    names.insert(1, broken.strpath)
+
+    tasks = [(name, False, 0, None) for name in names]
+    assert not compile_enaml_files(tasks, workers=2)
+
+    # The files are reported in the order of the tasks
+    out = capsys.readouterr()[0].splitlines()
+    reported = [line.split()[1].rstrip('.') for line in out
+                if line.startswith('Compil') and 'enaml files' not in line]
+    assert reported == names
+    assert out[-1].startswith('Compiled 5 enaml files')
+    for name in names:
+        cache = os.path.exists(make_file_info(name).cache_path)
+        assert cache is (name != broken.strpath)
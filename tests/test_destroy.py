@@ -0,0 +1,59 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import pytest
+from utils import compile_source, wait_for_window_displayed, is_qt_available
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+SOURCE = \
+"""from enaml.widgets.api import Window, Container, Field, Label
+
+
+enamldef Main(Window):
+
+    alias outer
+    alias field
+    alias label
+    Container:
+        Container: outer:
+            Field: field:
+                pass
+            Label: label:
+                pass
+"""
+
+
+def test_destroy_subtree_releases_root_widget(enaml_qtbot):
+    """Test that only the root widget of a destroyed subtree is deparented.
+
+    """
+    from enaml.qt.QtCore import QCoreApplication, QEvent
+
+    win = compile_source(SOURCE, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+
+    outer = win.outer
+    root_widget = outer.proxy.widget
+    field_widget = win.field.proxy.widget
+    destroyed = []
+    field_widget.destroyed.connect(lambda: destroyed.append(True))
+
+    field, label = win.field, win.label
+    outer.destroy()
+    assert not outer.is_destroyed_with_parent
+    assert field.is_destroyed_with_parent
+    assert label.is_destroyed_with_parent
+    assert root_widget.parent() is None
+    assert field_widget.parent() is root_widget
+    assert field_widget.signalsBlocked()
+
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    assert destroyed
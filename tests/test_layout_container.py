@@ -73,3 +73,110 @@ def test_manual_reparenting(enaml_qtbot):
     wait_for_window_displayed(enaml_qtbot, win)
     win.selected_disp = 'C2'
     win.displayables['C2'].btn_clicked = True
+
+
+SHARED_LAYOUT = \
+"""from enaml.layout.api import hbox
+from enaml.widgets.api import Window, Container, Label
+
+
+enamldef Main(Window):
+
+    alias first
+    alias inner
+    alias second
+
+    Container:
+        constraints = [
+            first.left == contents_left,
+            inner.left == first.right + 10,
+            second.left == contents_left + 400,
+        ]
+        Label: first:
+            text = 'First'
+        Container: inner:
+            share_layout = True
+            constraints = [second.top == contents_top]
+            Label: second:
+                text = 'Second'
+"""
+
+
+def test_shared_layout_offset_moved(enaml_qtbot):
+    """Test that a widget whose parent moved is moved back in place.
+
+    """
+    win = compile_source(SHARED_LAYOUT, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+
+    def second_x():
+        widget = win.second.proxy.widget
+        return widget.mapTo(win.proxy.widget, widget.rect().topLeft()).x()
+
+    x = second_x()
+    win.first.text = 'A much longer text for the first label'
+    enaml_qtbot.wait(50)
+    assert win.inner.proxy.widget.x() > win.first.proxy.widget.width()
+    assert second_x() == x
+
+
+NESTED_CONTAINERS = \
+"""from enaml.widgets.api import Window, Container, Label
+
+
+enamldef Main(Window):
+
+    alias outer
+    alias middle
+    alias inner
+
+    Container: outer:
+        name = "outer"
+        Label:
+            text = 'Outer'
+        Container: middle:
+            name = "middle"
+            Label:
+                text = 'Middle'
+            Container: inner:
+                name = "inner"
+                Label:
+                    text = 'Inner'
+"""
+
+
+def test_relayout_scheduler(enaml_qtbot, monkeypatch):
+    """Test that the relayouts of a window run once, innermost first.
+
+    """
+    from enaml.qt.qt_container import QtContainer, RelayoutScheduler
+
+    win = compile_source(NESTED_CONTAINERS, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+
+    relayouts = []
+    relayout = QtContainer._relayout
+
+    def recording_relayout(self):
+        relayouts.append(self.declaration.name)
+        relayout(self)
+
+    monkeypatch.setattr(QtContainer, '_relayout', recording_relayout)
+
+    scheduler = RelayoutScheduler.for_widget(win.proxy.widget)
+    assert RelayoutScheduler.for_widget(win.inner.proxy.widget) is scheduler
+    passes = scheduler.passes
+    for container in (win.outer, win.middle, win.inner):
+        container.padding = 20
+        container.padding = 30
+    enaml_qtbot.wait_until(lambda: len(relayouts) == 3)
+    enaml_qtbot.wait(50)
+    assert relayouts == ['inner', 'middle', 'outer']
+    assert scheduler.passes == passes + 1
+    assert scheduler.solves > 0
+
+    inner_label = win.inner.widgets()[0].proxy.widget
+    assert inner_label.x() == 30
+    assert win.inner.proxy.widget.x() == 30
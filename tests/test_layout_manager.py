@@ -0,0 +1,287 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import kiwisolver as kiwi
+from atom.api import List, Tuple, Typed
+
+from enaml.layout.constrainable import ContentsConstrainableMixin
+from enaml.layout.layout_helpers import ConstraintCache, grid, vbox
+from enaml.layout.layout_manager import (LayoutItem, LayoutManager,
+                                         _constraint_key)
+
+
+class Box(ContentsConstrainableMixin):
+    pass
+
+
+class Item(LayoutItem):
+    """A layout item recording the geometry applied to it.
+
+    """
+    box = Typed(Box, ())
+
+    hint = Tuple(default=(50, 20))
+
+    margin_values = Tuple()
+
+    children = List()
+
+    geometry = Tuple()
+
+    def constrainable(self):
+        return self.box
+
+    def constraints(self):
+        # Stack the children with a spacing of 10, without a helper.
+        cns = []
+        bottom = self.box.contents_top
+        for child in self.children:
+            cns.append(child.box.top == bottom + 10)
+            cns.append(child.box.left == self.box.contents_left)
+            bottom = child.box.bottom
+        return cns
+
+    def margins(self):
+        return self.margin_values
+
+    def size_hint(self):
+        return self.hint
+
+    def min_size(self):
+        return (-1, -1)
+
+    def max_size(self):
+        return (-1, -1)
+
+    def set_geometry(self, x, y, width, height):
+        self.geometry = (x, y, width, height)
+
+
+class BoxItem(Item):
+    """A layout item laying out its children with a new vbox helper.
+
+    """
+    def constraints(self):
+        return [vbox(*[child.box for child in self.children])]
+
+
+class CountingSolver(kiwi.Solver):
+    """A solver counting the changes made to its constraints.
+
+    """
+    def __init__(self):
+        self.added = 0
+        self.removed = 0
+        self.resets = 0
+
+    def addConstraint(self, cn):
+        self.added += 1
+        super(CountingSolver, self).addConstraint(cn)
+
+    def removeConstraint(self, cn):
+        self.removed += 1
+        super(CountingSolver, self).removeConstraint(cn)
+
+    def reset(self):
+        self.resets += 1
+        super(CountingSolver, self).reset()
+
+
+def build(count):
+    """Build a root item laying out count children vertically.
+
+    """
+    root = Item(margin_values=(10, 10, 10, 10))
+    root.children = [Item() for i in range(count)]
+    manager = LayoutManager(root)
+    manager._solver = CountingSolver()
+    manager.set_items(root.children)
+    return root, manager
+
+
+def geometries(root, manager):
+    manager.resize(200, 1000)
+    return [child.geometry for child in root.children]
+
+
+def test_set_items_only_updates_the_changes():
+    """Test that a relayout only adds and removes the changed constraints.
+
+    """
+    root, manager = build(50)
+    solver = manager._solver
+    assert solver.resets == 1
+    total = solver.added
+
+    root.children.append(Item(hint=(80, 30)))
+    solver.added = 0
+    manager.set_items(root.children)
+    assert solver.resets == 1
+    assert 0 < solver.added + solver.removed < total // 4
+
+    fresh_root = Item(margin_values=(10, 10, 10, 10))
+    fresh_root.children = [Item() for i in range(50)]
+    fresh_root.children.append(Item(hint=(80, 30)))
+    fresh = LayoutManager(fresh_root)
+    fresh.set_items(fresh_root.children)
+    assert geometries(root, manager) == geometries(fresh_root, fresh)
+    assert manager.best_size() == fresh.best_size()
+
+
+def test_set_items_resets_for_large_changes():
+    """Test that the solver is reset when most of the constraints change.
+
+    """
+    root, manager = build(10)
+    root.children = [Item() for i in range(10)]
+    manager.set_items(root.children)
+    assert manager._solver.resets == 2
+    assert geometries(root, manager)[9] == (10, 290, 50, 20)
+
+
+def test_update_geometry_only_replaces_the_changes():
+    """Test that a geometry update keeps the unchanged constraints.
+
+    """
+    root, manager = build(10)
+    solver = manager._solver
+    solver.added = 0
+    child = root.children[3]
+    child.hint = (120, 20)
+    manager.update_geometry(3)
+    # Only the hug and resist constraints of the width are replaced.
+    assert solver.added == solver.removed == 2
+    assert geometries(root, manager)[3] == (10, 110, 120, 20)
+
+    # The replaced constraints can be removed by the next update.
+    child.hint = (50, 20)
+    manager.update_geometry(3)
+    root.margin_values = (0, 0, 0, 0)
+    manager.update_margins(-1)
+    assert geometries(root, manager)[3] == (0, 100, 50, 20)
+
+
+def test_size_bounds_are_cached():
+    """Test that the sizes are only solved again after a change.
+
+    """
+    root, manager = build(5)
+    sizes = (manager.best_size(), manager.min_size(), manager.max_size())
+    assert manager.size_solves == 3
+    assert (manager.best_size(), manager.min_size(),
+            manager.max_size()) == sizes
+    manager.resize(300, 400)
+    assert manager.best_size() == sizes[0]
+    assert manager.size_solves == 3
+    assert manager.size_solves_avoided == 4
+
+    # An update keeping the same constraints keeps the cache.
+    manager.update_geometry(2)
+    manager.best_size()
+    assert manager.size_solves == 3
+
+    root.children[2].hint = (120, 40)
+    manager.update_geometry(2)
+    manager.best_size()
+    assert manager.size_solves == 4
+
+    root.children.append(Item())
+    manager.set_items(root.children)
+    manager.min_size()
+    assert manager.size_solves == 5
+
+
+def test_resize_only_updates_the_moved_items():
+    """Test that a resize only applies the geometries which changed.
+
+    """
+    root, manager = build(10)
+    geometries(root, manager)
+    assert manager.geometry_updates == 10
+    child = root.children[0]
+    child.geometry = ()
+    manager.resize(300, 1000)
+    assert child.geometry == ()
+    assert manager.geometry_updates_avoided == 10
+
+    root.children[6].hint = (50, 40)
+    manager.update_geometry(6)
+    manager.resize(300, 1000)
+    assert manager.geometry_updates == 14
+    assert root.children[9].geometry == (10, 310, 50, 20)
+
+
+def test_constraint_cache_reuses_constraints():
+    """Test that an unchanged helper reuses the constraints of the last one.
+
+    """
+    owner = Box()
+    boxes = [Box() for i in range(3)]
+    cache = ConstraintCache()
+    first = cache.expand(owner, [vbox(*boxes)])
+    second = cache.expand(owner, [vbox(*boxes), boxes[0].width == 10])
+    assert second[:-1] == first
+    assert all(a is b for a, b in zip(first, second))
+
+    # A changed helper adopts the variables of the previous helper, so
+    # only the constraints depending on the spacing differ.
+    third = cache.expand(owner, [vbox(*boxes, spacing=5)])
+    assert not set(map(id, third)) & set(map(id, first))
+    keys = set(map(_constraint_key, first))
+    same = [cn for cn in third if _constraint_key(cn) in keys]
+    assert 0 < len(same) < len(third)
+
+    # A helper used twice generates distinct constraints.
+    helper = grid(boxes[:2], boxes[1:])
+    cns = cache.expand(owner, [helper, helper])
+    assert len(set(map(id, cns))) == len(cns)
+    assert cache.expand(owner, [helper])[0] in cns
+    helper = grid(boxes[:2], boxes[1:])
+    cache.expand(owner, [helper])
+    cns = cache.expand(owner, [helper, grid(boxes[:2], boxes[1:])])
+    assert len(set(map(id, cns))) == len(cns)
+
+
+def test_constraint_cache_referenced_variables():
+    """Test that a helper whose variables are referenced is not replaced.
+
+    """
+    owner = Box()
+    boxes = [Box() for i in range(3)]
+    cache = ConstraintCache()
+    cache.expand(owner, [vbox(*boxes)])
+    helper = vbox(*boxes)
+    cns = cache.expand(owner, [helper, helper.width == 100])
+    variables = set(id(term.variable()) for cn in cns[:-1]
+                    for term in cn.expression().terms())
+    assert id(helper.width) in variables
+
+
+def test_set_items_reuses_helper_constraints():
+    """Test that a relayout with new helpers keeps the solver constraints.
+
+    """
+    root = BoxItem(margin_values=(10, 10, 10, 10))
+    root.children = [Item() for i in range(50)]
+    manager = LayoutManager(root)
+    manager._solver = solver = CountingSolver()
+    manager.set_items(root.children)
+    solver.added = 0
+    manager.set_items(root.children)
+    assert solver.added == solver.removed == 0
+
+    # The new vbox keeps the variables of the last one.
+    root.children.append(Item())
+    manager.set_items(root.children)
+    assert solver.resets == 1
+    assert 0 < solver.added < 20
+
+    fresh_root = BoxItem(margin_values=(10, 10, 10, 10))
+    fresh_root.children = [Item() for i in range(51)]
+    fresh = LayoutManager(fresh_root)
+    fresh.set_items(fresh_root.children)
+    assert geometries(root, manager) == geometries(fresh_root, fresh)
@@ -0,0 +1,101 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import pytest
+from utils import compile_source, wait_for_window_displayed, is_qt_available
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+SOURCE = \
+"""from enaml.widgets.api import (Window, Container, Label, Notebook, Page,
+                                Stack, StackItem)
+
+
+enamldef Main(Window):
+
+    attr lazy = True
+    alias hidden
+    alias notebook
+    alias content_1
+    alias content_2
+    alias stack
+    alias item_1
+    alias item_2
+
+    lazy_activation = lazy
+    Container:
+        Label: hidden:
+            visible = False
+            text = 'Hidden'
+        Notebook: notebook:
+            Page:
+                name = 'p1'
+                Container: content_1:
+                    Label:
+                        text = 'First'
+            Page:
+                name = 'p2'
+                Container: content_2:
+                    Label:
+                        text = 'Second'
+        Stack: stack:
+            StackItem:
+                Container: item_1:
+                    Label:
+                        text = 'First'
+            StackItem:
+                Container: item_2:
+                    Label:
+                        text = 'Second'
+"""
+
+
+def test_lazy_activation(enaml_qtbot):
+    """Test that the hidden widgets are activated when first shown.
+
+    """
+    win = compile_source(SOURCE, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+
+    hidden = win.hidden
+    assert hidden.proxy_is_deferred
+    assert hidden.proxy.widget is None
+    assert win.content_1.proxy_is_active
+    assert win.content_2.proxy_is_deferred
+    assert win.item_1.proxy_is_active
+    assert win.item_2.proxy_is_deferred
+
+    hidden.show()
+    assert hidden.proxy_is_active
+    assert hidden.proxy.widget.isVisibleTo(win.proxy.widget)
+
+    win.notebook.selected_tab = 'p2'
+    content = win.content_2
+    assert content.proxy_is_active
+    page = content.parent.proxy.widget
+    assert page.pageWidget() is content.proxy.widget
+
+    win.stack.index = 1
+    item = win.item_2
+    assert item.proxy_is_active
+    assert item.parent.proxy.widget.stackWidget() is item.proxy.widget
+
+
+def test_eager_activation(enaml_qtbot):
+    """Test that all the widgets are activated by default.
+
+    """
+    win = compile_source(SOURCE, 'Main')(lazy=False)
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+
+    for widget in (win.hidden, win.content_2, win.item_2):
+        assert widget.proxy_is_active
+        assert not widget.proxy_is_deferred
@@ -0,0 +1,132 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import pytest
+from utils import compile_source, wait_for_window_displayed, is_qt_available
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+SOURCE = \
+"""from enaml.core.api import Looper
+from enaml.widgets.api import (Window, Container, Label, Notebook, Page,
+                               Stack, StackItem)
+
+
+enamldef Main(Window):
+
+    attr timeout = 0
+    attr built = []
+    alias notebook
+    alias eager
+    alias lazy_page
+    alias stack
+
+    Container:
+        Notebook: notebook:
+            Page: eager:
+                name = 'eager'
+                Container:
+                    Label:
+                        text = 'Eager'
+            Page: lazy_page:
+                name = 'lazy'
+                lazy = True
+                release_timeout = timeout
+                Container:
+                    Label:
+                        initialized :: built.append(self.text)
+                        text = 'Lazy'
+        Stack: stack:
+            StackItem:
+                Container:
+                    Label:
+                        text = 'First'
+            StackItem:
+                lazy = True
+                release_timeout = timeout
+                Container:
+                    Looper:
+                        iterable = range(3)
+                        Label:
+                            text = 'Item %d' % loop_item
+"""
+
+
+def test_lazy_content(enaml_qtbot):
+    """Test that the content of a lazy item is built when first selected.
+
+    """
+    win = compile_source(SOURCE, 'Main')()
+
+    # The children of an item which is not lazy are built with it.
+    assert not win.eager._content_nodes
+    assert win.eager.page_widget() is not None
+    assert win.stack.stack_items()[0].stack_widget() is not None
+
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+
+    assert win.eager.content_is_built()
+    assert win.eager.page_widget().proxy_is_active
+    page = win.lazy_page
+    assert not page.content_is_built()
+    assert page.page_widget() is None
+    item = win.stack.stack_items()[1]
+    assert item.stack_widget() is None
+
+    win.notebook.selected_tab = 'lazy'
+    assert page.content_is_built()
+    assert win.built == ['Lazy']
+    content = page.page_widget()
+    assert content.proxy_is_active
+    assert page.proxy.widget.pageWidget() is content.proxy.widget
+
+    win.stack.index = 1
+    content = item.stack_widget()
+    assert content.proxy_is_active
+    assert item.proxy.widget.stackWidget() is content.proxy.widget
+    labels = content.widgets()
+    assert [l.text for l in labels] == ['Item 0', 'Item 1', 'Item 2']
+    assert all(l.proxy_is_active for l in labels)
+
+    # Without a timeout the content is kept.
+    win.notebook.selected_tab = 'eager'
+    enaml_qtbot.wait(50)
+    win.notebook.selected_tab = 'lazy'
+    assert win.built == ['Lazy']
+
+
+def test_lazy_content_release(enaml_qtbot):
+    """Test that the content is destroyed after the release timeout.
+
+    """
+    win = compile_source(SOURCE, 'Main')(timeout=10)
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+
+    page = win.lazy_page
+    win.notebook.selected_tab = 'lazy'
+    content = page.page_widget()
+    assert content.proxy_is_active
+
+    # A selection before the timeout cancels the release.
+    win.notebook.selected_tab = 'eager'
+    win.notebook.selected_tab = 'lazy'
+    enaml_qtbot.wait(50)
+    assert page.page_widget() is content
+
+    win.notebook.selected_tab = 'eager'
+    enaml_qtbot.wait_until(lambda: content.is_destroyed)
+    assert not page.content_is_built()
+    assert page.page_widget() is None
+    assert page.proxy.widget.pageWidget() is None
+
+    win.notebook.selected_tab = 'lazy'
+    assert page.page_widget().proxy_is_active
+    assert win.built == ['Lazy', 'Lazy']
@@ -0,0 +1,69 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2018, Nucleic Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#------------------------------------------------------------------------------
+import pytest
+from utils import compile_source, wait_for_window_displayed, is_qt_available
+
+pytestmark = pytest.mark.skipif(not is_qt_available(),
+                                reason='Requires a Qt binding')
+
+
+VIRTUAL_LIST = \
+"""from enaml.core.api import VirtualLooper
+from enaml.layout.api import vbox
+from enaml.widgets.api import Window, Container, ScrollArea, Label
+
+
+enamldef Main(Window):
+
+    attr rows = list(range(1000))
+    alias area
+    alias looper
+
+    initial_size = (200, 200)
+    Container:
+        ScrollArea: area:
+            Container:
+                padding << (looper.first_index * 20, 0,
+                            (looper.row_count - looper.first_index -
+                             len(looper.items)) * 20, 0)
+                layout_constraints => ():
+                    return [vbox(*self.visible_widgets(), spacing=0)]
+                VirtualLooper: looper:
+                    iterable << rows
+                    offset << area.scroll_position.y // 20
+                    window << area.viewport_size.height // 20 + 2
+                    Label:
+                        text << str(loop_item)
+                        constraints = [height == 20]
+"""
+
+
+def test_virtual_looper_in_scroll_area(enaml_qtbot):
+    """Test that a VirtualLooper follows the scroll position of its area.
+
+    """
+    win = compile_source(VIRTUAL_LIST, 'Main')()
+    win.show()
+    wait_for_window_displayed(enaml_qtbot, win)
+
+    looper = win.looper
+    area = win.area
+    enaml_qtbot.wait_until(lambda: area.viewport_size.height > 0)
+    assert len(looper.items) == area.viewport_size.height // 20 + 2
+    assert len(looper.items) < 50
+
+    scroll_bar = area.proxy.widget.verticalScrollBar()
+    enaml_qtbot.wait_until(lambda: scroll_bar.maximum() > 10000)
+    scroll_bar.setValue(5000)
+    assert area.scroll_position.y == 5000
+    assert looper.first_index == 250
+    assert looper.items[0][0].text == '250'
+
+    area.scroll_position = (0, 100)
+    assert scroll_bar.value() == 100
+    assert looper.items[0][0].text == '5'